@@ -0,0 +1,28 @@
+"""Handles access to the datasets stored by previous requests."""
+
+from src.services.dataset_store.dataset_store import (
+    StoredDataset,
+    dataset_store)
+from src.logging.logger import get_logger
+from src.utils import api_exceptions as ae
+
+logger = get_logger(__name__)
+
+
+def get_stored_dataset(dataset_id: str) -> StoredDataset:
+    """
+    Returns the stored dataset with the given ID, raising a
+    NotFoundException if it does not exist or has expired.
+    """
+
+    stored_dataset = dataset_store.get(dataset_id)
+
+    if stored_dataset is None:
+        logger.warning("Dataset not found: %s", dataset_id)
+
+        raise ae.NotFoundException(
+            details=f"Invalid or expired dataset ID: {dataset_id}",
+            code="UPLOAD_NOT_FOUND"
+        )
+
+    return stored_dataset
@@ -1,7 +1,11 @@
 """Handles the preprocessing of data uploaded by the user."""
 
-from fastapi import UploadFile, File
+from dataclasses import asdict
 
+import pandas as pd
+from fastapi import UploadFile
+
+from src.api.v1.controllers.dataset_controller import get_stored_dataset
 from src.api.v1.controllers.upload_controller import process_upload_request
 from src.services.data_preprocessor.data_check import DataSanityCheck
 from src.services.data_preprocessor.data_treatment import (
@@ -11,24 +15,66 @@ from src.services.data_preprocessor.data_treatment import (
     GarbageValueTreatment)
 from src.services.data_preprocessor.preprocessing_handler import (
     PreprocessingHandler)
+from src.services.data_sensitivity.check_sensitivity import (
+    find_sensitive_columns)
+from src.services.dataset_store.dataset_store import dataset_store
+from src.services.preview import build_preview
+from src.config.settings import PII_SCAN_ENABLED, PREVIEW_ROWS
 from src.logging.logger import get_logger
 from src.utils import api_exceptions as ae
+from src.utils.custom_responses import RawJSON
+from src.utils.worker_pool import compute_pool
 
 logger = get_logger(__name__)
 
 
+def run_preprocessing(
+        preprocessor: PreprocessingHandler,
+        data: pd.DataFrame
+) -> tuple[pd.DataFrame, RawJSON, dict]:
+    """
+    Scans the data for personal information, preprocesses it and builds the
+    preview of the result. Runs in the compute worker pool.
+    """
+
+    sensitive_columns = find_sensitive_columns(data) \
+        if PII_SCAN_ENABLED else {}
+
+    # The preprocessor never modifies its input, so the stored dataset can
+    # be passed without copying it
+    processed_data = preprocessor.preprocess_data(data)
+
+    preview = build_preview(processed_data, limit=PREVIEW_ROWS)["rows"]
+
+    return processed_data, preview, sensitive_columns
+
+
 async def preprocess_data_request(
-        file: UploadFile = File(...)
+        file: UploadFile | None = None,
+        dataset_id: str | None = None
 ) -> object:
     """
     Handles the preprocessing of data based on the request.
-    """
 
-    # Get the uploaded file
-    data_upload_response = await process_upload_request(file)
+    The data is either a dataset stored by a previous upload, referenced by
+    its ID, or a newly uploaded file.
+    """
 
-    uploaded_data = data_upload_response["data"]
-    filename = file.filename
+    if dataset_id:
+        # Reuse the already parsed upload
+        stored_dataset = get_stored_dataset(dataset_id)
+        uploaded_data = stored_dataset.data
+        filename = stored_dataset.filename
+    elif file is not None:
+        # Get the uploaded file
+        data_upload_response = await process_upload_request(file)
+        uploaded_data = data_upload_response["data"]
+        filename = file.filename
+        dataset_id = data_upload_response.get("dataset_id")
+    else:
+        raise ae.BadRequestException(
+            details="Either a dataset ID or a file must be provided"
+        )
 
     # Check if the file actually contains data or is empty
     if uploaded_data is None or uploaded_data.empty:
@@ -41,14 +87,6 @@ async def preprocess_data_request(
             details=f"No data found in the uploaded file: {filename}"
         )
 
-    # Check the sensitivity of the data
-    # if check_sensitivity(uploaded_data):
-    #    logger.error("Data contains sensitive information!")
-    #    handle_sensitivity_checker()
-    # logger.info(
-    #   "Sensitivity check completed, proceeding with preprocessing."
-    # )
-
     # Set up the data preprocessor
     preprocessor = PreprocessingHandler(
         checks=[DataSanityCheck()],
@@ -63,7 +101,19 @@ async def preprocess_data_request(
     )
 
     try:
-        processed_data = preprocessor.preprocess_data(uploaded_data)
+        processed_data, preview, sensitive_columns = await compute_pool.run(
+            run_preprocessing,
+            preprocessor,
+            uploaded_data
+        )
+
+        if sensitive_columns:
+            logger.warning(
+                "The file: %s contains sensitive information in the "
+                "columns: %s",
+                filename,
+                ", ".join(map(str, sensitive_columns))
+            )
 
         logger.info(
             "Data preprocessing for the file: %s was completed "
@@ -71,10 +121,25 @@ async def preprocess_data_request(
             filename
         )
 
+        processed_dataset = dataset_store.put(
+            processed_data,
+            filename,
+            parent_id=dataset_id
+        )
+
         return {
-            "preview": processed_data.head(10).to_json(),
+            "dataset_id": processed_dataset.dataset_id,
+            "source_dataset_id": dataset_id,
+            "filename": filename,
+            "preview": preview,
+            "sensitive_columns": {
+                str(name): asdict(finding)
+                for name, finding in sensitive_columns.items()
+            },
             "data": processed_data
         }
+    except ae.ServiceUnavailableException:
+        raise
     except Exception as e:
         logger.critical(
             "Unexpected error during file upload: %s",
@@ -0,0 +1,42 @@
+"""Handles the previews of datasets uploaded by the user."""
+
+from src.api.v1.controllers.dataset_controller import get_stored_dataset
+from src.services.preview import build_preview
+from src.logging.logger import get_logger
+from src.utils import api_exceptions as ae
+
+logger = get_logger(__name__)
+
+
+def preview_dataset_request(
+        dataset_id: str,
+        offset: int,
+        limit: int,
+        columns: list[str] | None,
+        orient: str
+) -> object:
+    """
+    Handles the preview of a page of a stored dataset based on the request.
+    Only the requested rows and columns are encoded.
+    """
+
+    stored_dataset = get_stored_dataset(dataset_id)
+
+    try:
+        preview = build_preview(
+            stored_dataset.data,
+            offset=offset,
+            limit=limit,
+            columns=columns,
+            orient=orient
+        )
+    except ValueError as e:
+        logger.warning("Invalid preview request: %s", str(e))
+
+        raise ae.BadRequestException(details=str(e))
+
+    return {
+        "dataset_id": dataset_id,
+        "filename": stored_dataset.filename,
+        **preview
+    }
@@ -0,0 +1,70 @@
+"""Handles the profiling of datasets uploaded by the user."""
+
+import pandas as pd
+
+from src.api.v1.controllers.dataset_controller import get_stored_dataset
+from src.services.dataset_store.dataset_store import StoredDataset
+from src.services.extractor.profiler.data_profile import DataProfile
+from src.services.extractor.profiler.data_profiler import DataProfiler
+from src.logging.logger import get_logger
+from src.utils import api_exceptions as ae
+from src.utils.worker_pool import compute_pool
+
+logger = get_logger(__name__)
+
+
+def run_profiling(data: pd.DataFrame) -> DataProfile:
+    """
+    Profiles the data. Runs in the compute worker pool.
+    """
+
+    return DataProfiler(data).generate_profile()
+
+
+async def get_dataset_profile(stored_dataset: StoredDataset) -> DataProfile:
+    """
+    Returns the profile of a stored dataset, profiling it on first use and
+    keeping the profile with the dataset for later requests.
+    """
+
+    if stored_dataset.profile is None:
+        stored_dataset.profile = await compute_pool.run(
+            run_profiling,
+            stored_dataset.data
+        )
+
+    return stored_dataset.profile
+
+
+async def profile_data_request(dataset_id: str) -> object:
+    """
+    Handles the profiling of a stored dataset based on the request.
+    """
+
+    stored_dataset = get_stored_dataset(dataset_id)
+
+    try:
+        profile = await get_dataset_profile(stored_dataset)
+
+        logger.info(
+            "Data profiling for the file: %s was completed successfully.",
+            stored_dataset.filename
+        )
+
+        return {
+            "dataset_id": dataset_id,
+            "filename": stored_dataset.filename,
+            "profile": profile.to_dict()
+        }
+    except ae.ServiceUnavailableException:
+        raise
+    except Exception as e:
+        logger.critical(
+            "Unexpected error during data profiling: %s",
+            str(e),
+            exc_info=True
+        )
+
+        raise ae.ProfilingDataException(
+            details=str(e)
+        )
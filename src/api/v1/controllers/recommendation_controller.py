@@ -0,0 +1,80 @@
+"""Handles the graph recommendations for datasets uploaded by the user."""
+
+import pandas as pd
+
+from src.api.v1.controllers.dataset_controller import get_stored_dataset
+from src.api.v1.controllers.profile_controller import get_dataset_profile
+from src.services.chart_data import prepare_chart_data
+from src.services.recommender import recommend_graphs
+from src.logging.logger import get_logger
+from src.utils import api_exceptions as ae
+from src.utils.worker_pool import compute_pool
+
+logger = get_logger(__name__)
+
+
+def attach_chart_data(
+        data: pd.DataFrame,
+        recommendations: list[dict]
+) -> list[dict]:
+    """
+    Adds the prepared chart data to every recommendation. Runs in the
+    compute worker pool.
+    """
+
+    return [
+        {**recommendation, "data": prepare_chart_data(data, recommendation)}
+        for recommendation in recommendations
+    ]
+
+
+async def recommend_graphs_request(
+        dataset_id: str,
+        limit: int,
+        include_data: bool = False
+) -> object:
+    """
+    Handles the graph recommendations for a stored dataset based on the
+    request. The recommendations are derived from the profile of the
+    dataset, which is computed once and kept with it. With `include_data`,
+    each recommendation also carries the chart data, reduced to the point
+    budget on the server.
+    """
+
+    stored_dataset = get_stored_dataset(dataset_id)
+
+    try:
+        profile = await get_dataset_profile(stored_dataset)
+
+        recommendations = recommend_graphs(profile, limit=limit)
+
+        if include_data:
+            recommendations = await compute_pool.run(
+                attach_chart_data,
+                stored_dataset.data,
+                recommendations
+            )
+
+        logger.info(
+            "Graph recommendations for the file: %s were completed "
+            "successfully.",
+            stored_dataset.filename
+        )
+
+        return {
+            "dataset_id": dataset_id,
+            "filename": stored_dataset.filename,
+            "recommendations": recommendations
+        }
+    except ae.ServiceUnavailableException:
+        raise
+    except Exception as e:
+        logger.critical(
+            "Unexpected error during graph recommendation: %s",
+            str(e),
+            exc_info=True
+        )
+
+        raise ae.RecommendationException(
+            details=str(e)
+        )
@@ -1,13 +1,18 @@
 """upload_controller.py"""
 
-import os
-import shutil
 from werkzeug.utils import secure_filename
 from fastapi import UploadFile, File
 
-from src.services.data_uploader.upload_handler import handle_upload
-from src.configs.settings import UPLOAD_DIRECTORY, ALLOWED_EXTENSIONS
+from src.services.data_uploader.upload_handler import handle_upload_stream
+from src.services.dataset_store.dataset_store import dataset_store
+from src.services.preview import build_preview
+from src.config.settings import (
+    ALLOWED_EXTENSIONS,
+    EXCEL_EXTENSIONS,
+    PREVIEW_ROWS
+)
 from src.utils import api_exceptions as ae
+from src.utils.worker_pool import upload_pool
 from src.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,10 +26,31 @@ def allowed_file(filename):
             in ALLOWED_EXTENSIONS)
 
 
+def load_upload(filename: str, stream, **loader_options) -> tuple:
+    """
+    Loads the uploaded file into a DataFrame and builds its preview. Runs in
+    the upload worker pool.
+    """
+
+    data, message = handle_upload_stream(filename, stream, **loader_options)
+
+    preview = None if data is None \
+        else build_preview(data, limit=PREVIEW_ROWS)["rows"]
+
+    return data, message, preview
+
+
 async def process_upload_request(
-        file: UploadFile = File(...)
+        file: UploadFile = File(...),
+        sheet_name: str | None = None,
+        deduplicate: bool = False
 ) -> object:
-    """Processes the file upload request using FastAPI."""
+    """
+    Processes the file upload request using FastAPI. For Excel files,
+    `sheet_name` selects the sheet to load (by name or position) instead of
+    the first one. For CSV files, `deduplicate` drops the duplicate rows
+    while the file is parsed.
+    """
 
     # Check if a file was provided
     if not file or file.filename == "":
@@ -40,42 +66,62 @@ async def process_upload_request(
             details=f"Invalid file format: {file.filename}"
         )
 
-    try:
-        # Secure the filename and create the full path
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(UPLOAD_DIRECTORY, filename)
+    loader_options = {}
+    is_excel = file.filename.rsplit('.', 1)[1].lower() in EXCEL_EXTENSIONS
+
+    if sheet_name is not None:
+        if not is_excel:
+            raise ae.BadRequestException(
+                details="A sheet can only be selected for Excel files"
+            )
+
+        loader_options["sheet_name"] = sheet_name
 
-        # Ensure upload directory exists
-        os.makedirs(UPLOAD_DIRECTORY, exist_ok=True)
+    if deduplicate:
+        if is_excel:
+            raise ae.BadRequestException(
+                details="Rows can only be deduplicated while loading CSV "
+                        "files"
+            )
 
-        # Save the uploaded file
-        with open(filepath, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        loader_options["deduplicate"] = True
 
-        # Process the file into a DataFrame
-        data, message = handle_upload(filepath)
+    try:
+        filename = secure_filename(file.filename)
+
+        # Parse the request body in bounded chunks as it is read, off the
+        # event loop
+        data, message, preview = await upload_pool.run(
+            load_upload,
+            filename,
+            file.file,
+            **loader_options
+        )
 
         # Check if the data exists
         if data is None:
             logger.error(message)
-            os.remove(filepath)
             raise ae.BadRequestException(details=message)
 
-        # Delete the file after processing
-        os.remove(filepath)
+        # Keep the parsed data so later requests can refer to it by ID
+        stored_dataset = dataset_store.put(data, filename)
 
         logger.info(
-            "File '%s' has been uploaded successfully!",
-            filename
+            "File '%s' has been uploaded successfully as dataset '%s'!",
+            filename,
+            stored_dataset.dataset_id
         )
 
         # Return basic metadata
         return {
             "message": f"The file '{filename}' has been uploaded "
                        f"successfully!",
-            "preview": data.head(10).to_json(),
+            "dataset_id": stored_dataset.dataset_id,
+            "preview": preview,
             "data": data
         }
+    except ae.ServiceUnavailableException:
+        raise
     except Exception as e:
         logger.critical(
             "Unexpected error during file upload: %s",
@@ -3,11 +3,11 @@ This file defines the routes for the preprocess functionality in the
 application.
 """
 
-from fastapi import APIRouter, UploadFile, File, status
+from fastapi import APIRouter, UploadFile, File, Form, status
 
 from src.api.v1.controllers.preprocess_controller import (
     preprocess_data_request)
-from src.utils.custom_responses import SuccessResponse, ensure_serializable
+from src.utils.custom_responses import SuccessResponse
 
 router = APIRouter(
     prefix="/preprocess",
@@ -17,19 +17,32 @@ router = APIRouter(
 
 @router.post("/")
 async def preprocess_data(
-        file: UploadFile = File(...)
+        dataset_id: str | None = Form(None),
+        file: UploadFile | None = File(None)
 ) -> SuccessResponse:
-    """Endpoint to preprocess data."""
-
-    preprocess_data_response = await preprocess_data_request(file)
+    """
+    Endpoint to preprocess data. The data is referenced by the dataset ID
+    returned from the upload endpoint, or uploaded as a new file.
+    """
+
+    preprocess_data_response = await preprocess_data_request(
+        file=file,
+        dataset_id=dataset_id
+    )
 
     preview = preprocess_data_response["preview"]
 
-    preview = ensure_serializable(preview)
-
     return SuccessResponse(
-        message=f"Data preprocessing for the file {file.filename} was"
+        message=f"Data preprocessing for the file "
+                f"{preprocess_data_response['filename']} was "
                 f"successfully completed!",
         status_code=status.HTTP_200_OK,
-        data=preview
+        data={
+            "dataset_id": preprocess_data_response["dataset_id"],
+            "source_dataset_id": preprocess_data_response[
+                "source_dataset_id"],
+            "preview": preview,
+            "sensitive_columns": preprocess_data_response[
+                "sensitive_columns"]
+        }
     )
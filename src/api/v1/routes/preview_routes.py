@@ -0,0 +1,57 @@
+"""
+This file defines the routes for the dataset preview functionality in the
+application.
+"""
+
+from fastapi import APIRouter, Form, status
+
+from src.api.v1.controllers.preview_controller import (
+    preview_dataset_request)
+from src.config.settings import (
+    PREVIEW_DEFAULT_ORIENT,
+    PREVIEW_MAX_ROWS,
+    PREVIEW_ROWS
+)
+from src.utils.custom_responses import SuccessResponse
+
+router = APIRouter(
+    prefix="/preview",
+    tags=["preview"]
+)
+
+
+@router.post("/")
+async def preview_dataset(
+        dataset_id: str = Form(...),
+        offset: int = Form(0, ge=0),
+        limit: int = Form(PREVIEW_ROWS, ge=1, le=PREVIEW_MAX_ROWS),
+        columns: list[str] | None = Form(None),
+        orient: str = Form(PREVIEW_DEFAULT_ORIENT)
+) -> SuccessResponse:
+    """
+    Endpoint to preview a page of a dataset, referenced by the dataset ID
+    returned from the upload or preprocess endpoints. `offset` and `limit`
+    select the rows, `columns` (repeated) the columns, and `orient` the
+    layout of the rows.
+    """
+
+    response = preview_dataset_request(
+        dataset_id,
+        offset,
+        limit,
+        columns,
+        orient
+    )
+
+    return SuccessResponse(
+        message=f"Preview of the file {response['filename']} was "
+                f"successfully built!",
+        status_code=status.HTTP_200_OK,
+        data={
+            "dataset_id": dataset_id,
+            "offset": response["offset"],
+            "total_rows": response["total_rows"],
+            "columns": response["columns"],
+            "rows": response["rows"]
+        }
+    )
@@ -0,0 +1,37 @@
+"""
+This file defines the routes for the profile functionality in the
+application.
+"""
+
+from fastapi import APIRouter, Form, status
+
+from src.api.v1.controllers.profile_controller import profile_data_request
+from src.utils.custom_responses import SuccessResponse
+
+router = APIRouter(
+    prefix="/profile",
+    tags=["profile"]
+)
+
+
+@router.post("/")
+async def profile_data(
+        dataset_id: str = Form(...)
+) -> SuccessResponse:
+    """
+    Endpoint to profile a dataset, referenced by the dataset ID returned
+    from the upload or preprocess endpoints.
+    """
+
+    profile_data_response = await profile_data_request(dataset_id)
+
+    return SuccessResponse(
+        message=f"Data profiling for the file "
+                f"{profile_data_response['filename']} was successfully "
+                f"completed!",
+        status_code=status.HTTP_200_OK,
+        data={
+            "dataset_id": dataset_id,
+            "profile": profile_data_response["profile"]
+        }
+    )
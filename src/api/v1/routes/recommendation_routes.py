@@ -0,0 +1,45 @@
+"""
+This file defines the routes for the graph recommendation functionality in
+the application.
+"""
+
+from fastapi import APIRouter, Form, status
+
+from src.api.v1.controllers.recommendation_controller import (
+    recommend_graphs_request)
+from src.config.settings import RECOMMENDER_LIMIT
+from src.utils.custom_responses import SuccessResponse
+
+router = APIRouter(
+    prefix="/recommendations",
+    tags=["recommendations"]
+)
+
+
+@router.post("/")
+async def recommend_graphs(
+        dataset_id: str = Form(...),
+        limit: int = Form(RECOMMENDER_LIMIT, ge=1),
+        include_data: bool = Form(False)
+) -> SuccessResponse:
+    """
+    Endpoint to recommend graphs for a dataset, referenced by the dataset
+    ID returned from the upload or preprocess endpoints. With
+    `include_data`, every recommendation comes with its chart data.
+    """
+
+    response = await recommend_graphs_request(
+        dataset_id,
+        limit,
+        include_data
+    )
+
+    return SuccessResponse(
+        message=f"Graph recommendations for the file "
+                f"{response['filename']} were successfully completed!",
+        status_code=status.HTTP_200_OK,
+        data={
+            "dataset_id": dataset_id,
+            "recommendations": response["recommendations"]
+        }
+    )
@@ -4,10 +4,10 @@ This file defines the routes for the upload functionality in the application.
 
 from fastapi import status
 
-from fastapi import APIRouter, UploadFile, File
+from fastapi import APIRouter, UploadFile, File, Form
 from src.api.v1.controllers.preprocess_controller import (
     process_upload_request)
-from src.utils.custom_responses import SuccessResponse, ensure_serializable
+from src.utils.custom_responses import SuccessResponse
 
 router = APIRouter(
     prefix="/upload",
@@ -16,17 +16,30 @@ router = APIRouter(
 
 
 @router.post("/")
-async def upload_file(file: UploadFile = File(...)):
-    """Endpoint to handle file uploads."""
-
-    upload_data_response = await process_upload_request(file)
+async def upload_file(
+        file: UploadFile = File(...),
+        sheet_name: str | None = Form(None),
+        deduplicate: bool = Form(False)
+):
+    """
+    Endpoint to handle file uploads. For Excel files, an optional
+    `sheet_name` (name or position) selects the sheet to load. For CSV
+    files, `deduplicate` drops the duplicate rows while the file is parsed.
+    """
+
+    upload_data_response = await process_upload_request(
+        file,
+        sheet_name,
+        deduplicate
+    )
 
     preview = upload_data_response["preview"]
 
-    preview = ensure_serializable(preview)
-
     return SuccessResponse(
         message="The file has been uploaded successfully!",
         status_code=status.HTTP_200_OK,
-        data=preview
+        data={
+            "dataset_id": upload_data_response["dataset_id"],
+            "preview": preview
+        }
     )
@@ -3,23 +3,58 @@ This module initializes the FastAPI application and includes the routes for
 the application.
 """
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from src.api.v1.routes.upload_routes import router as upload_router
 from src.api.v1.routes.preprocess_routes import router as preprocess_router
+from src.api.v1.routes.profile_routes import router as profile_router
+from src.api.v1.routes.recommendation_routes import (
+    router as recommendation_router)
+from src.api.v1.routes.preview_routes import router as preview_router
 from src.middleware.exception_handler import api_exception_handler
+from src.services.dataset_store.dataset_cache import (
+    dataset_cache,
+    sweep_periodically)
 from src.utils.api_exceptions import ApiException
+from src.utils.worker_pool import shutdown_worker_pools
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    Sweep the expired cached uploads while the application runs, and
+    release the application resources on shutdown.
+    """
+
+    sweeper = asyncio.create_task(sweep_periodically(dataset_cache)) \
+        if dataset_cache is not None else None
+
+    yield
+
+    if sweeper is not None:
+        sweeper.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await sweeper
+
+    shutdown_worker_pools()
 
 
 def create_app():
     """Create and configure the FastAPI application."""
 
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     # Register routes
     app.include_router(upload_router, prefix="/api/v1")
     app.include_router(preprocess_router, prefix="/api/v1")
+    app.include_router(profile_router, prefix="/api/v1")
+    app.include_router(recommendation_router, prefix="/api/v1")
+    app.include_router(preview_router, prefix="/api/v1")
 
     # Global error handling
     app.add_exception_handler(ApiException, api_exception_handler)
 
-    return app
\ No newline at end of file
+    return app
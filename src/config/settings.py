@@ -1,5 +1,7 @@
 """Global configuration settings for the application."""
 
+import os
+
 LOG_DIRECTORY = "../../logs"
 
 
@@ -8,3 +10,311 @@ LOG_DIRECTORY = "../../logs"
 UPLOAD_DIRECTORY = "src/temp_uploads"
 
 ALLOWED_EXTENSIONS = {'csv', 'xls', 'xlsx'}
+
+EXCEL_EXTENSIONS = {'xls', 'xlsx'}
+
+# Number of bytes read from the request body per step of the streaming
+# ingestion path. Parsed batches are bounded by this size.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Bytes fed to a loader that cannot parse partial input (e.g. the Excel
+# loader) held in memory before they are spooled to a temporary file. CSV
+# uploads are parsed as they arrive and never spooled by the loader.
+UPLOAD_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+# ------------------ Dataset Store Configurations ------------------
+
+# Uploaded data is deleted after 24 hours (see the data retention policy).
+DATASET_STORE_TTL_SECONDS = 24 * 60 * 60
+
+# Maximum number of parsed datasets kept in memory at once.
+DATASET_STORE_MAX_ENTRIES = 32
+
+
+# ------------------ Dataset Cache Configurations ------------------
+
+# Parsed uploads are cached on disk, keyed by the hash of the uploaded
+# bytes, so re-uploading the same file skips parsing.
+DATASET_CACHE_ENABLED = True
+
+DATASET_CACHE_DIRECTORY = "src/dataset_cache"
+
+# Total size of the cached files before the least recently used ones are
+# evicted.
+DATASET_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+# Cached uploads are uploaded data too, so they follow the same retention.
+DATASET_CACHE_TTL_SECONDS = DATASET_STORE_TTL_SECONDS
+
+# Expired entries are removed on startup and then at this interval, so they
+# do not outlive the retention while no new uploads arrive.
+DATASET_CACHE_SWEEP_INTERVAL_SECONDS = 60 * 60
+
+
+# ------------------ Worker Pool Configurations ------------------
+
+# Executor running the preprocessing and profiling work off the event loop,
+# either "thread" or "process". Uploads are always parsed in a thread pool
+# since they read from the request stream.
+WORKER_POOL_KIND = "thread"
+
+WORKER_POOL_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Number of jobs allowed to wait for a free worker before new requests are
+# rejected with a 503 response.
+WORKER_POOL_MAX_QUEUE_SIZE = 16
+
+# Seconds a rejected client is asked to wait before retrying.
+WORKER_POOL_RETRY_AFTER_SECONDS = 5
+
+
+# ------------------ Load-time Dtype Optimization ------------------
+
+# Infer compact dtypes (categoricals, downcast numerics, Arrow strings and
+# parsed dates) for newly loaded data.
+OPTIMIZE_DTYPES_ON_LOAD = True
+
+# Number of rows sampled to infer the dtypes.
+DTYPE_SAMPLE_ROWS = 10_000
+
+# String columns whose share of distinct values in the sample is at most
+# this ratio are stored as categoricals.
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+# ------------------ CSV Parser Engines ------------------
+
+# Parser used for CSV files: "c" (pandas), "pyarrow" (multithreaded
+# pyarrow.csv reader), "pyarrow-stream" (pyarrow.csv block streaming reader)
+# or "auto" to pick one by input size.
+CSV_ENGINE = "auto"
+
+# Inputs of at least this size are parsed with the multithreaded pyarrow
+# engine when the engine is picked automatically.
+CSV_ARROW_MIN_BYTES = 4 * 1024 * 1024
+
+# Inputs of at least this size are parsed with the pyarrow streaming
+# reader when the engine is picked automatically. Only whole files loaded
+# at once reach it: uploads are parsed in batches of CSV_BATCH_SIZE.
+CSV_STREAMING_MIN_BYTES = 256 * 1024 * 1024
+
+# Bytes of an uploaded CSV parsed at a time, large enough for the
+# multithreaded engines to pay off.
+CSV_BATCH_SIZE = 16 * 1024 * 1024
+
+
+# ------------------ Excel Ingestion ------------------
+
+# Engine used for Excel files: "openpyxl" (read-only row streaming),
+# "calamine" (requires python-calamine) or "auto" to prefer calamine when
+# it is installed. Legacy .xls files always use the pandas default.
+EXCEL_ENGINE = "auto"
+
+# Rows and columns of a sheet loaded at most, the rest is ignored.
+EXCEL_MAX_ROWS = 1_000_000
+EXCEL_MAX_COLUMNS = 1_000
+
+
+# ------------------ Profiler Configurations ------------------
+
+# "exact" profiles every row, "approximate" estimates the statistics from a
+# sample and sketches, "auto" approximates datasets with more rows than
+# PROFILER_APPROXIMATE_MIN_ROWS.
+PROFILER_MODE = "auto"
+
+PROFILER_APPROXIMATE_MIN_ROWS = 1_000_000
+
+# Rows sampled for the moments, quantiles and correlations in approximate
+# mode.
+PROFILER_SAMPLE_SIZE = 100_000
+
+# Confidence of the error bounds reported for approximate statistics.
+PROFILER_CONFIDENCE = 0.95
+
+# Distinct counts are estimated with 2 ** HLL_PRECISION registers per column
+# (about 0.8% relative error at 14).
+HLL_PRECISION = 14
+
+# Profile the columns of wide datasets in batches on a process pool. The
+# data is shared with the workers through a memory-mapped Arrow file.
+PROFILER_PARALLEL = False
+
+PROFILER_WORKERS = os.cpu_count() or 1
+
+# Datasets with fewer columns are always profiled in a single process, as
+# sharing the data costs more than it saves.
+PROFILER_PARALLEL_MIN_COLUMNS = 200
+
+# The numeric columns are profiled in blocks of about this many bytes of
+# values, so the sorted and centered working copies stay bounded on wide
+# datasets.
+PROFILER_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+# ------------------ Correlation Discovery ------------------
+
+# "pearson" or "spearman".
+CORRELATION_METHOD = "pearson"
+
+# Column pairs with a larger absolute correlation are reported.
+CORRELATION_THRESHOLD = 0.5
+
+# If set, only the pairs among the strongest TOP_K correlations of one of
+# their columns are reported, which bounds the output of wide tables.
+CORRELATION_TOP_K = None
+
+# Columns per block of the correlation matrix computed at a time.
+CORRELATION_BLOCK_SIZE = 512
+
+# Compute the correlations in single precision, halving memory and time.
+CORRELATION_FLOAT32 = False
+
+# If set, the correlations of datasets with more rows are computed from a
+# uniform sample of this many rows.
+CORRELATION_SAMPLE_SIZE = None
+
+
+# ------------------ Data Type Classification ------------------
+
+# Values per column the type classifier inspects, spread evenly over the
+# rows.
+CLASSIFIER_SAMPLE_SIZE = 1_000
+
+# Share of the sampled values that must match a pattern (e.g. an email
+# address) for the column to be classified by it.
+CLASSIFIER_MATCH_RATIO = 0.9
+
+# String columns with at most this many distinct values, or this share of
+# distinct values, are categorical.
+CATEGORICAL_MAX_CARDINALITY = 50
+CATEGORICAL_MAX_UNIQUE_RATIO = 0.05
+
+# String columns whose values are at least this long (median) are text.
+TEXT_MIN_LENGTH = 30
+
+# Share of distinct values from which a column may be an identifier.
+ID_MIN_UNIQUE_RATIO = 0.95
+
+
+# ------------------ Graph Recommendations ------------------
+
+# Recommendations returned at most, best first.
+RECOMMENDER_LIMIT = 10
+
+# The best suited columns of each type combined into graph candidates,
+# which bounds the work on wide datasets.
+RECOMMENDER_MAX_COLUMNS_PER_TYPE = 10
+
+
+# ------------------ Chart Data ------------------
+
+# Points (or bins, cells, categories) of a chart's data at most: larger
+# datasets are downsampled, binned or aggregated on the server.
+CHART_MAX_POINTS = 2_000
+
+# The downsampling of line and area charts: "lttb" (keeps the visual shape)
+# or "minmax" (keeps the minimum and maximum of each bucket, faster).
+CHART_DOWNSAMPLING = "lttb"
+
+# Bins of a histogram at most, fewer when the data needs fewer.
+CHART_HISTOGRAM_MAX_BINS = 50
+
+# Categories of bar charts, pie charts and box plots at most, the smaller
+# ones are folded into "Other".
+CHART_MAX_CATEGORIES = 20
+
+
+# ------------------ Dataset Preview ------------------
+
+# Rows shown in the preview returned by the upload and preprocess endpoints.
+PREVIEW_ROWS = 10
+
+# Rows of a preview page at most.
+PREVIEW_MAX_ROWS = 1_000
+
+# The layouts a preview can be returned in (see pandas.DataFrame.to_json).
+PREVIEW_ORIENTS = ("records", "split", "columns", "index", "values")
+
+# The layout of a preview when none is requested.
+PREVIEW_DEFAULT_ORIENT = "columns"
+
+
+# ------------------ Garbage Values ------------------
+
+# Strings standing for a missing value, replaced by NaN in text columns.
+GARBAGE_TOKENS = ("", "N/A", "NULL", "-", "--")
+
+# Whether values are compared to the tokens without surrounding whitespace
+# and ignoring case, e.g. " n/a " matches "N/A".
+GARBAGE_STRIP = True
+GARBAGE_CASE_INSENSITIVE = True
+
+# Rows compared at once when looking for a value differing from the first
+# one of a column, so non-constant columns are recognized early.
+CONSTANT_CHECK_BLOCK_SIZE = 4096
+
+
+# ------------------ Categorical Encoding ------------------
+
+# Columns with at most this many categories are one-hot encoded by the
+# cardinality policy, larger ones get a compact encoding.
+ENCODER_ONE_HOT_MAX_CARDINALITY = 20
+
+# The compact encoding of high-cardinality columns without a target:
+# "hashing" or "frequency".
+ENCODER_HIGH_CARDINALITY = "hashing"
+
+# Columns (buckets) each hashed categorical column is spread over.
+ENCODER_HASHING_FEATURES = 64
+
+# Weight of the overall target mean in the target encoding of a category,
+# in rows: rare categories are pulled towards the overall mean.
+ENCODER_TARGET_SMOOTHING = 10.0
+
+
+# ------------------ PII Detection ------------------
+
+# Whether uploaded data is scanned for personal information before it is
+# preprocessed.
+PII_SCAN_ENABLED = True
+
+# Values per column the PII scanner inspects, spread evenly over the rows.
+PII_SAMPLE_SIZE = 500
+
+# Share of the sampled values that must match a PII pattern (e.g. an email
+# address) for the column to be flagged by it.
+PII_MATCH_RATIO = 0.5
+
+# Number of column scans remembered, keyed by the column name, dtype and a
+# hash of the sampled values, so re-uploaded data is not scanned again.
+PII_CACHE_SIZE = 1_024
+
+# Text columns that no name or pattern explains are analyzed with Presidio
+# if their sampled values have at least this share of distinct values, as
+# low-cardinality labels rarely identify a person.
+PII_ANALYZER_ENABLED = True
+PII_ANALYZER_MIN_UNIQUE_RATIO = 0.2
+
+# Sampled values per ambiguous column sent to the analyzer, and the length
+# each is cut to, which bound the cost of the analysis.
+PII_ANALYZER_SAMPLE_SIZE = 50
+PII_ANALYZER_MAX_TEXT_LENGTH = 500
+
+# The spaCy model and language of the analyzer. The model must be installed
+# (e.g. `python -m spacy download en_core_web_lg`), otherwise only the name
+# and pattern checks run.
+PII_ANALYZER_MODEL = "en_core_web_lg"
+PII_ANALYZER_LANGUAGE = "en"
+
+# The entities looked for by the analyzer. LOCATION is left out as city and
+# country columns are common and do not identify anyone on their own.
+PII_ANALYZER_ENTITIES = (
+    "PERSON", "EMAIL_ADDRESS", "PHONE_NUMBER", "CREDIT_CARD", "IBAN_CODE",
+    "US_SSN", "IP_ADDRESS"
+)
+
+# Minimum score of an analyzer result, and the share of the analyzed values
+# with a result of the same entity for the column to be flagged.
+PII_ANALYZER_SCORE_THRESHOLD = 0.5
+PII_ANALYZER_MATCH_RATIO = 0.3
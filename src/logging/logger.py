@@ -6,7 +6,7 @@ import logging
 import os
 from typing import Optional
 
-from src.configs.settings import LOG_DIRECTORY
+from src.config.settings import LOG_DIRECTORY
 
 
 class ColorFormatter(logging.Formatter):
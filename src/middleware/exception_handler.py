@@ -3,7 +3,6 @@ Global exception handler for structured error responses and logging.
 """
 
 from fastapi import Request
-from starlette.responses import JSONResponse
 
 from src.utils.api_exceptions import ApiException
 from src.utils.custom_responses import ErrorDetail, ErrorResponse
@@ -15,15 +14,14 @@ logger = get_logger(__name__)
 async def api_exception_handler(
         request: Request,
         exc: ApiException
-) -> JSONResponse:
+) -> ErrorResponse:
     """
     Handles all exceptions derived from ApiException and
     returns a structured JSON response, and logs the error.
     """
 
     # Extract the structured error detail
-    error_data = exc.detail.get("error", {})
-    error_detail = ErrorDetail(**error_data)
+    error_detail: ErrorDetail = exc.error_detail
 
     logger.error(
         "API Error occurred | Path: %s | "
@@ -34,9 +32,10 @@ async def api_exception_handler(
         error_detail.details
     )
 
-    # Return a JSONResponse with the structured error
+    # Return an ErrorResponse with the structured error
     return ErrorResponse(
         status_code=exc.status_code,
-        message=error_detail.get("details", "An error occurred"),
-        error=error_detail
+        message=exc.message,
+        error=error_detail,
+        headers=exc.headers
     )
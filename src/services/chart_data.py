@@ -0,0 +1,371 @@
+"""
+Chart Data
+
+Prepares the data of a recommended graph for rendering. Every graph gets a
+point budget: large datasets are downsampled (line and area charts),
+binned (histograms), aggregated (bar, pie and box plots) or turned into a
+density grid (scatter and bubble charts), so the size of the response and
+the render time stay bounded regardless of the number of rows.
+"""
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import (
+    CHART_DOWNSAMPLING,
+    CHART_HISTOGRAM_MAX_BINS,
+    CHART_MAX_CATEGORIES,
+    CHART_MAX_POINTS
+)
+from src.services.extractor.profiler.correlation import correlation_blocks
+
+# The label of the categories folded together beyond CHART_MAX_CATEGORIES
+OTHER_CATEGORY = "Other"
+
+
+def prepare_chart_data(
+        data: pd.DataFrame,
+        recommendation: dict,
+        max_points: int = CHART_MAX_POINTS
+) -> dict:
+    """
+    Prepare the data of a recommended graph.
+
+    :param data: The dataset.
+    :param recommendation: A recommendation, as returned by
+    `recommend_graphs`.
+    :param max_points: The maximum number of points (or bins, cells,
+    categories) of the chart.
+    :return: The chart data: its `kind`, the `total_rows` it summarizes,
+    whether it was `reduced` and the prepared values.
+    """
+
+    preparer = CHART_PREPARERS.get(recommendation["graph"], _table)
+
+    return preparer(data, recommendation["columns"], max_points)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, num_points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling: keeps the first and last
+    points and, from each bucket in between, the point forming the largest
+    triangle with the previously kept point and the average of the next
+    bucket, which preserves the visual shape of the line.
+
+    :param x: The sorted x values.
+    :param y: The y values.
+    :param num_points: The number of points to keep.
+    :return: The sorted indices of the kept points.
+    """
+
+    n = len(x)
+
+    if num_points >= n or num_points < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, num_points - 1).astype(np.intp)
+    selected = np.empty(num_points, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+
+    for bucket in range(num_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+
+        if bucket + 2 < len(edges):
+            next_x = x[stop:edges[bucket + 2]].mean()
+            next_y = y[stop:edges[bucket + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+def min_max_downsample(y: np.ndarray, num_points: int) -> np.ndarray:
+    """
+    Keep the minimum and the maximum of each of `num_points / 2` equal
+    buckets of consecutive points, which preserves the peaks.
+
+    :param y: The y values, ordered by x.
+    :param num_points: The number of points to keep at most.
+    :return: The sorted indices of the kept points.
+    """
+
+    n = len(y)
+    buckets = max(num_points // 2, 1)
+
+    if num_points >= n:
+        return np.arange(n)
+
+    bucket = np.arange(n) * buckets // n
+    order = np.lexsort((y, bucket))
+    starts = np.searchsorted(bucket[order], np.arange(buckets))
+    stops = np.append(starts[1:], n)
+
+    return np.unique(np.concatenate([order[starts], order[stops - 1]]))
+
+
+def _line(data: pd.DataFrame, columns: dict, max_points: int) -> dict:
+    y_columns = columns["y"] if isinstance(columns["y"], list) \
+        else [columns["y"]]
+    frame = data[[columns["x"], *y_columns]].dropna(subset=[columns["x"]])
+
+    if not frame[columns["x"]].is_monotonic_increasing:
+        frame = frame.sort_values(columns["x"], kind="stable")
+
+    x = frame[columns["x"]]
+    x_values = _as_float(x)
+    keep = np.arange(len(frame))
+
+    if len(frame) > max_points:
+        # Each series gets an equal share of the budget, and the points
+        # kept for any of them are kept for all
+        budget = max(max_points // len(y_columns), 3)
+        kept = []
+
+        for col in y_columns:
+            y = _as_float(frame[col])
+            present = np.flatnonzero(~np.isnan(y))
+
+            if CHART_DOWNSAMPLING == "minmax":
+                chosen = min_max_downsample(y[present], budget)
+            else:
+                chosen = lttb(x_values[present], y[present], budget)
+
+            kept.append(present[chosen])
+
+        keep = np.unique(np.concatenate(kept))
+
+    return {
+        "kind": "series",
+        "total_rows": len(data),
+        "reduced": len(keep) < len(frame),
+        "x": _to_list(x.iloc[keep]),
+        "y": {col: _to_list(frame[col].iloc[keep]) for col in y_columns}
+    }
+
+
+def _histogram(data: pd.DataFrame, columns: dict, max_points: int) -> dict:
+    values = _as_float(data[columns["x"]])
+    values = values[np.isfinite(values)]
+
+    if not len(values):
+        counts, edges = np.array([]), np.array([])
+    else:
+        max_bins = min(CHART_HISTOGRAM_MAX_BINS, max_points)
+        edges = np.histogram_bin_edges(values, bins="auto")
+
+        if len(edges) - 1 > max_bins:
+            edges = np.histogram_bin_edges(values, bins=max_bins)
+
+        counts, edges = np.histogram(values, bins=edges)
+
+    return {
+        "kind": "bins",
+        "total_rows": len(data),
+        "reduced": True,
+        "edges": edges.tolist(),
+        "counts": counts.tolist()
+    }
+
+
+def _aggregate(aggregation: str, label: str, value: str):
+    """
+    :return: A preparer of the per-category aggregate of a numerical
+    column, keeping the largest categories within the budget.
+    """
+
+    def prepare(data: pd.DataFrame, columns: dict, max_points: int) -> dict:
+        grouped = data.groupby(
+            columns[label],
+            observed=True,
+            sort=False
+        )[columns[value]].agg(aggregation).sort_values(ascending=False)
+
+        limit = min(CHART_MAX_CATEGORIES, max_points)
+
+        if len(grouped) > limit:
+            rest = data[~data[columns[label]].isin(grouped.index[:limit - 1])]
+            grouped = pd.concat([
+                grouped.iloc[:limit - 1],
+                pd.Series(
+                    [rest[columns[value]].agg(aggregation)],
+                    index=[OTHER_CATEGORY]
+                )
+            ])
+
+        return {
+            "kind": "categories",
+            "total_rows": len(data),
+            "reduced": True,
+            "aggregation": aggregation,
+            "categories": _to_list(grouped.index),
+            "values": _to_list(grouped)
+        }
+
+    return prepare
+
+
+def _box(data: pd.DataFrame, columns: dict, max_points: int) -> dict:
+    grouped = data.groupby(
+        columns["x"],
+        observed=True
+    )[columns["y"]]
+
+    summary = grouped.quantile([0, 0.25, 0.5, 0.75, 1]).unstack()
+    summary.columns = ["min", "q1", "median", "q3", "max"]
+    summary["count"] = grouped.count()
+    summary = summary.sort_values("count", ascending=False).head(
+        min(CHART_MAX_CATEGORIES, max_points)
+    )
+
+    # The whiskers end at the furthest values within 1.5 IQR
+    iqr = summary["q3"] - summary["q1"]
+    lower = (summary["q1"] - 1.5 * iqr).reindex(data[columns["x"]]).to_numpy()
+    upper = (summary["q3"] + 1.5 * iqr).reindex(data[columns["x"]]).to_numpy()
+    values = data[columns["y"]].to_numpy(dtype=np.float64, na_value=np.nan)
+    inside = (values >= lower) & (values <= upper)
+
+    within = pd.Series(np.where(inside, values, np.nan))
+    by_category = within.groupby(data[columns["x"]].to_numpy())
+    summary["lower_whisker"] = by_category.min()
+    summary["upper_whisker"] = by_category.max()
+    summary["outliers"] = pd.Series(
+        (~inside & ~np.isnan(values) & ~np.isnan(lower)).astype(int)
+    ).groupby(data[columns["x"]].to_numpy()).sum()
+
+    return {
+        "kind": "boxes",
+        "total_rows": len(data),
+        "reduced": True,
+        "categories": _to_list(summary.index),
+        **{name: _to_list(summary[name]) for name in summary.columns}
+    }
+
+
+def _scatter(data: pd.DataFrame, columns: dict, max_points: int) -> dict:
+    names = [columns["x"], columns["y"]]
+
+    if "size" in columns:
+        names.append(columns["size"])
+
+    frame = data[names].dropna()
+
+    if len(frame) <= max_points:
+        return {
+            "kind": "points",
+            "total_rows": len(data),
+            "reduced": False,
+            **{role: _to_list(frame[columns[role]])
+               for role in ("x", "y", "size") if role in columns}
+        }
+
+    # Dense data becomes a grid of cells with their point counts (and the
+    # mean bubble size)
+    grid = max(int(np.sqrt(max_points)), 1)
+    x = _as_float(frame[columns["x"]])
+    y = _as_float(frame[columns["y"]])
+
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=grid)
+    cells = np.nonzero(counts)
+    result = {
+        "kind": "density",
+        "total_rows": len(data),
+        "reduced": True,
+        "x": ((x_edges[:-1] + x_edges[1:]) / 2)[cells[0]].tolist(),
+        "y": ((y_edges[:-1] + y_edges[1:]) / 2)[cells[1]].tolist(),
+        "count": counts[cells].astype(int).tolist(),
+        "x_step": float(x_edges[1] - x_edges[0]),
+        "y_step": float(y_edges[1] - y_edges[0])
+    }
+
+    if "size" in columns:
+        sizes, _, _ = np.histogram2d(
+            x, y,
+            bins=[x_edges, y_edges],
+            weights=_as_float(frame[columns["size"]])
+        )
+        result["size"] = (sizes[cells] / counts[cells]).tolist()
+
+    return result
+
+
+def _heatmap(data: pd.DataFrame, columns: dict, max_points: int) -> dict:
+    names = columns["variables"][:max(int(np.sqrt(max_points)), 2)]
+    matrix = np.vstack([
+        block for _, block in correlation_blocks(data[names])
+    ])
+
+    return {
+        "kind": "matrix",
+        "total_rows": len(data),
+        "reduced": True,
+        "labels": list(names),
+        "values": np.round(matrix, 3).tolist()
+    }
+
+
+def _table(data: pd.DataFrame, columns, max_points: int) -> dict:
+    names = columns if isinstance(columns, list) else list(data.columns)
+    rows = max(max_points // max(len(names), 1), 1)
+    head = data[names].head(rows)
+
+    return {
+        "kind": "table",
+        "total_rows": len(data),
+        "reduced": len(head) < len(data),
+        "columns": list(names),
+        "rows": head.astype(object).where(head.notna(), None)
+        .to_numpy().tolist()
+    }
+
+
+CHART_PREPARERS: dict[str, Callable[[pd.DataFrame, dict, int], dict]] = {
+    "Line Graph": _line,
+    "Area Chart": _line,
+    "Histogram": _histogram,
+    "Bar Chart": _aggregate("mean", "x", "y"),
+    "Pie Chart": _aggregate("sum", "labels", "values"),
+    "Box Plot": _box,
+    "Scatter Plot": _scatter,
+    "Bubble Chart": _scatter,
+    "Heatmap": _heatmap,
+    "Table": _table,
+}
+
+
+def _as_float(values: pd.Series) -> np.ndarray:
+    """
+    :return: The values as floats, with datetimes as nanoseconds.
+    """
+
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy().astype("datetime64[ns]").astype(
+            np.int64).astype(np.float64)
+
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _to_list(values) -> list:
+    """
+    :return: The values as a JSON serializable list, with datetimes as ISO
+    strings and missing values as None.
+    """
+
+    values = pd.Series(values)
+
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return [
+            None if pd.isna(v) else v.isoformat() for v in values
+        ]
+
+    return values.astype(object).where(values.notna(), None).tolist()
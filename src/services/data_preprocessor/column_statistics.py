@@ -0,0 +1,123 @@
+"""
+Column Statistics
+"""
+
+import pandas as pd
+
+
+class ColumnStatistics:
+    """
+    Per-column statistics of a DataFrame, computed on first use and shared
+    by the treatments of a preprocessing pipeline run.
+
+    The statistics are cached per column. When a treatment changes the
+    values of some columns, only those are invalidated and recomputed on the
+    next request, and when rows are removed everything is invalidated.
+    """
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        self.data = data
+        self._cache: dict[tuple, pd.Series | pd.DataFrame] = {}
+
+    def update(
+            self,
+            data: pd.DataFrame,
+            changed_columns: pd.Index | list | None = None
+    ) -> None:
+        """
+        Point the statistics at a new version of the data.
+
+        :param data: The new DataFrame, with the same rows as before.
+        :param changed_columns: The columns whose values changed, or None if
+        any column may have changed.
+        """
+
+        self.data = data
+
+        if changed_columns is None:
+            self._cache.clear()
+            return
+
+        changed = set(changed_columns)
+
+        for key, cached in list(self._cache.items()):
+            keep = [col not in changed for col in _columns_of(cached)]
+
+            if not any(keep):
+                del self._cache[key]
+            elif isinstance(cached, pd.Series):
+                self._cache[key] = cached[keep]
+            else:
+                self._cache[key] = cached.loc[:, keep]
+
+    def rows_changed(self, data: pd.DataFrame) -> None:
+        """
+        Point the statistics at the data after rows were removed.
+
+        :param data: The new DataFrame.
+        """
+
+        self.update(data, changed_columns=None)
+
+    def null_counts(self) -> pd.Series:
+        """
+        :return: The number of missing values per column.
+        """
+
+        return self._get(("null_counts",), lambda df: df.isna().sum())
+
+    def nunique(self) -> pd.Series:
+        """
+        :return: The number of distinct non-null values per column.
+        """
+
+        return self._get(("nunique",), lambda df: df.nunique(dropna=True))
+
+    def quantiles(self, q: tuple[float, ...]) -> pd.DataFrame:
+        """
+        :param q: The quantiles to compute.
+        :return: The quantiles (rows) of every numeric column (columns).
+        """
+
+        return self._get(
+            ("quantiles", tuple(q)),
+            lambda df: df.quantile(list(q)),
+            columns=self.numeric_columns()
+        )
+
+    def numeric_columns(self) -> pd.Index:
+        """
+        :return: The names of the numeric columns.
+        """
+
+        return self.data.select_dtypes(include=['number']).columns
+
+    def _get(self, key: tuple, compute, columns: pd.Index | None = None):
+        columns = self.data.columns if columns is None else columns
+        cached = self._cache.get(key)
+        known = () if cached is None else _columns_of(cached)
+        missing = [col for col in columns if col not in known]
+
+        if missing or cached is None:
+            computed = compute(self.data[missing])
+
+            if cached is None:
+                cached = computed
+            else:
+                axis = 0 if isinstance(cached, pd.Series) else 1
+                cached = pd.concat([cached, computed], axis=axis)
+
+            self._cache[key] = cached
+
+        if isinstance(cached, pd.Series):
+            return cached.reindex(columns)
+
+        return cached.reindex(columns=columns)
+
+
+def _columns_of(stats: pd.Series | pd.DataFrame) -> pd.Index:
+    """
+    :return: The data columns the statistics are known for.
+    """
+
+    return stats.index if isinstance(stats, pd.Series) else stats.columns
@@ -1,33 +1,873 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder
+from scipy import sparse
+
+from src.config.settings import (
+    ENCODER_HASHING_FEATURES,
+    ENCODER_HIGH_CARDINALITY,
+    ENCODER_ONE_HOT_MAX_CARDINALITY,
+    ENCODER_TARGET_SMOOTHING
+)
+from src.services.extractor.profiler.data_profile import DataProfile
+
+# The dtypes of the columns encoded when no columns are given
+CATEGORICAL_DTYPES = ["object", "string", "category"]
 
 
 class DataEncoder(ABC):
     """
     Abstract base class for data encoders.
     This class defines the interface for encoding categorical data.
+
+    An encoder is fitted once, learning what it needs from the data (e.g.
+    the categories of every column), and can then transform any data of the
+    same schema with that state. The state is exported with `to_dict` and
+    restored with `from_dict`, so data arriving later is encoded the same
+    way without fitting again.
     """
 
     @abstractmethod
-    def encode(self, data: pd.DataFrame) -> pd.DataFrame:
+    def fit(self, data: pd.DataFrame) -> "DataEncoder":
         """
-        Encode the categorical data in the given DataFrame.
+        Learn the encoding of the categorical data in the given DataFrame.
+
+        :param data: The DataFrame containing categorical data.
+        :return: The fitted encoder.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Encode the categorical data with the fitted encoding.
 
         :param data: The DataFrame containing categorical data to encode.
         :return: A DataFrame with encoded categorical data.
+        :raises ValueError: If the encoder has not been fitted or the data
+        misses a fitted column.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @property
+    @abstractmethod
+    def is_fitted(self) -> bool:
+        """
+        :return: Whether the encoder has been fitted.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def to_dict(self) -> dict:
+        """
+        :return: The fitted state of the encoder, as JSON serializable
+        values.
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def encode(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Encode the categorical data in the given DataFrame, fitting the
+        encoder on it first if it has not been fitted.
+
+        :param data: The DataFrame containing categorical data to encode.
+        :return: A DataFrame with encoded categorical data.
+        """
+
+        if not self.is_fitted:
+            self.fit(data)
+
+        return self.transform(data)
+
 
 class LabelEncodingEncoder(DataEncoder):
     """
     Concrete implementation of DataEncoder using Label Encoding.
-    Applies label encoding to all object or category dtype columns.
+    Applies label encoding to all object, string or category dtype columns.
+
+    Fitting learns the sorted distinct values (the vocabulary) of every
+    column, and transforming replaces the values by their position in the
+    vocabulary, as the codes of a `pd.Categorical`. Missing values and
+    values outside the vocabulary are encoded as -1.
     """
 
-    def encode(self, data: pd.DataFrame) -> pd.DataFrame:
-        label_encoder = LabelEncoder()
-        for col in data.select_dtypes(include=["object", "category"]).columns:
-            data[col] = label_encoder.fit_transform(data[col].astype(str))
+    def __init__(self, columns: list | None = None) -> None:
+        """
+        :param columns: The columns to encode, all categorical columns if
+        None.
+        """
+
+        self.columns = columns
+        self.categories: dict[str, list] | None = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.categories is not None
+
+    def fit(self, data: pd.DataFrame) -> "LabelEncodingEncoder":
+        self.categories = {
+            col: _vocabulary(data[col])
+            for col in _categorical_columns(data, self.columns)
+        }
+
+        return self
+
+    def transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        if not self.is_fitted:
+            raise ValueError("The encoder has not been fitted.")
+
+        _check_columns(data, self.categories)
+
+        data = data.copy(deep=False)
+
+        for col, categories in self.categories.items():
+            data[col] = pd.Categorical(
+                data[col],
+                categories=categories
+            ).codes
+
         return data
+
+    def to_dict(self) -> dict:
+        return {
+            "encoder": type(self).__name__,
+            "categories": [
+                {"column": _json_scalar(col),
+                 "categories": _values_to_json(categories)}
+                for col, categories in self.categories.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "LabelEncodingEncoder":
+        """
+        Restore a fitted encoder.
+
+        :param state: The state returned by `to_dict`.
+        :return: The fitted encoder.
+        """
+
+        encoder = cls()
+        encoder.categories = {
+            entry["column"]: _values_from_json(entry["categories"])
+            for entry in state["categories"]
+        }
+        encoder.columns = list(encoder.categories)
+
+        return encoder
+
+
+class SparseEncoder(DataEncoder):
+    """
+    Base class of the encoders turning every categorical column into many
+    indicator columns, most of them zero in any row.
+
+    The indicators are built as a SciPy sparse matrix per column, so the
+    memory stays proportional to the number of rows rather than rows times
+    indicator columns. `transform` returns them as pandas sparse columns
+    in place of the encoded columns, and `sparse_matrix` as one CSR matrix.
+    """
+
+    @property
+    @abstractmethod
+    def encoded_columns(self) -> list:
+        """
+        :return: The columns the fitted encoder encodes.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def _column_matrix(
+            self,
+            col,
+            column: pd.Series
+    ) -> tuple[sparse.csr_matrix, list[str]]:
+        """
+        :return: The indicator matrix of the column and the names of its
+        indicator columns.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        if not self.is_fitted:
+            raise ValueError("The encoder has not been fitted.")
+
+        _check_columns(data, self.encoded_columns)
+
+        if not self.encoded_columns:
+            return data
+
+        frames = [data.drop(columns=self.encoded_columns)]
+
+        for col in self.encoded_columns:
+            matrix, names = self._column_matrix(col, data[col])
+            frames.append(pd.DataFrame.sparse.from_spmatrix(
+                matrix,
+                index=data.index,
+                columns=names
+            ))
+
+        return pd.concat(frames, axis=1)
+
+    def sparse_matrix(
+            self,
+            data: pd.DataFrame
+    ) -> tuple[sparse.csr_matrix, list[str]]:
+        """
+        Encode the fitted columns into a single sparse matrix, e.g. as the
+        input of a model.
+
+        :param data: The DataFrame containing categorical data to encode.
+        :return: The CSR matrix of all indicator columns and their names.
+        """
+
+        if not self.is_fitted:
+            raise ValueError("The encoder has not been fitted.")
+
+        _check_columns(data, self.encoded_columns)
+
+        matrices, names = [], []
+
+        for col in self.encoded_columns:
+            matrix, column_names = self._column_matrix(col, data[col])
+            matrices.append(matrix)
+            names.extend(column_names)
+
+        if not matrices:
+            return sparse.csr_matrix((len(data), 0), dtype=np.uint8), names
+
+        return sparse.hstack(matrices, format="csr"), names
+
+
+class OneHotEncoder(SparseEncoder):
+    """
+    Concrete implementation of DataEncoder using sparse One-Hot Encoding.
+
+    Every category of a column gets an indicator column named
+    "<column>_<category>". Missing values and values outside the fitted
+    categories have no indicator set.
+    """
+
+    def __init__(self, columns: list | None = None) -> None:
+        """
+        :param columns: The columns to encode, all categorical columns if
+        None.
+        """
+
+        self.columns = columns
+        self.categories: dict[str, list] | None = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.categories is not None
+
+    @property
+    def encoded_columns(self) -> list:
+        return list(self.categories)
+
+    def fit(self, data: pd.DataFrame) -> "OneHotEncoder":
+        self.categories = {
+            col: _vocabulary(data[col])
+            for col in _categorical_columns(data, self.columns)
+        }
+
+        return self
+
+    def _column_matrix(
+            self,
+            col,
+            column: pd.Series
+    ) -> tuple[sparse.csr_matrix, list[str]]:
+        categories = self.categories[col]
+        codes = pd.Categorical(column, categories=categories).codes
+        rows = np.flatnonzero(codes >= 0)
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.uint8), (rows, codes[rows])),
+            shape=(len(column), len(categories))
+        )
+
+        return matrix, [f"{col}_{category}" for category in categories]
+
+    def to_dict(self) -> dict:
+        return {
+            "encoder": type(self).__name__,
+            "categories": [
+                {"column": _json_scalar(col),
+                 "categories": _values_to_json(categories)}
+                for col, categories in self.categories.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "OneHotEncoder":
+        """
+        Restore a fitted encoder.
+
+        :param state: The state returned by `to_dict`.
+        :return: The fitted encoder.
+        """
+
+        encoder = cls()
+        encoder.categories = {
+            entry["column"]: _values_from_json(entry["categories"])
+            for entry in state["categories"]
+        }
+        encoder.columns = list(encoder.categories)
+
+        return encoder
+
+
+class HashingEncoder(SparseEncoder):
+    """
+    Concrete implementation of DataEncoder using Feature Hashing.
+
+    Every value is hashed into one of `n_features` indicator columns named
+    "<column>_hash_<i>", so the width does not depend on the number of
+    categories and unseen values need no vocabulary. Different categories
+    can share an indicator. The hashing is deterministic, so the encoding
+    is the same in every process and run.
+    """
+
+    def __init__(
+            self,
+            columns: list | None = None,
+            n_features: int = ENCODER_HASHING_FEATURES
+    ) -> None:
+        """
+        :param columns: The columns to encode, all categorical columns if
+        None.
+        :param n_features: The number of indicator columns per column.
+        """
+
+        if n_features < 1:
+            raise ValueError("The number of features must be positive.")
+
+        self.columns = columns
+        self.n_features = n_features
+        self.fitted_columns: list | None = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.fitted_columns is not None
+
+    @property
+    def encoded_columns(self) -> list:
+        return self.fitted_columns
+
+    def fit(self, data: pd.DataFrame) -> "HashingEncoder":
+        self.fitted_columns = list(_categorical_columns(data, self.columns))
+
+        return self
+
+    def _column_matrix(
+            self,
+            col,
+            column: pd.Series
+    ) -> tuple[sparse.csr_matrix, list[str]]:
+        rows = np.flatnonzero(column.notna().to_numpy())
+        values = column.iloc[rows]
+
+        try:
+            hashes = pd.util.hash_pandas_object(values, index=False)
+        except TypeError:
+            # Unhashable values (e.g. lists) are hashed by their text
+            hashes = pd.util.hash_pandas_object(
+                values.astype(str),
+                index=False
+            )
+
+        buckets = (hashes.to_numpy() % np.uint64(self.n_features)).astype(
+            np.intp)
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.uint8), (rows, buckets)),
+            shape=(len(column), self.n_features)
+        )
+
+        return matrix, [f"{col}_hash_{i}" for i in range(self.n_features)]
+
+    def to_dict(self) -> dict:
+        return {
+            "encoder": type(self).__name__,
+            "columns": [_json_scalar(col) for col in self.fitted_columns],
+            "n_features": self.n_features
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "HashingEncoder":
+        """
+        Restore a fitted encoder.
+
+        :param state: The state returned by `to_dict`.
+        :return: The fitted encoder.
+        """
+
+        encoder = cls(
+            columns=list(state["columns"]),
+            n_features=state["n_features"]
+        )
+        encoder.fitted_columns = list(state["columns"])
+
+        return encoder
+
+
+class FrequencyEncoder(DataEncoder):
+    """
+    Concrete implementation of DataEncoder using Frequency Encoding.
+
+    Every value is replaced by the share (or, without `normalize`, the
+    number) of rows holding it when the encoder was fitted. Missing and
+    unseen values are encoded as 0.
+    """
+
+    def __init__(
+            self,
+            columns: list | None = None,
+            normalize: bool = True
+    ) -> None:
+        """
+        :param columns: The columns to encode, all categorical columns if
+        None.
+        :param normalize: Whether to encode shares rather than counts.
+        """
+
+        self.columns = columns
+        self.normalize = normalize
+        self.frequencies: dict[str, tuple[list, list]] | None = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.frequencies is not None
+
+    def fit(self, data: pd.DataFrame) -> "FrequencyEncoder":
+        self.frequencies = {}
+
+        for col in _categorical_columns(data, self.columns):
+            counts = data[col].value_counts(
+                normalize=self.normalize,
+                sort=False
+            )
+            self.frequencies[col] = (
+                counts.index.tolist(),
+                counts.to_numpy().tolist()
+            )
+
+        return self
+
+    def transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        if not self.is_fitted:
+            raise ValueError("The encoder has not been fitted.")
+
+        _check_columns(data, self.frequencies)
+
+        data = data.copy(deep=False)
+
+        for col, (categories, frequencies) in self.frequencies.items():
+            data[col] = _lookup(data[col], categories, frequencies, 0)
+
+        return data
+
+    def to_dict(self) -> dict:
+        return {
+            "encoder": type(self).__name__,
+            "normalize": self.normalize,
+            "frequencies": [
+                {"column": _json_scalar(col),
+                 "categories": _values_to_json(categories),
+                 "values": [_json_scalar(value) for value in values]}
+                for col, (categories, values) in self.frequencies.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "FrequencyEncoder":
+        """
+        Restore a fitted encoder.
+
+        :param state: The state returned by `to_dict`.
+        :return: The fitted encoder.
+        """
+
+        encoder = cls(
+            columns=[entry["column"] for entry in state["frequencies"]],
+            normalize=state["normalize"]
+        )
+        encoder.frequencies = {
+            entry["column"]: (
+                _values_from_json(entry["categories"]),
+                list(entry["values"])
+            )
+            for entry in state["frequencies"]
+        }
+
+        return encoder
+
+
+class TargetEncoder(DataEncoder):
+    """
+    Concrete implementation of DataEncoder using Target Encoding.
+
+    Every value is replaced by the mean of the numerical `target` column
+    over the rows holding it, smoothed towards the overall mean:
+    (sum + smoothing * overall mean) / (count + smoothing). Rare categories
+    are therefore encoded close to the overall mean, which missing and
+    unseen values are encoded as. The target is only needed to fit.
+    """
+
+    def __init__(
+            self,
+            target: str,
+            columns: list | None = None,
+            smoothing: float = ENCODER_TARGET_SMOOTHING
+    ) -> None:
+        """
+        :param target: The numerical column to encode by.
+        :param columns: The columns to encode, all categorical columns but
+        the target if None.
+        :param smoothing: The weight of the overall mean, in rows.
+        """
+
+        self.target = target
+        self.columns = columns
+        self.smoothing = smoothing
+        self.means: dict[str, tuple[list, list]] | None = None
+        self.overall_mean: float | None = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.means is not None
+
+    def fit(self, data: pd.DataFrame) -> "TargetEncoder":
+        if self.target not in data.columns:
+            raise ValueError(f"The data misses the target: {self.target}")
+
+        target = data[self.target].astype(np.float64)
+        self.overall_mean = float(target.mean())
+        self.means = {}
+
+        for col in _categorical_columns(data, self.columns):
+            if col == self.target:
+                continue
+
+            grouped = target.groupby(
+                data[col],
+                observed=True,
+                sort=False
+            ).agg(["sum", "count"])
+            means = (grouped["sum"] + self.smoothing * self.overall_mean) \
+                / (grouped["count"] + self.smoothing)
+
+            self.means[col] = (means.index.tolist(), means.tolist())
+
+        return self
+
+    def transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        if not self.is_fitted:
+            raise ValueError("The encoder has not been fitted.")
+
+        _check_columns(data, self.means)
+
+        data = data.copy(deep=False)
+
+        for col, (categories, means) in self.means.items():
+            data[col] = _lookup(
+                data[col],
+                categories,
+                means,
+                self.overall_mean
+            )
+
+        return data
+
+    def to_dict(self) -> dict:
+        return {
+            "encoder": type(self).__name__,
+            "target": _json_scalar(self.target),
+            "smoothing": self.smoothing,
+            "overall_mean": _json_scalar(self.overall_mean),
+            "means": [
+                {"column": _json_scalar(col),
+                 "categories": _values_to_json(categories),
+                 "values": [_json_scalar(value) for value in values]}
+                for col, (categories, values) in self.means.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "TargetEncoder":
+        """
+        Restore a fitted encoder.
+
+        :param state: The state returned by `to_dict`.
+        :return: The fitted encoder.
+        """
+
+        encoder = cls(
+            target=state["target"],
+            columns=[entry["column"] for entry in state["means"]],
+            smoothing=state["smoothing"]
+        )
+        encoder.overall_mean = np.nan if state["overall_mean"] is None \
+            else state["overall_mean"]
+        encoder.means = {
+            entry["column"]: (
+                _values_from_json(entry["categories"]),
+                [np.nan if value is None else value
+                 for value in entry["values"]]
+            )
+            for entry in state["means"]
+        }
+
+        return encoder
+
+
+class CardinalityEncoder(DataEncoder):
+    """
+    Concrete implementation of DataEncoder choosing the encoding of every
+    categorical column by its number of distinct values:
+
+    - up to `one_hot_max_cardinality`: sparse one-hot encoding
+    - above, with a `target`: target encoding
+    - above, without a target: hashing or frequency encoding, as set by
+      `high_cardinality`
+
+    The cardinalities are taken from the DataProfile of the data if given,
+    instead of counting them again.
+    """
+
+    HIGH_CARDINALITY_ENCODINGS = ("hashing", "frequency")
+
+    def __init__(
+            self,
+            target: str | None = None,
+            profile: DataProfile | None = None,
+            one_hot_max_cardinality: int = ENCODER_ONE_HOT_MAX_CARDINALITY,
+            high_cardinality: str = ENCODER_HIGH_CARDINALITY
+    ) -> None:
+        """
+        :param target: The numerical column to target encode by, if any.
+        :param profile: The profile of the data to fit on.
+        :param one_hot_max_cardinality: The most categories of a column to
+        one-hot encode.
+        :param high_cardinality: The encoding of the other columns without
+        a target, "hashing" or "frequency".
+        """
+
+        if high_cardinality not in self.HIGH_CARDINALITY_ENCODINGS:
+            raise ValueError(
+                f"Unsupported high cardinality encoding: {high_cardinality}"
+            )
+
+        self.target = target
+        self.profile = profile
+        self.one_hot_max_cardinality = one_hot_max_cardinality
+        self.high_cardinality = high_cardinality
+        self.encoders: list[DataEncoder] | None = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.encoders is not None
+
+    def fit(self, data: pd.DataFrame) -> "CardinalityEncoder":
+        known = {} if self.profile is None else {
+            cp.column_name: cp.cardinality
+            for cp in self.profile.column_profiles
+        }
+
+        low, high = [], []
+
+        for col in _categorical_columns(data, None):
+            if col == self.target:
+                continue
+
+            cardinality = known[col] if col in known \
+                else data[col].nunique()
+
+            if cardinality <= self.one_hot_max_cardinality:
+                low.append(col)
+            else:
+                high.append(col)
+
+        self.encoders = []
+
+        if low:
+            self.encoders.append(OneHotEncoder(columns=low).fit(data))
+
+        if high:
+            if self.target is not None:
+                encoder = TargetEncoder(self.target, columns=high)
+            elif self.high_cardinality == "hashing":
+                encoder = HashingEncoder(columns=high)
+            else:
+                encoder = FrequencyEncoder(columns=high)
+
+            self.encoders.append(encoder.fit(data))
+
+        return self
+
+    def transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        if not self.is_fitted:
+            raise ValueError("The encoder has not been fitted.")
+
+        for encoder in self.encoders:
+            data = encoder.transform(data)
+
+        return data
+
+    def to_dict(self) -> dict:
+        return {
+            "encoder": type(self).__name__,
+            "target": _json_scalar(self.target),
+            "one_hot_max_cardinality": self.one_hot_max_cardinality,
+            "high_cardinality": self.high_cardinality,
+            "encoders": [encoder.to_dict() for encoder in self.encoders]
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "CardinalityEncoder":
+        """
+        Restore a fitted encoder.
+
+        :param state: The state returned by `to_dict`.
+        :return: The fitted encoder.
+        """
+
+        encoder = cls(
+            target=state["target"],
+            one_hot_max_cardinality=state["one_hot_max_cardinality"],
+            high_cardinality=state["high_cardinality"]
+        )
+        encoder.encoders = [
+            ENCODERS[entry["encoder"]].from_dict(entry)
+            for entry in state["encoders"]
+        ]
+
+        return encoder
+
+
+def _vocabulary(column: pd.Series) -> list:
+    """
+    :return: The sorted distinct non-null values of the column, in order of
+    appearance if they cannot be sorted.
+    """
+
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        values = column.cat.remove_unused_categories().cat.categories
+    else:
+        values = pd.Index(column.dropna().unique())
+
+    try:
+        values = values.sort_values()
+    except TypeError:
+        pass
+
+    return values.tolist()
+
+
+def _json_scalar(value):
+    """
+    :return: The value as a JSON scalar: NumPy scalars as Python ones, NaN
+    as None and other objects as their text.
+    """
+
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+
+    if isinstance(value, float):
+        return None if np.isnan(value) or np.isinf(value) else value
+
+    return str(value)
+
+
+def _values_to_json(values: list) -> dict:
+    """
+    Convert the categories of a column to JSON scalars, keeping the dtype
+    they are restored to. Dates and durations are written as text.
+
+    :param values: The categories.
+    :return: The dtype and the converted values.
+    """
+
+    index = pd.Index(values)
+
+    if index.dtype.kind == "M":
+        converted = [value.isoformat() for value in index]
+    elif index.dtype.kind == "m":
+        converted = [str(value) for value in index]
+    else:
+        converted = [_json_scalar(value) for value in index.tolist()]
+
+    return {"dtype": str(index.dtype), "values": converted}
+
+
+def _values_from_json(state: dict) -> list:
+    """
+    :param state: The categories written by `_values_to_json`.
+    :return: The categories, in their original dtype.
+    """
+
+    index = pd.Index(state["values"], dtype=object)
+
+    if pd.api.types.pandas_dtype(state["dtype"]).kind in "biufmM":
+        index = index.astype(state["dtype"])
+
+    return index.tolist()
+
+
+def _check_columns(data: pd.DataFrame, fitted: dict) -> None:
+    """
+    :raises ValueError: If the data misses a fitted column.
+    """
+
+    missing = [col for col in fitted if col not in data.columns]
+
+    if missing:
+        raise ValueError(
+            f"The data misses the fitted columns: "
+            f"{', '.join(map(str, missing))}"
+        )
+
+
+def _categorical_columns(data: pd.DataFrame, columns: list | None) -> list:
+    """
+    :return: The given columns, or all categorical columns if None.
+    """
+
+    if columns is not None:
+        return list(columns)
+
+    return list(data.select_dtypes(include=CATEGORICAL_DTYPES).columns)
+
+
+def _lookup(
+        column: pd.Series,
+        categories: list,
+        values: list,
+        default: float
+) -> np.ndarray:
+    """
+    :return: The value of the category of every row, the default for
+    missing values and values outside the categories.
+    """
+
+    codes = pd.Categorical(column, categories=categories).codes
+
+    # Code -1 (no category) picks the default at the end
+    return np.append(np.asarray(values, dtype=np.float64), default)[codes]
+
+
+# The encoders by name, to restore them from their state
+ENCODERS = {
+    encoder.__name__: encoder for encoder in (
+        LabelEncodingEncoder,
+        OneHotEncoder,
+        HashingEncoder,
+        FrequencyEncoder,
+        TargetEncoder,
+        CardinalityEncoder
+    )
+}
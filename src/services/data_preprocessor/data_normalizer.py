@@ -1,34 +1,174 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 
 
 class DataNormalizer(ABC):
     """
     Abstract base class for data normalizers.
     This class defines the interface for normalizing data.
+
+    A normalizer is fitted once, learning what it needs from the data (e.g.
+    the range of every column), and can then transform any data of the same
+    schema with that state. The state is exported with `to_dict` and
+    restored with `from_dict`, so data arriving later is normalized the
+    same way without fitting again.
     """
 
     @abstractmethod
-    def normalize(self, data: pd.DataFrame) -> pd.DataFrame:
+    def fit(self, data: pd.DataFrame) -> "DataNormalizer":
+        """
+        Learn the normalization of the given data.
+
+        :param data: The DataFrame to learn from.
+        :return: The fitted normalizer.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """
-        Normalize the given data.
+        Normalize the given data with the fitted normalization.
 
         :param data: The DataFrame to normalize.
         :return: A normalized DataFrame.
+        :raises ValueError: If the normalizer has not been fitted or the
+        data misses a fitted column.
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    @property
+    @abstractmethod
+    def is_fitted(self) -> bool:
+        """
+        :return: Whether the normalizer has been fitted.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def to_dict(self) -> dict:
+        """
+        :return: The fitted state of the normalizer, as JSON serializable
+        values.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def normalize(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize the given data, fitting the normalizer on it first if it
+        has not been fitted.
+
+        :param data: The DataFrame to normalize.
+        :return: A normalized DataFrame.
+        """
+
+        if not self.is_fitted:
+            self.fit(data)
+
+        return self.transform(data)
+
 
 class MinMaxNormalizer(DataNormalizer):
     """
     Concrete implementation of DataNormalizer using Min-Max normalization.
     Scales numerical columns to a range between 0 and 1.
+
+    Fitting learns the minimum and maximum of every column. Values of later
+    data outside the fitted range are scaled beyond [0, 1], and columns
+    without spread are scaled to 0.
     """
 
-    def normalize(self, data: pd.DataFrame) -> pd.DataFrame:
-        scaler = MinMaxScaler()
-        numeric_cols = data.select_dtypes(include=[np.number]).columns
-        data[numeric_cols] = scaler.fit_transform(data[numeric_cols])
+    def __init__(self, columns: list | None = None) -> None:
+        """
+        :param columns: The columns to normalize, all numerical columns if
+        None.
+        """
+
+        self.columns = columns
+        self.minimums: dict[str, float] | None = None
+        self.maximums: dict[str, float] | None = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.minimums is not None
+
+    def fit(self, data: pd.DataFrame) -> "MinMaxNormalizer":
+        columns = self.columns if self.columns is not None \
+            else data.select_dtypes(include=[np.number]).columns
+        numeric = data[list(columns)]
+
+        self.minimums = {
+            col: float(value) for col, value in numeric.min().items()
+        }
+        self.maximums = {
+            col: float(value) for col, value in numeric.max().items()
+        }
+
+        return self
+
+    def transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        if not self.is_fitted:
+            raise ValueError("The normalizer has not been fitted.")
+
+        missing = [col for col in self.minimums if col not in data.columns]
+
+        if missing:
+            raise ValueError(
+                f"The data misses the fitted columns: "
+                f"{', '.join(map(str, missing))}"
+            )
+
+        columns = list(self.minimums)
+
+        if not columns:
+            return data
+
+        minimums = np.array(list(self.minimums.values()))
+        spread = np.array(list(self.maximums.values())) - minimums
+        spread[~(spread > 0)] = 1.0
+
+        values = data[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        data = data.copy(deep=False)
+        data[columns] = (values - minimums) / spread
+
         return data
+
+    def to_dict(self) -> dict:
+        # Listed by column so column names that are not strings survive a
+        # JSON round trip, with the NaN range of empty columns as null
+        return {
+            "normalizer": type(self).__name__,
+            "columns": [
+                {"column": col,
+                 "minimum": None if np.isnan(minimum) else minimum,
+                 "maximum": None if np.isnan(self.maximums[col])
+                 else self.maximums[col]}
+                for col, minimum in self.minimums.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "MinMaxNormalizer":
+        """
+        Restore a fitted normalizer.
+
+        :param state: The state returned by `to_dict`.
+        :return: The fitted normalizer.
+        """
+
+        columns = state["columns"]
+
+        normalizer = cls(columns=[entry["column"] for entry in columns])
+        normalizer.minimums = {
+            entry["column"]: np.nan if entry["minimum"] is None
+            else entry["minimum"]
+            for entry in columns
+        }
+        normalizer.maximums = {
+            entry["column"]: np.nan if entry["maximum"] is None
+            else entry["maximum"]
+            for entry in columns
+        }
+
+        return normalizer
@@ -28,27 +28,20 @@ class DataPreprocessor(ABC):
         """
         Preprocess the data by running checks, treatments, normalization,
         and encoding.
+
+        The steps never modify the given DataFrame.
+
         :param data: DataFrame to preprocess.
         :return: Preprocessed DataFrame.
         """
 
-        encoded_data, normalized_data = None, None
-
         if not self.validate_data(data):
             raise ValueError("Data does not meet the required conditions.")
 
         treated_data = self.run_data_treatments(data)
+        normalized_data = self.normalize_data(treated_data)
 
-        if self.normalizer:
-            normalized_data = self.normalizer.normalize(treated_data)
-
-        if self.encoder:
-            encoded_data = self.encoder.encode(normalized_data)
-
-        # Assuming that if normalization is not applied, we return treated
-        # data directly
-
-        return treated_data if encoded_data is None else encoded_data
+        return self.encode_data(normalized_data)
 
     def run_data_treatments(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -70,7 +63,7 @@ class DataPreprocessor(ABC):
 
     def encode_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
-        Run encoder on the data.
+        Run encoder on the data, if any.
 
         :param data: DataFrame to encode.
         :return: Encoded DataFrame.
@@ -79,7 +72,7 @@ class DataPreprocessor(ABC):
 
     def normalize_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
-        Run normalizer on the data.
+        Run normalizer on the data, if any.
 
         :param data: DataFrame to normalize.
         :return: Normalized DataFrame.
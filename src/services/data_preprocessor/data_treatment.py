@@ -3,91 +3,796 @@ Data Treatments
 """
 
 from abc import ABC, abstractmethod
+import warnings
+
 import pandas as pd
 import numpy as np
 
+from src.config.settings import (
+    CONSTANT_CHECK_BLOCK_SIZE,
+    GARBAGE_CASE_INSENSITIVE,
+    GARBAGE_STRIP,
+    GARBAGE_TOKENS
+)
+from src.services.data_preprocessor.column_statistics import (
+    ColumnStatistics)
+
 
 class DataTreatment(ABC):
     """
     Abstract base class for data treatment.
     This class defines the interface for treating data.
+
+    The class attributes declare how a treatment accesses the data, which
+    lets the TreatmentPipeline share statistics between treatments and
+    combine consecutive row filters into a single mask.
     """
+
+    # The columns the treatment reads: "all" or "numeric"
+    reads = "all"
+
+    # The columns whose values the treatment may change or drop: "all",
+    # "numeric" or None
+    writes = "all"
+
+    # Whether the treatment only removes rows, as given by `row_mask`
+    filters_rows = False
+
+    # Whether the outcome for a row depends on the other rows present (e.g.
+    # through column aggregates), in which case pending row filters must be
+    # applied before the treatment runs
+    depends_on_rows = True
+
     @abstractmethod
     def treat_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
-        Treat the data according to the implemented treatment.
+        Treat the data according to the implemented treatment. The given
+        DataFrame must not be modified, changed columns are replaced in a
+        (shallow) copy.
 
         :param data: The DataFrame to treat.
         :return: A treated DataFrame.
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def apply(
+            self,
+            data: pd.DataFrame,
+            stats: ColumnStatistics
+    ) -> pd.DataFrame:
+        """
+        Treat the data, reusing the shared column statistics where possible.
+
+        :param data: The DataFrame to treat.
+        :param stats: The statistics of the data.
+        :return: A treated DataFrame.
+        """
+        return self.treat_data(data)
+
+    def row_mask(
+            self,
+            data: pd.DataFrame,
+            stats: ColumnStatistics
+    ) -> np.ndarray:
+        """
+        Determine the rows to keep, for treatments that filter rows.
+
+        :param data: The DataFrame to treat.
+        :param stats: The statistics of the data.
+        :return: A boolean array that is True for the rows to keep.
+        """
+        raise NotImplementedError(
+            "Row filtering treatments must implement this method."
+        )
+
 
 class GarbageValueTreatment(DataTreatment):
     """
     Concrete implementation of the DataTreatment for garbage value treatment.
 
-    Removes columns with all nulls, all constant values, or suspicious values
-    like empty strings or 'N/A'.
+    Replaces garbage strings like empty strings or 'N/A' with NaN, then
+    removes columns with all nulls or all constant values (columns only
+    holding a constant and garbage included).
+
+    Only text columns are searched for garbage. Each is factorized in one
+    pass and only its distinct values are normalized and matched against
+    the tokens, which also tells whether the column is constant. Other
+    columns are checked for a value differing from the first one block by
+    block, so non-constant columns are recognized after a few rows.
     """
 
+    def __init__(
+            self,
+            garbage_tokens: tuple[str, ...] = GARBAGE_TOKENS,
+            strip: bool = GARBAGE_STRIP,
+            case_insensitive: bool = GARBAGE_CASE_INSENSITIVE
+    ) -> None:
+        """
+        :param garbage_tokens: The strings standing for missing values.
+        :param strip: Whether to ignore surrounding whitespace.
+        :param case_insensitive: Whether to ignore case.
+        """
+
+        self.strip = strip
+        self.case_insensitive = case_insensitive
+        self.garbage_tokens = self._normalize(
+            pd.Series(garbage_tokens, dtype=object)
+        ).unique()
+
     def treat_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        # Drop columns with all null values
-        data = data.dropna(axis=1, how='all')
+        keep = []
+        replaced = {}
+
+        for position in range(data.shape[1]):
+            column = data.iloc[:, position]
+
+            if _is_text(column.dtype):
+                cleaned, constant = self._clean_text(column)
+            else:
+                cleaned, constant = column, _is_constant(column.to_numpy())
 
-        # Drop columns where all values are the same (e.g., constant)
-        data = data.loc[:, data.apply(pd.Series.nunique) > 1]
+            if constant:
+                continue
 
-        # Strip and replace known garbage strings with NaN
-        garbage_strings = ["", " ", "N/A", "n/a", "NULL", "null", "-", "--"]
-        data.replace(garbage_strings, np.nan, inplace=True)
+            if cleaned is not column:
+                replaced[len(keep)] = cleaned
+
+            keep.append(position)
+
+        if len(keep) == data.shape[1] and not replaced:
+            return data
+
+        data = data.iloc[:, keep]
+
+        for position, cleaned in replaced.items():
+            data.isetitem(position, cleaned)
 
         return data
 
+    def _clean_text(self, column: pd.Series) -> tuple[pd.Series, bool]:
+        """
+        Replace the garbage values of a text column with NaN.
+
+        :param column: The column.
+        :return: The cleaned column (the column itself if it holds no
+        garbage) and whether it is constant after the cleaning.
+        """
+
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            codes = column.cat.codes.to_numpy()
+            uniques = column.cat.categories
+        else:
+            codes, uniques = pd.factorize(column)
+
+        garbage = self._normalize(pd.Series(uniques)).isin(
+            self.garbage_tokens).to_numpy()
+        values = codes[codes >= 0]
+
+        # Categories may be unused, so only the used values count
+        used = np.zeros(len(uniques), dtype=bool)
+        used[values] = True
+        constant = np.count_nonzero(used & ~garbage) <= 1
+
+        if not garbage[used].any():
+            return column, constant
+
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            cleaned = column.cat.remove_categories(uniques[garbage])
+        else:
+            is_garbage = np.zeros(len(column), dtype=bool)
+            is_garbage[codes >= 0] = garbage[values]
+            cleaned = column.mask(is_garbage)
+
+        return cleaned, constant
+
+    def _normalize(self, values: pd.Series) -> pd.Series:
+        """
+        :return: The values as compared to the tokens. Values that are not
+        strings become NaN, unless no value is a string.
+        """
+
+        try:
+            if self.strip:
+                values = values.str.strip()
+
+            if self.case_insensitive:
+                values = values.str.casefold()
+        except AttributeError:
+            # The .str accessor requires string values
+            pass
+
+        return values
+
+
+def _is_text(dtype) -> bool:
+    """
+    :return: Whether a column of the dtype may hold strings.
+    """
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _is_text(dtype.categories.dtype)
+
+    return pd.api.types.is_object_dtype(dtype) \
+        or pd.api.types.is_string_dtype(dtype)
+
+
+def _is_constant(
+        values: np.ndarray,
+        block_size: int = CONSTANT_CHECK_BLOCK_SIZE
+) -> bool:
+    """
+    Check whether all non-null values equal the first one, comparing
+    blocks of growing size and stopping at the first differing value.
+
+    :param values: The values of a column.
+    :param block_size: The size of the first block.
+    :return: Whether the column has at most one distinct non-null value.
+    """
+
+    first = None
+    start = 0
+
+    while start < len(values):
+        block = values[start:start + block_size]
+        start += block_size
+        block_size *= 2
+
+        present = block[~pd.isna(block)]
+
+        if not len(present):
+            continue
+
+        if first is None:
+            first = present[0]
+
+        if not np.asarray(present == first).all():
+            return False
+
+    return True
+
 
 class MissingValueTreatment(DataTreatment):
     """
     Concrete implementation of the DataTreatment for missing value treatment.
 
-    Fills missing values using mean for numeric and mode for categorical
-    columns.
+    Fills missing values per column kind with one of the strategies below,
+    by default the mean for numeric and the mode for categorical columns:
+
+    - "mean" / "median": the column mean or median (numeric columns only)
+    - "mode": the most frequent value (categorical columns only, ties are
+      broken by first occurrence or category order)
+    - "constant": the given `fill_value`
+    - "ffill": the last preceding value, for data ordered as a time series
+
+    The fill values of all columns are computed up front, in one reduction
+    per strategy, and applied with a single `fillna` call.
     """
 
+    NUMERIC_STRATEGIES = ("mean", "median", "constant", "ffill")
+
+    CATEGORICAL_STRATEGIES = ("mode", "constant", "ffill")
+
+    def __init__(
+            self,
+            numeric_strategy: str = "mean",
+            categorical_strategy: str = "mode",
+            fill_value: object = None
+    ) -> None:
+        """
+        :param numeric_strategy: The strategy for numeric columns.
+        :param categorical_strategy: The strategy for all other columns.
+        :param fill_value: The value used by the "constant" strategy.
+        """
+
+        if numeric_strategy not in self.NUMERIC_STRATEGIES:
+            raise ValueError(
+                f"Unsupported numeric strategy: {numeric_strategy}"
+            )
+
+        if categorical_strategy not in self.CATEGORICAL_STRATEGIES:
+            raise ValueError(
+                f"Unsupported categorical strategy: {categorical_strategy}"
+            )
+
+        if fill_value is None and "constant" in (
+                numeric_strategy, categorical_strategy):
+            raise ValueError("The constant strategy requires a fill_value.")
+
+        self.numeric_strategy = numeric_strategy
+        self.categorical_strategy = categorical_strategy
+        self.fill_value = fill_value
+
     def treat_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        for col in data.columns:
-            if data[col].isnull().any():
-                if pd.api.types.is_numeric_dtype(data[col]):
-                    data[col].fillna(data[col].mean(), inplace=True)
-                else:
-                    data[col].fillna(data[col].mode()[0], inplace=True)
-        return data
+        return self.apply(data, ColumnStatistics(data))
+
+    def apply(
+            self,
+            data: pd.DataFrame,
+            stats: ColumnStatistics
+    ) -> pd.DataFrame:
+        null_counts = stats.null_counts()
+        missing = null_counts.index[null_counts.to_numpy() > 0]
+
+        if len(missing) == 0:
+            return data
+
+        numeric_cols, categorical_cols = [], []
+        for col in missing:
+            if pd.api.types.is_numeric_dtype(data.dtypes[col]):
+                numeric_cols.append(col)
+            else:
+                categorical_cols.append(col)
+
+        fill_values = {}
+        ffill_cols = []
+
+        for cols, strategy in (
+                (numeric_cols, self.numeric_strategy),
+                (categorical_cols, self.categorical_strategy)):
+            if not cols:
+                continue
+
+            if strategy == "ffill":
+                ffill_cols.extend(cols)
+            elif strategy == "constant":
+                fill_values.update(dict.fromkeys(cols, self.fill_value))
+            elif strategy == "mean":
+                fill_values.update(data[cols].mean().to_dict())
+            elif strategy == "median":
+                fill_values.update(data[cols].median().to_dict())
+            else:
+                fill_values.update(self._modes(data, cols))
+
+        # Columns without any value keep their missing values
+        fill_values = {
+            col: value for col, value in fill_values.items()
+            if not pd.isna(value)
+        }
+
+        # A categorical column can only be filled with one of its categories
+        new_categories = [
+            col for col, value in fill_values.items()
+            if isinstance(data.dtypes[col], pd.CategoricalDtype)
+            and value not in data[col].cat.categories
+        ]
+
+        if new_categories:
+            data = data.copy(deep=False)
+
+            for col in new_categories:
+                data[col] = data[col].cat.add_categories([fill_values[col]])
+
+        treated = data.fillna(fill_values) if fill_values else data.copy()
+
+        if ffill_cols:
+            treated[ffill_cols] = treated[ffill_cols].ffill()
+
+        return treated
+
+    @staticmethod
+    def _modes(data: pd.DataFrame, cols: list) -> dict:
+        """
+        Compute the most frequent value of each column by counting its
+        factorized codes, which avoids building and sorting a value count
+        table.
+
+        :param data: The DataFrame.
+        :param cols: The columns to compute the mode of.
+        :return: The mode per column, skipping columns without values.
+        """
+
+        modes = {}
+
+        for col in cols:
+            column = data[col]
+
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                codes = column.cat.codes.to_numpy()
+                uniques = column.cat.categories
+            else:
+                codes, uniques = pd.factorize(column)
+
+            codes = codes[codes >= 0]
+
+            if codes.size > 0:
+                modes[col] = uniques[np.bincount(codes).argmax()]
+
+        return modes
 
 
 class OutlierTreatment(DataTreatment):
     """
     Concrete implementation of the DataTreatment for outlier treatment.
 
-    Removes outliers using the IQR method for numeric columns.
+    Detects outliers in the numeric columns using one of the following
+    methods, with `threshold` defaulting to the conventional value:
+
+    - "iqr": outside [Q1 - t * IQR, Q3 + t * IQR] (t = 1.5)
+    - "zscore": more than t standard deviations from the mean (t = 3.0)
+    - "mad": modified z-score above t, i.e. more than t / 0.6745 median
+      absolute deviations from the median (t = 3.5)
+
+    The bounds of every column are computed on the complete data in one
+    pass over the numeric block. With the "drop" action, rows with an
+    outlier in any numeric column are removed, with "clip" the outliers are
+    replaced by the nearest bound. Missing values are never treated as
+    outliers.
     """
 
+    DEFAULT_THRESHOLDS = {"iqr": 1.5, "zscore": 3.0, "mad": 3.5}
+
+    ACTIONS = ("drop", "clip")
+
+    def __init__(
+            self,
+            method: str = "iqr",
+            action: str = "drop",
+            threshold: float | None = None
+    ) -> None:
+        """
+        :param method: The detection method, "iqr", "zscore" or "mad".
+        :param action: What to do with outliers, "drop" or "clip".
+        :param threshold: The method specific threshold.
+        """
+
+        if method not in self.DEFAULT_THRESHOLDS:
+            raise ValueError(f"Unsupported outlier method: {method}")
+
+        if action not in self.ACTIONS:
+            raise ValueError(f"Unsupported outlier action: {action}")
+
+        self.method = method
+        self.action = action
+        self.threshold = self.DEFAULT_THRESHOLDS[method] \
+            if threshold is None else threshold
+
+        self.reads = "numeric"
+        self.writes = None if action == "drop" else "numeric"
+        self.filters_rows = action == "drop"
+
     def treat_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        for col in data.select_dtypes(include=['number']).columns:
-            q1 = data[col].quantile(0.25)
-            q3 = data[col].quantile(0.75)
-            iqr = q3 - q1
-            lower_bound = q1 - 1.5 * iqr
-            upper_bound = q3 + 1.5 * iqr
-            data = data[(data[col] >= lower_bound) &
-                        (data[col] <= upper_bound)]
+        stats = ColumnStatistics(data)
+
+        if self.action == "clip":
+            return self.apply(data, stats)
+
+        keep = self.row_mask(data, stats)
+
+        return data if keep.all() else data[keep]
+
+    def apply(
+            self,
+            data: pd.DataFrame,
+            stats: ColumnStatistics
+    ) -> pd.DataFrame:
+        if self.action == "drop":
+            keep = self.row_mask(data, stats)
+            return data if keep.all() else data[keep]
+
+        numeric = data[stats.numeric_columns()]
+
+        if numeric.shape[1] == 0 or numeric.shape[0] == 0:
+            return data
+
+        lower, upper = self.compute_bounds(numeric, stats)
+        clipped = numeric.clip(lower=lower, upper=upper, axis=1)
+        data = data.copy(deep=False)
+        data[numeric.columns] = clipped
+
         return data
 
+    def row_mask(
+            self,
+            data: pd.DataFrame,
+            stats: ColumnStatistics
+    ) -> np.ndarray:
+        numeric = data[stats.numeric_columns()]
+
+        if numeric.shape[1] == 0 or numeric.shape[0] == 0:
+            return np.ones(len(data), dtype=bool)
+
+        lower, upper = self.compute_bounds(numeric, stats)
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        with np.errstate(invalid="ignore"):
+            outliers = ((values < lower) | (values > upper)).any(axis=1)
+
+        return ~outliers
+
+    def compute_bounds(
+            self,
+            numeric: pd.DataFrame,
+            stats: ColumnStatistics | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the lower and upper outlier bounds of every column.
+
+        Columns without spread (zero standard deviation or MAD) get infinite
+        bounds under the "zscore" and "mad" methods.
+
+        :param numeric: The numeric columns of the data.
+        :param stats: The statistics of the data, providing the quartiles.
+        :return: The lower and upper bound per column.
+        """
+
+        if self.method == "iqr":
+            if stats is None:
+                stats = ColumnStatistics(numeric)
+
+            quartiles = stats.quantiles((0.25, 0.75)).to_numpy(
+                dtype=np.float64,
+                na_value=np.nan
+            )
+            q1, q3 = quartiles
+            iqr = q3 - q1
+            return q1 - self.threshold * iqr, q3 + self.threshold * iqr
+
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        with warnings.catch_warnings():
+            # All-NaN columns yield NaN bounds, which flag nothing
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+
+            if self.method == "zscore":
+                center = np.nanmean(values, axis=0)
+                scale = np.nanstd(values, axis=0, ddof=1)
+            else:
+                center = np.nanmedian(values, axis=0)
+                scale = np.nanmedian(np.abs(values - center), axis=0) / 0.6745
+
+        spread = np.where(scale > 0, self.threshold * scale, np.inf)
+
+        return center - spread, center + spread
+
+
+class HashSet:
+    """
+    A set of uint64 row hashes, kept as sorted runs. A new run is merged
+    with the newer runs that are not larger than it, so the runs at least
+    double in size from the newest to the oldest: adding n hashes costs
+    O(n log n) overall and a lookup searches O(log n) runs.
+    """
+
+    def __init__(self) -> None:
+        self._runs: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self._runs)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        :param hashes: The hashes to look up.
+        :return: A boolean array that is True for the hashes in the set.
+        """
+
+        found = np.zeros(len(hashes), dtype=bool)
+
+        for run in self._runs:
+            positions = np.searchsorted(run, hashes)
+            positions[positions == len(run)] = len(run) - 1
+            found |= run[positions] == hashes
+
+        return found
+
+    def add(self, hashes: np.ndarray) -> None:
+        """
+        :param hashes: The hashes to add.
+        """
+
+        run = np.unique(hashes)
+
+        if not len(run):
+            return
+
+        while self._runs and len(self._runs[-1]) <= len(run):
+            run = np.union1d(self._runs.pop(), run)
+
+        self._runs.append(run)
+
 
 class DuplicateTreatment(DataTreatment):
     """
     Concrete implementation of the DataTreatment for duplicate treatment.
 
-    Removes duplicate rows from the dataset.
+    Removes duplicate rows from the dataset, comparing the `subset` columns
+    only if given. With `keep` "first" or "last" the first or last
+    occurrence of each row is kept, with False all occurrences are removed.
+
+    Every row is hashed once into a uint64, so duplicates are found in a
+    single pass over a compact vector instead of by comparing rows of
+    Python objects. Distinct rows sharing a hash (with a chance of about
+    n^2 / 2^65 for n rows) are taken for duplicates.
+
+    Data arriving in chunks is deduplicated with `treat_chunk`, which
+    remembers the hashes of the rows seen in earlier chunks. The number of
+    duplicates found by the last call is kept in `duplicate_count`, and
+    data without duplicates is returned without copying it.
     """
 
+    KEEP_OPTIONS = ("first", "last", False)
+
+    writes = None
+
+    filters_rows = True
+
+    def __init__(
+            self,
+            subset: list | None = None,
+            keep: str | bool = "first"
+    ) -> None:
+        """
+        :param subset: The columns identifying a row, all of them if None.
+        :param keep: Which occurrence of a duplicated row to keep.
+        """
+
+        if keep not in self.KEEP_OPTIONS:
+            raise ValueError(f"Unsupported keep option: {keep}")
+
+        self.subset = subset
+        self.keep = keep
+        self.duplicate_count = 0
+        self.seen = HashSet()
+
+        # A row is dropped if an identical row precedes it. Rows removed by
+        # earlier value-based filters have identical duplicates that are
+        # removed as well, so the duplicates can be found before applying
+        # those filters. That does not hold for rows only identical in the
+        # subset columns
+        self.depends_on_rows = subset is not None
+
     def treat_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        return data.drop_duplicates()
+        keep = self.row_mask(data, None)
+
+        return data if self.duplicate_count == 0 else data[keep]
+
+    def row_mask(
+            self,
+            data: pd.DataFrame,
+            stats: ColumnStatistics | None
+    ) -> np.ndarray:
+        hashes = self.row_hashes(data)
+        keep = ~pd.Series(hashes, copy=False).duplicated(
+            keep=self.keep).to_numpy()
+        self.duplicate_count = int(len(keep) - keep.sum())
+
+        return keep
+
+    def treat_chunk(
+            self,
+            chunk: pd.DataFrame,
+            key: pd.DataFrame | None = None
+    ) -> pd.DataFrame:
+        """
+        Remove the rows of a chunk that duplicate rows of the same or an
+        earlier chunk. Only the first occurrence can be kept, as later
+        chunks are unknown. Numbers are compared by their value whatever
+        their numeric dtype in each chunk, values of other dtypes only to
+        values of the same dtype, e.g. the string "1" is not a duplicate
+        of the number 1.
+
+        :param chunk: The next chunk of the data.
+        :param key: The values the rows of the chunk are compared by, with
+        the same columns, e.g. the text they were parsed from. The chunk
+        itself if None.
+        :return: The chunk without duplicates.
+        """
+
+        if self.keep != "first":
+            raise ValueError(
+                "Chunked deduplication can only keep the first occurrence."
+            )
+
+        hashes = self.row_hashes(
+            chunk if key is None else key,
+            normalize=True
+        )
+        keep = ~pd.Series(hashes, copy=False).duplicated().to_numpy()
+        keep &= ~self.seen.contains(hashes)
+        self.seen.add(hashes[keep])
+        self.duplicate_count = int(len(keep) - keep.sum())
+
+        return chunk if self.duplicate_count == 0 else chunk[keep]
+
+    def reset(self) -> None:
+        """
+        Forget the rows seen by `treat_chunk`.
+        """
+
+        self.seen = HashSet()
+        self.duplicate_count = 0
+
+    def row_hashes(
+            self,
+            data: pd.DataFrame,
+            normalize: bool = False
+    ) -> np.ndarray:
+        """
+        Hash every row of the subset columns.
+
+        :param data: The DataFrame.
+        :param normalize: Whether to hash a canonical form of the values,
+        so equal numbers hash the same whatever the numeric dtype of their
+        column in a chunk, e.g. the integer 1 and the float 1.0. Values of
+        other dtypes are hashed as they are.
+        :return: The uint64 hash of every row.
+        """
+
+        if self.subset is not None:
+            data = data[self.subset]
+
+        try:
+            if normalize:
+                data = _canonical(data)
+
+            return pd.util.hash_pandas_object(data, index=False).to_numpy()
+        except TypeError:
+            # Unhashable values (e.g. lists) are hashed by their text
+            return pd.util.hash_pandas_object(
+                data.astype(str),
+                index=False
+            ).to_numpy()
+
+
+# The kinds of values in the canonical form
+_MISSING, _INTEGER, _FLOAT, _OTHER = range(4)
+
+
+def _canonical(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Split every column into an exact canonical form: the kind of each
+    value, the integers (including the floats holding integers) as int64,
+    the other floats, and the values that are not numbers as they are. An
+    integer column in one chunk and a float column in another have the
+    same canonical form, while e.g. the string "01" stays distinct from
+    the number 1.
+
+    :param data: The DataFrame.
+    :return: Four columns for every column of the data.
+    """
+
+    parts = {}
+
+    for position in range(data.shape[1]):
+        column = data.iloc[:, position]
+        kind = np.full(len(column), _MISSING, dtype=np.uint8)
+        integers = np.zeros(len(column), dtype=np.int64)
+        floats = np.zeros(len(column), dtype=np.float64)
+        other = np.full(len(column), None, dtype=object)
+
+        if _fits_int64(column.dtype):
+            present = column.notna().to_numpy()
+            kind[present] = _INTEGER
+            integers[present] = column[present].to_numpy(dtype=np.int64)
+        elif pd.api.types.is_float_dtype(column.dtype):
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+
+            with np.errstate(invalid="ignore"):
+                integral = (np.floor(values) == values) \
+                    & (np.abs(values) < 2.0 ** 63)
+
+            fractional = ~integral & ~np.isnan(values)
+            kind[integral] = _INTEGER
+            integers[integral] = values[integral].astype(np.int64)
+            kind[fractional] = _FLOAT
+            floats[fractional] = values[fractional]
+        else:
+            kind[:] = _OTHER
+            other = column.array
+
+        parts[4 * position] = kind
+        parts[4 * position + 1] = integers
+        parts[4 * position + 2] = floats
+        parts[4 * position + 3] = other
+
+    return pd.DataFrame(parts, index=data.index, copy=False)
+
+
+def _fits_int64(dtype) -> bool:
+    """
+    :return: Whether the dtype holds integers that all fit in an int64.
+    """
+
+    if not pd.api.types.is_integer_dtype(dtype):
+        return False
+
+    return np.can_cast(getattr(dtype, "numpy_dtype", dtype), np.int64)
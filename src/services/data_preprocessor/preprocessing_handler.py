@@ -6,6 +6,8 @@ from src.services.data_preprocessor.data_encoder import DataEncoder
 from src.services.data_preprocessor.data_normalizer import DataNormalizer
 from src.services.data_preprocessor.data_preprocessor import DataPreprocessor
 from src.services.data_preprocessor.data_treatment import DataTreatment
+from src.services.data_preprocessor.treatment_pipeline import (
+    TreatmentPipeline)
 
 
 class PreprocessingHandler(DataPreprocessor):
@@ -29,9 +31,7 @@ class PreprocessingHandler(DataPreprocessor):
 
     @override
     def run_data_treatments(self, data: pd.DataFrame) -> pd.DataFrame:
-        for treatment in self.treatments:
-            data = treatment.treat_data(data)
-        return data
+        return TreatmentPipeline(self.treatments).run(data)
 
     @override
     def validate_data(self, data: pd.DataFrame) -> bool:
@@ -39,8 +39,14 @@ class PreprocessingHandler(DataPreprocessor):
 
     @override
     def encode_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        pass
+        if self.encoder is None:
+            return data
+
+        return self.encoder.encode(data)
 
     @override
     def normalize_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        pass
+        if self.normalizer is None:
+            return data
+
+        return self.normalizer.normalize(data)
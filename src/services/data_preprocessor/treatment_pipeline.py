@@ -0,0 +1,119 @@
+"""
+Treatment Pipeline
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.services.data_preprocessor.column_statistics import (
+    ColumnStatistics)
+from src.services.data_preprocessor.data_treatment import DataTreatment
+
+
+class TreatmentPipeline:
+    """
+    Runs a sequence of data treatments while avoiding intermediate copies
+    of the data.
+
+    The treatments are planned into stages based on what they declare:
+
+    - Consecutive row filters form one stage. Their masks are combined and
+      the rows are removed with a single selection at the end of the stage.
+      Filters that depend on the remaining rows (e.g. outlier bounds) start
+      a new stage so they see the rows removed by the previous ones.
+    - Any other treatment forms a stage of its own.
+
+    The column statistics (null counts, distinct counts, quantiles) are
+    computed once and shared by all treatments until a treatment changes the
+    columns they were computed from.
+
+    The treatments never modify the DataFrame they are given: they return
+    a new one, replacing whole columns of a shallow copy, so unchanged
+    columns are shared with the input instead of being copied. They do not
+    rely on pandas copy-on-write, a process-wide option that must not be
+    switched while other requests run treatments on the worker threads.
+    """
+
+    def __init__(self, treatments: list[DataTreatment]) -> None:
+        self.treatments = treatments
+        self.stages = self.plan(treatments)
+
+    @staticmethod
+    def plan(treatments: list[DataTreatment]) -> list[list[DataTreatment]]:
+        """
+        Group the treatments into stages.
+
+        :param treatments: The treatments in the order they should run.
+        :return: The list of stages, each a list of treatments.
+        """
+
+        stages: list[list[DataTreatment]] = []
+
+        for treatment in treatments:
+            if treatment.filters_rows and stages \
+                    and stages[-1][0].filters_rows \
+                    and not treatment.depends_on_rows:
+                stages[-1].append(treatment)
+            else:
+                stages.append([treatment])
+
+        return stages
+
+    def run(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run all treatments on the data.
+
+        :param data: The DataFrame to treat.
+        :return: The treated DataFrame.
+        """
+
+        stats = ColumnStatistics(data)
+
+        for stage in self.stages:
+            if stage[0].filters_rows:
+                data = self._run_filters(stage, data, stats)
+            else:
+                data = self._run_treatment(stage[0], data, stats)
+
+        return data
+
+    @staticmethod
+    def _run_filters(
+            filters: list[DataTreatment],
+            data: pd.DataFrame,
+            stats: ColumnStatistics
+    ) -> pd.DataFrame:
+        keep = np.ones(len(data), dtype=bool)
+
+        for treatment in filters:
+            keep &= np.asarray(treatment.row_mask(data, stats), dtype=bool)
+
+        if keep.all():
+            return data
+
+        data = data[keep]
+        stats.rows_changed(data)
+
+        return data
+
+    @staticmethod
+    def _run_treatment(
+            treatment: DataTreatment,
+            data: pd.DataFrame,
+            stats: ColumnStatistics
+    ) -> pd.DataFrame:
+        if treatment.writes == "numeric":
+            changed_columns = stats.numeric_columns()
+        elif treatment.writes is None:
+            changed_columns = []
+        else:
+            changed_columns = None
+
+        treated = treatment.apply(data, stats)
+
+        if len(treated) != len(data):
+            stats.rows_changed(treated)
+        else:
+            stats.update(treated, changed_columns)
+
+        return treated
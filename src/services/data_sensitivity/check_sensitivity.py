@@ -1,21 +1,375 @@
+"""
+Detects the columns of a dataset holding personal information (PII).
+
+Each column is checked by increasingly expensive tiers, and the first one
+conclusive decides:
+
+1. The column name, e.g. "email" or "last_name".
+2. Patterns matched by a sample of the values, e.g. email addresses, phone
+   numbers or card numbers.
+3. The Presidio analyzer, run on a small sample of the text columns that
+   neither the name nor the patterns explain.
+
+Only a bounded sample of rows is inspected, and the result of every column
+is cached by its name, dtype and sampled values.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import importlib.util
+import re
+import threading
+
 import pandas as pd
-from presidio_structured import PandasAnalysisBuilder
 
+from src.config.settings import (
+    PII_ANALYZER_ENABLED,
+    PII_ANALYZER_ENTITIES,
+    PII_ANALYZER_LANGUAGE,
+    PII_ANALYZER_MATCH_RATIO,
+    PII_ANALYZER_MAX_TEXT_LENGTH,
+    PII_ANALYZER_MIN_UNIQUE_RATIO,
+    PII_ANALYZER_MODEL,
+    PII_ANALYZER_SAMPLE_SIZE,
+    PII_ANALYZER_SCORE_THRESHOLD,
+    PII_CACHE_SIZE,
+    PII_MATCH_RATIO,
+    PII_SAMPLE_SIZE
+)
+from src.logging.logger import get_logger
 
-def check_sensitivity(data: pd.DataFrame) -> bool:
+logger = get_logger(__name__)
+
+PRESIDIO_AVAILABLE = importlib.util.find_spec("presidio_analyzer") is not None
+
+# Column names hinting at personal information, matched against the
+# lowercase name with its separators turned into underscores, so e.g.
+# "Customer Email" matches.
+PII_NAMES = [
+    ("EMAIL_ADDRESS", re.compile(r"(?:^|_)e_?mail(?:_address)?$")),
+    ("PHONE_NUMBER", re.compile(
+        r"(?:^|_)(?:phone|mobile|tel|telephone|fax)(?:_number|_no)?$"
+    )),
+    # A bare "name" only when it is the whole column name, as e.g.
+    # "product_name" or "city_name" do not name people
+    ("PERSON", re.compile(
+        r"^name$|(?:^|_)(?:(?:first|last|middle|family|full|given|user"
+        r"|customer|contact)_?name|surname|forename)$"
+    )),
+    ("LOCATION", re.compile(r"(?:^|_)(?:address|street)(?:_line_?\d)?$")),
+    ("US_SSN", re.compile(r"(?:^|_)(?:ssn|social_security(?:_number)?)$")),
+    ("PASSPORT", re.compile(r"(?:^|_)passport(?:_number|_no)?$")),
+    ("DATE_OF_BIRTH", re.compile(
+        r"(?:^|_)(?:dob|date_of_birth|birth_?date|birthday)$"
+    )),
+    ("CREDIT_CARD", re.compile(r"(?:^|_)(?:credit_)?card_?(?:number|no)$")),
+    ("IBAN_CODE", re.compile(r"(?:^|_)iban$")),
+    ("IP_ADDRESS", re.compile(r"(?:^|_)ip(?:_address)?$")),
+]
+
+# Value patterns, checked in order against the stripped sampled values.
+PII_PATTERNS = [
+    ("EMAIL_ADDRESS", re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")),
+    ("US_SSN", re.compile(r"\d{3}-\d{2}-\d{4}")),
+    ("IBAN_CODE", re.compile(r"[A-Z]{2}\d{2}(?: ?[A-Z0-9]){11,30}")),
+    ("CREDIT_CARD", re.compile(r"(?:\d[ -]?){12,18}\d")),
+    ("IP_ADDRESS", re.compile(
+        r"(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|1?\d?\d)"
+    )),
+    ("PHONE_NUMBER", re.compile(
+        r"(?:\+\d{1,3}[\s.-]?)?\(?\d{2,5}\)?[\s.-]\d{3,4}[\s.-]?\d{3,4}"
+    )),
+]
+
+LETTERS = re.compile(r"[^\W\d_]")
+
+_analyzer = None
+_analyzer_loaded = False
+_analyzer_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PIIFinding:
+    """
+    The personal information found in a column.
+
+    :param entity: The kind of information, e.g. "EMAIL_ADDRESS".
+    :param score: The confidence of the finding, between 0 and 1.
+    :param method: The tier that found it: "name", "pattern" or "analyzer".
+    """
+
+    entity: str
+    score: float
+    method: str
+
+
+def get_analyzer():
+    """
+    Returns the Presidio batch analyzer, created on the first call and then
+    shared by the whole process, as loading its NLP model takes seconds.
+
+    :return: The analyzer, or None if Presidio or its spaCy model is not
+    installed or the analyzer could not be created.
+    """
+
+    global _analyzer, _analyzer_loaded
+
+    if _analyzer_loaded:
+        return _analyzer
+
+    with _analyzer_lock:
+        if not _analyzer_loaded:
+            _analyzer = _create_analyzer()
+            _analyzer_loaded = True
+
+    return _analyzer
+
+
+def _create_analyzer():
+    if not PRESIDIO_AVAILABLE:
+        logger.warning(
+            "Presidio is not installed, PII is only detected from column "
+            "names and value patterns."
+        )
+        return None
+
+    # Presidio downloads a missing spaCy model, which must not happen while
+    # a request is served
+    if importlib.util.find_spec(PII_ANALYZER_MODEL) is None:
+        logger.warning(
+            "The spaCy model %s is not installed, PII is only detected from "
+            "column names and value patterns.",
+            PII_ANALYZER_MODEL
+        )
+        return None
+
+    try:
+        from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine
+        from presidio_analyzer.nlp_engine import NlpEngineProvider
+
+        nlp_engine = NlpEngineProvider(nlp_configuration={
+            "nlp_engine_name": "spacy",
+            "models": [{
+                "lang_code": PII_ANALYZER_LANGUAGE,
+                "model_name": PII_ANALYZER_MODEL
+            }]
+        }).create_engine()
+
+        return BatchAnalyzerEngine(AnalyzerEngine(
+            nlp_engine=nlp_engine,
+            supported_languages=[PII_ANALYZER_LANGUAGE]
+        ))
+    except Exception as e:
+        logger.warning(
+            "The Presidio analyzer could not be created, PII is only "
+            "detected from column names and value patterns: %s",
+            e
+        )
+        return None
+
+
+def _luhn_valid(number: str) -> bool:
+    digits = [int(digit) for digit in number if digit.isdigit()]
+    checksum = sum(digits[-1::-2])
+
+    for digit in digits[-2::-2]:
+        checksum += sum(divmod(2 * digit, 10))
+
+    return checksum % 10 == 0
+
+
+class PIIScanner:
+    """
+    Finds the columns of tabular data holding personal information, from a
+    bounded sample of their values.
+
+    The scans of the columns are cached, so scanning the same data again,
+    e.g. when it is preprocessed after being uploaded, is nearly free.
+    """
+
+    def __init__(
+            self,
+            sample_size: int = PII_SAMPLE_SIZE,
+            match_ratio: float = PII_MATCH_RATIO,
+            use_analyzer: bool = PII_ANALYZER_ENABLED,
+            cache_size: int = PII_CACHE_SIZE
+    ) -> None:
+        """
+        :param sample_size: The number of values per column inspected.
+        :param match_ratio: The share of the sampled values that must match
+        a PII pattern for the column to be flagged.
+        :param use_analyzer: Whether ambiguous text columns are analyzed
+        with Presidio.
+        :param cache_size: The number of column scans remembered.
+        """
+
+        self.sample_size = sample_size
+        self.match_ratio = match_ratio
+        self.use_analyzer = use_analyzer
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, PIIFinding | None] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def scan(self, data: pd.DataFrame) -> dict:
+        """
+        Find the columns holding personal information.
+
+        :param data: The DataFrame to scan.
+        :return: The finding of every flagged column, by column name.
+        """
+
+        step = max(len(data) // self.sample_size, 1)
+        sample = data.iloc[::step]
+        findings = {}
+
+        for position, name in enumerate(data.columns):
+            finding = self._scan_name(name)
+
+            if finding is None:
+                finding = self._scan_values(name, sample.iloc[:, position])
+
+            if finding is not None:
+                findings[name] = finding
+
+        return findings
+
+    def clear_cache(self) -> None:
+        """
+        Forget the cached column scans.
+
+        :return: None
+        """
+
+        with self._cache_lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _scan_name(name) -> PIIFinding | None:
+        normalized = re.sub(r"[\W_]+", "_", str(name).strip().lower())
+
+        for entity, pattern in PII_NAMES:
+            if pattern.search(normalized):
+                return PIIFinding(entity, 0.8, "name")
+
+        return None
+
+    def _scan_values(self, name, values: pd.Series) -> PIIFinding | None:
+        # Numbers, dates and booleans are only flagged by their name
+        if not (pd.api.types.is_object_dtype(values.dtype)
+                or pd.api.types.is_string_dtype(values.dtype)
+                or isinstance(values.dtype, pd.CategoricalDtype)):
+            return None
+
+        text = values.dropna()
+        text = text[text.map(type) == str].astype(str).str.strip()
+        text = text[text != ""]
+
+        if text.empty:
+            return None
+
+        key = (str(name), str(values.dtype), _sample_digest(text))
+
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        finding = self._scan_patterns(text)
+
+        if finding is None and self.use_analyzer:
+            finding = self._scan_analyzer(text)
+
+        with self._cache_lock:
+            self._cache[key] = finding
+
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return finding
+
+    def _scan_patterns(self, text: pd.Series) -> PIIFinding | None:
+        for entity, pattern in PII_PATTERNS:
+            matches = text[text.str.fullmatch(pattern)]
+
+            # Most long digit sequences are not card numbers
+            if entity == "CREDIT_CARD":
+                matches = matches[matches.map(_luhn_valid)]
+
+            matched = len(matches) / len(text)
+
+            if matched >= self.match_ratio:
+                return PIIFinding(entity, matched, "pattern")
+
+        return None
+
+    def _scan_analyzer(self, text: pd.Series) -> PIIFinding | None:
+        if text.nunique() / len(text) < PII_ANALYZER_MIN_UNIQUE_RATIO:
+            return None
+
+        if text.str.contains(LETTERS).mean() < 0.5:
+            return None
+
+        analyzer = get_analyzer()
+
+        if analyzer is None:
+            return None
+
+        step = max(len(text) // PII_ANALYZER_SAMPLE_SIZE, 1)
+        texts = text.iloc[::step].str.slice(0, PII_ANALYZER_MAX_TEXT_LENGTH)
+
+        results = analyzer.analyze_iterator(
+            texts=texts.tolist(),
+            language=PII_ANALYZER_LANGUAGE,
+            entities=list(PII_ANALYZER_ENTITIES),
+            score_threshold=PII_ANALYZER_SCORE_THRESHOLD
+        )
+
+        # The share of the values in which each entity was found
+        counts: dict[str, int] = {}
+
+        for value_results in results:
+            for entity in {result.entity_type for result in value_results}:
+                counts[entity] = counts.get(entity, 0) + 1
+
+        if not counts:
+            return None
+
+        entity = max(counts, key=counts.get)
+        matched = counts[entity] / len(texts)
+
+        if matched < PII_ANALYZER_MATCH_RATIO:
+            return None
+
+        return PIIFinding(entity, matched, "analyzer")
+
+
+def _sample_digest(text: pd.Series) -> str:
+    hashes = pd.util.hash_pandas_object(text, index=False).to_numpy()
+    return hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest()
+
+
+# Shared by the requests, so its cache and the analyzer are reused
+pii_scanner = PIIScanner()
+
+
+def find_sensitive_columns(data: pd.DataFrame) -> dict:
     """
-    Check if the data does not contain any sensitive information.
+    Find the columns of the data holding personal information.
 
     :param data: DataFrame to check.
-    :return: True if data contains sensitive information, False otherwise.
+    :return: The finding of every flagged column, by column name.
     """
 
-    # Generate a tabular analysis which describes the PII entities in
-    # the DataFrame.
-    tabular_analysis = PandasAnalysisBuilder().generate_analysis(data)
+    return pii_scanner.scan(data)
 
-    return True if tabular_analysis else False
 
+def check_sensitivity(data: pd.DataFrame) -> bool:
+    """
+    Check if the data contains any sensitive information.
+
+    :param data: DataFrame to check.
+    :return: True if data contains sensitive information, False otherwise.
+    """
 
-def handle_sensitivity_checker():
-    pass
+    return bool(find_sensitive_columns(data))
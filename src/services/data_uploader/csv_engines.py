@@ -0,0 +1,381 @@
+"""CSV Parser Engines"""
+
+from abc import ABC, abstractmethod
+import importlib.util
+from typing import BinaryIO
+
+import numpy as np
+import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+
+from src.config.settings import (
+    CSV_ARROW_MIN_BYTES,
+    CSV_STREAMING_MIN_BYTES
+)
+
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+class CSVEngine(ABC):
+    """
+    Abstract base class for the CSV parser engines.
+
+    Every engine accepts the `pd.read_csv` options produced by the loaders
+    (`dtype`, `parse_dates` and `date_format`) and returns a DataFrame with
+    the same columns and dtypes as the pandas C parser would.
+    """
+
+    name: str
+
+    @staticmethod
+    def available() -> bool:
+        """
+        :return: Whether the dependencies of the engine are installed.
+        """
+        return True
+
+    @abstractmethod
+    def read(self, source: str | BinaryIO, **options) -> pd.DataFrame:
+        """
+        Parse a CSV file.
+
+        :param source: The path or binary file-like object to parse.
+        :param options: The `pd.read_csv` options to parse with.
+        :return: The parsed DataFrame.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+
+class PandasCEngine(CSVEngine):
+    """
+    The default single-threaded pandas C parser. It supports every CSV
+    feature and is the engine the others fall back to.
+    """
+
+    name = "c"
+
+    def read(self, source: str | BinaryIO, **options) -> pd.DataFrame:
+        return pd.read_csv(source, engine="c", **options)
+
+
+class ArrowEngine(CSVEngine):
+    """
+    The multithreaded pyarrow.csv reader, which parses blocks of the file
+    on all cores.
+
+    pyarrow infers some columns differently from the C parser, which are
+    read as the C parser reads them instead: dates, times and timestamps
+    as strings (unless they are in `parse_dates`) and all-null columns as
+    floats. Repeated column names are numbered like pandas does (e.g.
+    "val" and "val.1").
+    """
+
+    name = "pyarrow"
+
+    @staticmethod
+    def available() -> bool:
+        return PYARROW_AVAILABLE
+
+    def read(self, source: str | BinaryIO, **options) -> pd.DataFrame:
+        import pyarrow as pa
+
+        position = None if isinstance(source, str) else source.tell()
+
+        # pyarrow infers the column types from the first block
+        reader = self._open(source, None, {}, options)
+        schema = reader.schema
+        reader.close()
+
+        names = _mangle_duplicates(schema.names)
+        column_types = {
+            name: pa.float64() if pa.types.is_null(field.type)
+            else pa.string()
+            for name, field in zip(names, schema)
+            if pa.types.is_null(field.type)
+            or pa.types.is_temporal(field.type)
+        }
+
+        for col, dtype in options.get("dtype", {}).items():
+            column_types[col] = pa.dictionary(pa.int32(), pa.string()) \
+                if dtype == "category" else pa.string()
+
+        for col in options.get("parse_dates", []):
+            column_types[col] = pa.timestamp("ns")
+
+        if position is not None:
+            source.seek(position)
+
+        frames = self._read_frames(
+            source,
+            names if names != schema.names else None,
+            column_types,
+            options
+        )
+
+        categories = [
+            col for col, dtype in options.get("dtype", {}).items()
+            if dtype == "category"
+        ]
+        _unify_categories(frames, categories)
+
+        df = frames[0] if len(frames) == 1 \
+            else pd.concat(frames, ignore_index=True)
+        del frames
+
+        df = _match_c_parser(df, options)
+
+        for col, dtype in options.get("dtype", {}).items():
+            if dtype != "category":
+                df[col] = df[col].astype(dtype)
+
+        return df
+
+    def _read_frames(
+            self,
+            source: str | BinaryIO,
+            names: list | None,
+            column_types: dict,
+            options: dict
+    ) -> list[pd.DataFrame]:
+        """
+        Parse the file into DataFrames, which are concatenated.
+
+        :param source: The path or binary file-like object to parse.
+        :param names: The column names, if they differ from the header.
+        :param column_types: The Arrow types of the columns not inferred.
+        :param options: The `pd.read_csv` options to parse with.
+        :return: The DataFrames.
+        """
+
+        import pyarrow.csv as pa_csv
+
+        table = pa_csv.read_csv(
+            source,
+            **self._csv_options(names, column_types, options)
+        )
+
+        return [table.to_pandas(split_blocks=True, self_destruct=True)]
+
+    def _open(
+            self,
+            source: str | BinaryIO,
+            names: list | None,
+            column_types: dict,
+            options: dict
+    ):
+        import pyarrow.csv as pa_csv
+
+        return pa_csv.open_csv(
+            source,
+            **self._csv_options(names, column_types, options)
+        )
+
+    def _csv_options(
+            self,
+            names: list | None,
+            column_types: dict,
+            options: dict
+    ) -> dict:
+        import pyarrow.csv as pa_csv
+
+        date_formats = options.get("date_format") or {}
+        read_options = pa_csv.ReadOptions(use_threads=True)
+
+        # The header is replaced by the given names
+        if names is not None:
+            read_options.column_names = names
+            read_options.skip_rows = 1
+
+        return {
+            "read_options": read_options,
+            "parse_options": pa_csv.ParseOptions(newlines_in_values=True),
+            "convert_options": pa_csv.ConvertOptions(
+                column_types=column_types,
+                null_values=sorted(STR_NA_VALUES),
+                strings_can_be_null=True,
+                timestamp_parsers=sorted(set(date_formats.values()))
+            )
+        }
+
+
+class ArrowStreamingEngine(ArrowEngine):
+    """
+    The pyarrow.csv streaming reader, which parses the file block by block
+    (on all cores) and converts every block to pandas as soon as it is
+    read, so at most one block is held in Arrow memory besides the
+    converted data.
+
+    It only pays off for whole files of at least `CSV_STREAMING_MIN_BYTES`
+    loaded at once (`load_data`). Uploads fed to the loaders incrementally
+    are parsed in batches of `CSV_BATCH_SIZE`, which are too small for the
+    engine to be picked automatically.
+    """
+
+    name = "pyarrow-stream"
+
+    def __init__(self, block_size: int | None = None) -> None:
+        """
+        :param block_size: The bytes parsed per block, the pyarrow default
+        if None.
+        """
+
+        self.block_size = block_size
+
+    def _read_frames(
+            self,
+            source: str | BinaryIO,
+            names: list | None,
+            column_types: dict,
+            options: dict
+    ) -> list[pd.DataFrame]:
+        import pyarrow as pa
+
+        reader = self._open(source, names, column_types, options)
+        frames = []
+
+        while True:
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                break
+
+            frames.append(pa.Table.from_batches([batch]).to_pandas(
+                split_blocks=True,
+                self_destruct=True
+            ))
+            del batch
+
+        if not frames:
+            frames.append(reader.schema.empty_table().to_pandas())
+
+        return frames
+
+    def _csv_options(
+            self,
+            names: list | None,
+            column_types: dict,
+            options: dict
+    ) -> dict:
+        csv_options = super()._csv_options(names, column_types, options)
+
+        if self.block_size is not None:
+            csv_options["read_options"].block_size = self.block_size
+
+        return csv_options
+
+
+def _mangle_duplicates(names: list) -> list:
+    """
+    Number the repeated column names like the pandas C parser: the second
+    "val" becomes "val.1", or "val.2" if the header holds "val.1" already.
+
+    :param names: The column names of the header.
+    :return: The unique column names.
+    """
+
+    unique = list(names)
+    counts: dict = {}
+
+    for i, name in enumerate(names):
+        count = counts.get(name, 0)
+
+        while count > 0:
+            counts[name] = count + 1
+            unique[i] = f"{name}.{count}"
+            count = count + 1 if unique[i] in names \
+                else counts.get(unique[i], 0)
+
+        counts[unique[i]] = count + 1
+
+    return unique
+
+
+def _unify_categories(frames: list[pd.DataFrame], columns: list) -> None:
+    """
+    Give the categorical columns of the frames converted from the blocks
+    the same categories, so that concatenating the frames keeps them
+    categorical.
+
+    :param frames: The frames, which are modified.
+    :param columns: The categorical columns.
+    """
+
+    if len(frames) < 2:
+        return
+
+    for col in columns:
+        categories = pd.Index(
+            [c for frame in frames for c in frame[col].cat.categories]
+        ).unique()
+
+        for frame in frames:
+            frame[col] = frame[col].cat.set_categories(categories)
+
+
+def _match_c_parser(df: pd.DataFrame, options: dict) -> pd.DataFrame:
+    """
+    Convert the columns parsed by pyarrow to what the C parser returns:
+    pyarrow marks missing strings with None instead of NaN, and the C
+    parser returns the columns of a file without rows as strings.
+
+    :param df: The DataFrame converted from Arrow, which is modified.
+    :param options: The `pd.read_csv` options parsed with.
+    :return: The DataFrame.
+    """
+
+    if df.empty:
+        typed = {*options.get("dtype", {}), *options.get("parse_dates", [])}
+
+        for col in df.columns.difference(list(typed), sort=False):
+            df[col] = df[col].astype(object)
+
+        return df
+
+    for col in df.columns[df.dtypes == object]:
+        column = df[col]
+        missing = column.isna()
+
+        if missing.any() and not missing.all():
+            df[col] = column.where(~missing, np.nan)
+
+    return df
+
+
+CSV_ENGINES: dict[str, type[CSVEngine]] = {
+    engine.name: engine
+    for engine in (PandasCEngine, ArrowEngine, ArrowStreamingEngine)
+}
+
+
+def get_csv_engine(name: str, size: int | None = None) -> CSVEngine:
+    """
+    Returns the CSV parser engine with the given name. For "auto" the
+    engine is picked by the size of the input: the C parser for small
+    inputs (where starting threads does not pay off), the multithreaded
+    pyarrow engine for large ones and the streaming reader for very large
+    ones. Engines whose dependencies are missing are replaced by the C
+    parser.
+
+    The incremental CSV loader picks the engine by the size of its batches
+    (`CSV_BATCH_SIZE`), so it never picks the streaming reader, which is
+    meant for whole files.
+
+    :param name: The engine name, or "auto".
+    :param size: The size of the input in bytes, if known.
+    :return: The engine instance.
+    """
+
+    if name == "auto":
+        if size is None or size < CSV_ARROW_MIN_BYTES:
+            name = PandasCEngine.name
+        elif size < CSV_STREAMING_MIN_BYTES:
+            name = ArrowEngine.name
+        else:
+            name = ArrowStreamingEngine.name
+
+    if name not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine: {name}")
+
+    engine = CSV_ENGINES[name]
+
+    return engine() if engine.available() else PandasCEngine()
@@ -1,23 +1,352 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import partial
+import importlib.util
+import io
+import os
+import tempfile
+from typing import BinaryIO
+import warnings
+
+import numpy as np
 import pandas as pd
+from pandas.io.parsers import TextParser
+from pandas.tseries.api import guess_datetime_format
+
+from src.config.settings import (
+    CATEGORY_MAX_UNIQUE_RATIO,
+    CSV_BATCH_SIZE,
+    CSV_ENGINE,
+    DTYPE_SAMPLE_ROWS,
+    EXCEL_ENGINE,
+    EXCEL_MAX_COLUMNS,
+    EXCEL_MAX_ROWS,
+    OPTIMIZE_DTYPES_ON_LOAD,
+    UPLOAD_SPOOL_MAX_SIZE
+)
+from src.logging.logger import get_logger
+from src.services.data_preprocessor.data_treatment import DuplicateTreatment
+from src.services.data_uploader.csv_engines import (
+    CSVEngine,
+    PandasCEngine,
+    get_csv_engine
+)
+
+logger = get_logger("data_loader_logger")
+
+# Arrow backed strings take a fraction of the memory of Python string
+# objects, but require the optional pyarrow package
+TEXT_DTYPE = "string[pyarrow]" \
+    if importlib.util.find_spec("pyarrow") is not None else None
+
+# Excel workbooks are read much faster by the optional calamine engine
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
+
+@dataclass
+class DtypePlan:
+    """
+    The compact dtypes inferred for the string columns of a dataset.
+    """
+
+    categorical: list = field(default_factory=list)
+    text: list = field(default_factory=list)
+    dates: dict = field(default_factory=dict)
+
+    def read_options(self) -> dict:
+        """
+        :return: The `pd.read_csv` options that parse the columns directly
+        into their planned dtypes.
+        """
+
+        dtype = {col: "category" for col in self.categorical}
+        dtype.update({col: TEXT_DTYPE for col in self.text})
+
+        options = {}
+
+        if dtype:
+            options["dtype"] = dtype
+
+        if self.dates:
+            options["parse_dates"] = list(self.dates)
+            options["date_format"] = dict(self.dates)
+
+        return options
+
+
+@dataclass
+class MemoryReport:
+    """
+    The memory usage of a dataset before and after the dtype optimization.
+    The usage before is estimated from the sample the plan was inferred
+    from.
+    """
+
+    original_bytes: int
+    optimized_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        """The number of bytes saved by the optimization."""
+        return self.original_bytes - self.optimized_bytes
+
+    def __str__(self):
+        return f"{self.original_bytes / 2 ** 20:.1f} MB -> " \
+               f"{self.optimized_bytes / 2 ** 20:.1f} MB"
+
+
+class DtypeOptimizer:
+    """
+    Infers memory-lean dtypes from a sample of a dataset and applies them.
+
+    - String columns with few distinct values become categoricals.
+    - Other string columns become Arrow backed strings (if pyarrow is
+      installed).
+    - String columns whose values all match one date format are parsed as
+      datetimes.
+    - Integer columns are downcast to the smallest integer type holding
+      their range, and float columns to float32 when that is lossless.
+    """
+
+    def __init__(
+            self,
+            sample_rows: int = DTYPE_SAMPLE_ROWS,
+            max_unique_ratio: float = CATEGORY_MAX_UNIQUE_RATIO
+    ) -> None:
+        self.sample_rows = sample_rows
+        self.max_unique_ratio = max_unique_ratio
+
+    def infer(self, sample: pd.DataFrame) -> DtypePlan:
+        """
+        Infer the dtypes of the string columns from a sample.
+
+        :param sample: The first rows of the dataset, with default dtypes.
+        :return: The inferred DtypePlan.
+        """
+
+        plan = DtypePlan()
+
+        for col in sample.columns:
+            if sample[col].dtype != object:
+                continue
+
+            values = sample[col].dropna()
+
+            if values.empty or pd.api.types.infer_dtype(
+                    values, skipna=True) != "string":
+                continue
+
+            date_format = self._date_format(values)
+
+            if date_format is not None:
+                plan.dates[col] = date_format
+            elif values.nunique() <= self.max_unique_ratio * len(values):
+                plan.categorical.append(col)
+            elif TEXT_DTYPE is not None:
+                plan.text.append(col)
+
+        return plan
+
+    def apply(self, data: pd.DataFrame, plan: DtypePlan) -> pd.DataFrame:
+        """
+        Convert the columns of the data to their planned dtypes, unless
+        they were parsed into them already, and downcast the numeric
+        columns.
+
+        :param data: The loaded DataFrame, which is modified.
+        :param plan: The DtypePlan inferred from a sample of the data.
+        :return: The optimized DataFrame.
+        """
+
+        for col in plan.categorical:
+            if col in data and data[col].dtype == object:
+                data[col] = data[col].astype("category")
+
+        for col in plan.text:
+            if col in data and data[col].dtype == object:
+                data[col] = data[col].astype(TEXT_DTYPE)
+
+        for col, date_format in plan.dates.items():
+            if col in data and data[col].dtype == object:
+                try:
+                    data[col] = pd.to_datetime(data[col], format=date_format)
+                except (ValueError, TypeError):
+                    # Values outside the sample do not match, keep strings
+                    pass
+
+        for col in data.select_dtypes(include=[np.integer, np.floating]):
+            data[col] = _downcast(data[col])
+
+        return data
+
+    def optimize(self, data: pd.DataFrame) -> DtypePlan:
+        """
+        Infer the dtypes from the first rows of already loaded data and
+        apply them.
+
+        :param data: The loaded DataFrame, which is modified.
+        :return: The inferred DtypePlan.
+        """
+
+        plan = self.infer(data.head(self.sample_rows))
+        self.apply(data, plan)
+
+        return plan
+
+    @staticmethod
+    def report(sample: pd.DataFrame, data: pd.DataFrame) -> MemoryReport:
+        """
+        Compare the memory usage of the optimized data with the usage of
+        the sample (with default dtypes), scaled to the number of rows.
+
+        :param sample: The sample the plan was inferred from.
+        :param data: The optimized DataFrame.
+        :return: The MemoryReport.
+        """
+
+        sample_bytes = sample.memory_usage(deep=True, index=False).sum()
+        original_bytes = sample_bytes * len(data) / max(len(sample), 1)
+
+        return MemoryReport(
+            original_bytes=int(original_bytes),
+            optimized_bytes=int(
+                data.memory_usage(deep=True, index=False).sum()
+            )
+        )
+
+    @staticmethod
+    def _date_format(values: pd.Series) -> str | None:
+        """
+        :param values: The non-null string values of a column.
+        :return: The date format all values match, or None.
+        """
+
+        date_format = guess_datetime_format(values.iloc[0])
+
+        # Bare numbers (e.g. "%Y") are more likely codes than dates
+        if date_format is None or not any(
+                sep in date_format for sep in "-/.: T"):
+            return None
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parsed = pd.to_datetime(
+                values,
+                format=date_format,
+                errors="coerce"
+            )
+
+        return date_format if parsed.notna().all() else None
+
+
+def _downcast(column: pd.Series) -> pd.Series:
+    """
+    Downcast a numeric column without losing information.
+
+    :param column: A column with a NumPy integer or float dtype.
+    :return: The downcast column, or the column itself.
+    """
+
+    if pd.api.types.is_integer_dtype(column.dtype):
+        return pd.to_numeric(column, downcast="integer")
+
+    if column.dtype == np.float64:
+        values = column.to_numpy()
+        downcast = values.astype(np.float32)
+
+        if np.array_equal(
+                downcast.astype(np.float64), values, equal_nan=True):
+            return pd.Series(downcast, index=column.index, name=column.name)
+
+    return column
 
 
 class DataLoader(ABC):
     """
     Abstract base class for data loaders.
     This class defines the interface for loading data from various sources.
+
+    Besides loading a complete source with `load_data`, every loader
+    supports an incremental mode: the raw bytes are passed to `feed` as they
+    arrive and `finish` returns the loaded data once the source is
+    exhausted. The default incremental mode spools the bytes and loads them
+    in one go, loaders that can parse partial input override it.
     """
+
+    def __init__(self) -> None:
+        self.error: str | None = None
+        self.memory_report: MemoryReport | None = None
+        self._spool: BinaryIO | None = None
+
     @abstractmethod
-    def load_data(self, source: str) -> tuple[pd.DataFrame | None, str]:
+    def load_data(
+            self,
+            source: str | BinaryIO
+    ) -> tuple[pd.DataFrame | None, str]:
         """
         Load data from the specified source.
 
         :param source: The source from which to load data (e.g.,
-        file path, URL).
+        file path, URL or a binary file-like object).
         :return: A dictionary containing the loaded data.
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def feed(self, chunk: bytes) -> None:
+        """
+        Pass the next chunk of raw bytes to the loader.
+
+        Once the loader has failed (see `error`), further chunks are ignored.
+
+        :param chunk: The next bytes of the source.
+        """
+
+        if self.error is not None:
+            return
+
+        if self._spool is None:
+            self._spool = tempfile.SpooledTemporaryFile(
+                max_size=UPLOAD_SPOOL_MAX_SIZE
+            )
+
+        self._spool.write(chunk)
+
+    def read_stream(self, stream: BinaryIO, chunk_size: int) -> None:
+        """
+        Feed the remaining bytes of a stream to the loader in chunks,
+        stopping as soon as the loader fails.
+
+        :param stream: The binary stream of the source.
+        :param chunk_size: The number of bytes fed at a time.
+        """
+
+        for chunk in iter(partial(stream.read, chunk_size), b""):
+            self.feed(chunk)
+
+            if self.error is not None:
+                break
+
+    def finish(self) -> tuple[pd.DataFrame | None, str]:
+        """
+        Signal the end of the fed input and return the loaded data.
+
+        :return: The loaded DataFrame (or None) and a status message.
+        """
+
+        if self.error is not None:
+            return None, self.error
+
+        spool, self._spool = self._spool, None
+
+        if spool is None:
+            spool = io.BytesIO()
+
+        try:
+            spool.seek(0)
+            return self.load_data(spool)
+        finally:
+            spool.close()
+
     def __str__(self):
         """
         String representation of the DataLoader.
@@ -29,22 +358,743 @@ class DataLoader(ABC):
 class CSVDataLoader(DataLoader):
     """
     Concrete implementation of the DataLoader for CSV files.
+
+    In incremental mode the fed bytes are parsed in batches of roughly
+    `batch_size` bytes, always cut at a record boundary, so the raw input
+    held in memory stays bounded and malformed files are rejected as soon as
+    the offending batch arrives.
+
+    With `optimize_dtypes`, the compact dtypes are inferred from a sample
+    of the file (in incremental mode, the first batch) and the remaining
+    rows are parsed directly into them. The memory saved is reported in the
+    status message and kept in `memory_report`.
+
+    The parser engine is picked by `engine` (see `get_csv_engine`). When a
+    file uses a feature the chosen engine does not support, it is parsed
+    again with the pandas C parser. In incremental mode the engine picked
+    for the first batch is kept for the remaining ones, so all batches are
+    parsed the same way.
+
+    The remaining batches are parsed into the dtypes of the first one, so a
+    column gets the same dtype as if the whole file was parsed at once.
+    When a later batch holds values that do not fit (e.g. text in a numeric
+    column), the columns that differ are parsed again once the input is
+    exhausted. They are read again from the source passed to `read_stream`
+    if it is seekable, the fed bytes are not kept. Without such a source
+    the values of the earlier batches are turned back into text, which
+    loses their original formatting (e.g. the leading zeros of a number).
+
+    With `deduplicate`, duplicate rows are dropped while loading. In
+    incremental mode the rows of each batch whose text repeats a row of the
+    same or a previous batch are dropped as it is parsed, so repeated rows
+    are never accumulated. As the dtype of a column is only final once the
+    input is exhausted, the rows with equal values but differing text (e.g.
+    "1.0" and "1" in a numeric column) are dropped at the end. The number
+    of rows dropped is kept in `duplicate_count`.
     """
-    def load_data(self, source: str) -> tuple[pd.DataFrame | None, str]:
+
+    def __init__(
+            self,
+            batch_size: int = CSV_BATCH_SIZE,
+            optimize_dtypes: bool = OPTIMIZE_DTYPES_ON_LOAD,
+            engine: str = CSV_ENGINE,
+            deduplicate: bool = False
+    ) -> None:
+        super().__init__()
+        self.batch_size = batch_size
+        self.engine = engine
+        self.deduplicator = DuplicateTreatment() if deduplicate else None
+        self.duplicate_count = 0
+        self._batch_engine: CSVEngine | None = None
+        self.optimizer = DtypeOptimizer() if optimize_dtypes else None
+        self._pending = bytearray()
+        self._header: bytes | None = None
+        self._frames: list[pd.DataFrame] = []
+        self._plan: DtypePlan | None = None
+        self._sample: pd.DataFrame | None = None
+        self._dtypes: dict = {}
+        self._conflicts: set = set()
+        self._source: BinaryIO | None = None
+        self._source_start = 0
+        self._rows = 0
+
+    def load_data(
+            self,
+            source: str | BinaryIO
+    ) -> tuple[pd.DataFrame | None, str]:
         try:
-            df = pd.read_csv(source)
-            return df, "CSV file loaded successfully."
+            engine = get_csv_engine(self.engine, _source_size(source))
+
+            if self.optimizer is None:
+                df, _ = self._read(engine, source)
+                return self._deduplicated(df), "CSV file loaded successfully."
+
+            sample = self._read_sample(source)
+            plan = self.optimizer.infer(sample)
+            df, _ = self._read(engine, source, **plan.read_options())
+            df = self._deduplicated(df)
+
+            return self._optimized(df, plan, sample)
         except Exception as e:
             return None, f"Failed to load CSV file: {str(e)}"
 
+    def feed(self, chunk: bytes) -> None:
+        if self.error is not None:
+            return
+
+        self._pending.extend(chunk)
+
+        if len(self._pending) >= self.batch_size:
+            self._parse_pending(final=False)
+
+    def finish(self) -> tuple[pd.DataFrame | None, str]:
+        try:
+            if self.error is None:
+                self._parse_pending(final=True)
+
+            if self.error is not None:
+                return None, self.error
+
+            if self._header is None:
+                return None, "Failed to load CSV file: No columns to " \
+                             "parse from file"
+
+            frames, self._frames = self._frames, []
+
+            if self._plan is not None:
+                _unify_categories(frames, self._plan.categorical)
+
+            # The frames are indexed by their row numbers in the file
+            df = frames[0] if len(frames) == 1 else pd.concat(frames)
+
+            if self._conflicts:
+                df = self._reparse_conflicts(df)
+
+            # The batches only dropped rows of identical text, the rows
+            # with equal values are found once all columns have their
+            # final dtypes
+            if self.deduplicator is not None:
+                df = self.deduplicator.treat_data(df)
+                self.duplicate_count += self.deduplicator.duplicate_count
+        except Exception as e:
+            return None, f"Failed to load CSV file: {str(e)}"
+        finally:
+            self._source = None
+
+        df.index = pd.RangeIndex(len(df))
+
+        if self._plan is None:
+            return df, "CSV file loaded successfully."
+
+        return self._optimized(df, self._plan, self._sample)
+
+    def read_stream(self, stream: BinaryIO, chunk_size: int) -> None:
+        if stream.seekable():
+            self._source = stream
+            self._source_start = stream.tell()
+
+        super().read_stream(stream, chunk_size)
+
+    def _deduplicated(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop the duplicate rows of a complete source, if enabled.
+        """
+
+        if self.deduplicator is None:
+            return df
+
+        df = self.deduplicator.treat_data(df)
+        self.duplicate_count = self.deduplicator.duplicate_count
+
+        return df.reset_index(drop=True) if self.duplicate_count else df
+
+    def _read_sample(self, source: str | BinaryIO) -> pd.DataFrame:
+        """
+        Read the first rows of the source, rewinding file-like sources.
+        """
+
+        if isinstance(source, str):
+            return pd.read_csv(source, nrows=self.optimizer.sample_rows)
+
+        position = source.tell()
+        sample = pd.read_csv(source, nrows=self.optimizer.sample_rows)
+        source.seek(position)
+
+        return sample
+
+    @staticmethod
+    def _read(
+            engine: CSVEngine,
+            source: str | BinaryIO,
+            **options
+    ) -> tuple[pd.DataFrame, CSVEngine]:
+        """
+        Parse the source with the engine, falling back to the pandas C
+        parser if the engine fails.
+
+        :return: The parsed DataFrame and the engine that parsed it.
+        """
+
+        if isinstance(engine, PandasCEngine):
+            return engine.read(source, **options), engine
+
+        position = None if isinstance(source, str) else source.tell()
+
+        try:
+            return engine.read(source, **options), engine
+        except Exception as e:
+            logger.warning(
+                f"The {engine.name} CSV engine failed ({e}), falling back "
+                f"to the C parser."
+            )
+
+        if position is not None:
+            source.seek(position)
+
+        fallback = PandasCEngine()
+
+        return fallback.read(source, **options), fallback
+
+    def _optimized(
+            self,
+            df: pd.DataFrame,
+            plan: DtypePlan,
+            sample: pd.DataFrame
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Apply the remaining dtype optimizations and report the memory saved.
+        """
+
+        df = self.optimizer.apply(df, plan)
+        self.memory_report = self.optimizer.report(sample, df)
+
+        return df, f"CSV file loaded successfully. Memory usage " \
+                   f"optimized: {self.memory_report}."
+
+    def _reparse_conflicts(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse the columns whose dtypes differ between batches again, from
+        the whole source if it can be read again.
+
+        :param df: The concatenated batches, indexed by their row numbers.
+        :return: The DataFrame with the columns replaced.
+        """
+
+        columns = [col for col in df.columns if col in self._conflicts]
+        dates = {
+            col: date_format
+            for col, date_format in self._plan.dates.items()
+            if col in self._conflicts
+        } if self._plan is not None else {}
+
+        if self._source is None:
+            return df.assign(**{
+                col: _as_text(df[col], dates.get(col)) for col in columns
+            })
+
+        options = {"parse_dates": list(dates), "date_format": dates} \
+            if dates else {}
+
+        self._source.seek(self._source_start)
+        reparsed = PandasCEngine().read(
+            self._source,
+            usecols=columns,
+            **options
+        )
+
+        if len(reparsed) != len(df) or self.duplicate_count:
+            reparsed = reparsed.take(df.index)
+
+        df = df.copy(deep=False)
+
+        for col in columns:
+            df[col] = reparsed[col].to_numpy()
+
+        return df
+
+    def _batch_text(self, df: pd.DataFrame, batch: bytes) -> pd.DataFrame:
+        """
+        Replace the columns of a parsed batch that do not hold text with
+        the text they were parsed from. Values that are equal once parsed
+        (e.g. "01" and "1" in a numeric column) can differ in the dtype the
+        column gets from the whole input.
+
+        :param df: The parsed batch.
+        :param batch: The raw bytes of the batch, with the header.
+        :return: The batch with the text of every column.
+        """
+
+        columns = [
+            col for col in df.columns
+            if not (pd.api.types.is_object_dtype(df[col])
+                    or pd.api.types.is_string_dtype(df[col])
+                    or isinstance(df[col].dtype, pd.CategoricalDtype))
+        ]
+
+        if not columns:
+            return df
+
+        text = PandasCEngine().read(
+            io.BytesIO(batch),
+            usecols=columns,
+            dtype=str
+        )
+        text.index = df.index
+
+        return df.assign(**{col: text[col] for col in columns})
+
+    def _batch_options(self) -> tuple[dict, dict]:
+        """
+        :return: The `pd.read_csv` options of the batches after the first
+        one, without and with the dtypes of the first batch.
+        """
+
+        options = self._plan.read_options() if self._plan is not None \
+            else {}
+        dtype = {**self._dtypes, **options.get("dtype", {})}
+
+        return options, {**options, "dtype": dtype} if dtype else options
+
+    def _conflicting(self, df: pd.DataFrame) -> set:
+        """
+        :return: The columns of a batch whose dtypes differ from the first
+        batch.
+        """
+
+        dates = self._plan.dates if self._plan is not None else {}
+
+        return {
+            col for col in df.columns
+            if (col in dates
+                and not pd.api.types.is_datetime64_any_dtype(df[col]))
+            or (col in self._dtypes and df[col].dtype != self._dtypes[col])
+        }
+
+    def _parse_pending(self, final: bool) -> None:
+        """
+        Parse all complete records buffered so far.
+
+        :param final: Whether the input is exhausted, in which case the
+        trailing record does not need a line terminator.
+        """
+
+        if self._header is None:
+            end = _record_boundary(self._pending, first=True)
+
+            if end == -1:
+                if not final or not self._pending.strip():
+                    return
+                end = len(self._pending)
+
+            self._header = bytes(self._pending[:end])
+            del self._pending[:end]
+
+        end = len(self._pending) if final \
+            else _record_boundary(self._pending, first=False)
+
+        if end == -1:
+            return
+
+        batch = self._header + bytes(self._pending[:end])
+        del self._pending[:end]
+
+        if self._batch_engine is None:
+            self._batch_engine = get_csv_engine(self.engine, len(batch))
+
+        try:
+            if not self._frames:
+                df, self._batch_engine = self._read(
+                    self._batch_engine,
+                    io.BytesIO(batch)
+                )
+
+                # The first batch is the sample the dtypes are inferred from
+                if self.optimizer is not None:
+                    self._sample = df.head(self.optimizer.sample_rows)
+                    self._plan = self.optimizer.infer(self._sample)
+
+                # The later batches are parsed into the same dtypes, except
+                # for the columns the plan parses itself
+                planned = self._plan.read_options().get("dtype", {}) \
+                    if self._plan is not None else {}
+                dates = self._plan.dates if self._plan is not None else {}
+                self._dtypes = {
+                    col: dtype for col, dtype in df.dtypes.items()
+                    if col not in planned and col not in dates
+                }
+
+                if self._plan is not None:
+                    df = self.optimizer.apply(df.copy(), self._plan)
+            else:
+                options, typed_options = self._batch_options()
+
+                try:
+                    df, self._batch_engine = self._read(
+                        self._batch_engine,
+                        io.BytesIO(batch),
+                        **typed_options
+                    )
+                except (ValueError, TypeError, OverflowError):
+                    # Values that do not fit the dtypes of the first batch
+                    df, self._batch_engine = self._read(
+                        self._batch_engine,
+                        io.BytesIO(batch),
+                        **options
+                    )
+
+                self._conflicts |= self._conflicting(df)
+        except Exception as e:
+            self.error = f"Failed to load CSV file: {str(e)}"
+            self._frames = []
+            self._source = None
+            return
+
+        df.index = pd.RangeIndex(self._rows, self._rows + len(df))
+        self._rows += len(df)
+
+        if self.deduplicator is not None:
+            df = self.deduplicator.treat_chunk(df, self._batch_text(df, batch))
+            self.duplicate_count += self.deduplicator.duplicate_count
+
+        if not self._frames or not df.empty:
+            self._frames.append(df)
+
+
+def _source_size(source: str | BinaryIO) -> int | None:
+    """
+    :return: The number of bytes left in the source, if it can be told.
+    """
+
+    if isinstance(source, str):
+        return os.path.getsize(source)
+
+    if not source.seekable():
+        return None
+
+    position = source.tell()
+    size = source.seek(0, io.SEEK_END) - position
+    source.seek(position)
+
+    return size
+
+
+def _as_text(column: pd.Series, date_format: str | None) -> pd.Series:
+    """
+    Turn the values of a column mixing strings with parsed values (e.g.
+    numbers from the earlier batches) back into text, as the whole file
+    would be parsed.
+
+    :param column: The concatenated column.
+    :param date_format: The format of the dates of the column, if any.
+    :return: The column as strings, keeping the missing values. Columns
+    without strings are returned unchanged.
+    """
+
+    if not pd.api.types.is_object_dtype(column):
+        return column
+
+    is_text = column.map(lambda value: isinstance(value, str))
+
+    if not is_text.any():
+        return column
+
+    def text(value):
+        if date_format is not None and isinstance(value, pd.Timestamp):
+            return value.strftime(date_format)
+
+        return str(value)
+
+    parsed = ~is_text & column.notna()
+
+    return column.where(~parsed, column[parsed].map(text))
+
+
+def _unify_categories(frames: list[pd.DataFrame], columns: list) -> None:
+    """
+    Give the categorical columns of all frames the same categories, so
+    that concatenating the frames keeps them categorical.
+
+    :param frames: The frames, which are modified.
+    :param columns: The categorical columns.
+    """
+
+    if len(frames) < 2:
+        return
+
+    for col in columns:
+        if not all(
+                isinstance(frame[col].dtype, pd.CategoricalDtype)
+                for frame in frames):
+            continue
+
+        categories = pd.Index(
+            [c for frame in frames for c in frame[col].cat.categories]
+        ).unique()
+
+        for frame in frames:
+            frame[col] = frame[col].cat.set_categories(categories)
+
+
+def _record_boundary(buffer: bytearray, first: bool) -> int:
+    """
+    Find the end of a complete CSV record within the buffer.
+
+    A line terminator only ends a record when it is not enclosed in a quoted
+    field, i.e. when an even number of quote characters precede it (escaped
+    quotes are doubled and so keep the parity).
+
+    :param buffer: Raw bytes starting at a record boundary.
+    :param first: Return the end of the first record instead of the last.
+    :return: The offset just past the terminator, or -1 if there is none.
+    """
+
+    if first:
+        quotes = 0
+        start = 0
+        while True:
+            idx = buffer.find(b"\n", start)
+            if idx == -1:
+                return -1
+            quotes += buffer.count(b'"', start, idx)
+            if quotes % 2 == 0:
+                return idx + 1
+            start = idx + 1
+
+    idx = buffer.rfind(b"\n")
+    if idx == -1:
+        return -1
+
+    quotes = buffer.count(b'"', 0, idx)
+    while quotes % 2:
+        prev = buffer.rfind(b"\n", 0, idx)
+        if prev == -1:
+            return -1
+        quotes -= buffer.count(b'"', prev, idx)
+        idx = prev
+
+    return idx + 1
+
 
 class ExcelDataLoader(DataLoader):
     """
     Concrete implementation of the DataLoader for Excel files.
+
+    Only the selected sheet (`sheet_name`, a sheet name or position) is
+    parsed, and at most `max_rows` rows and `max_columns` columns of it are
+    read. With the openpyxl engine the workbook is opened in read-only mode
+    and the rows are streamed, so the cells beyond the caps are never
+    materialized. The calamine engine is used instead when it is installed
+    and the engine is picked automatically.
+
+    With `optimize_dtypes`, the loaded sheet is converted to compact dtypes
+    inferred from its first rows.
     """
-    def load_data(self, source: str) -> tuple[pd.DataFrame | None, str]:
+
+    def __init__(
+            self,
+            sheet_name: str | int = 0,
+            max_rows: int = EXCEL_MAX_ROWS,
+            max_columns: int = EXCEL_MAX_COLUMNS,
+            engine: str = EXCEL_ENGINE,
+            optimize_dtypes: bool = OPTIMIZE_DTYPES_ON_LOAD
+    ) -> None:
+        super().__init__()
+        self.sheet_name = sheet_name
+        self.max_rows = max_rows
+        self.max_columns = max_columns
+        self.engine = engine
+        self.optimizer = DtypeOptimizer() if optimize_dtypes else None
+
+    @staticmethod
+    def list_sheets(source: str | BinaryIO) -> list[str]:
+        """
+        List the sheets of a workbook without parsing them.
+
+        :param source: The path or binary file-like object of the workbook.
+        :return: The sheet names, in workbook order.
+        """
+
+        with pd.ExcelFile(source) as workbook:
+            return list(workbook.sheet_names)
+
+    def load_data(
+            self,
+            source: str | BinaryIO
+    ) -> tuple[pd.DataFrame | None, str]:
         try:
-            df = pd.read_excel(source)
-            return df, "Excel file loaded successfully."
+            if self._pick_engine(source) == "openpyxl":
+                df, truncated = self._stream_rows(source)
+            else:
+                df, truncated = self._read_sheet(source)
+
+            message = "Excel file loaded successfully."
+
+            if truncated:
+                message += f" Only the first {self.max_rows} rows and " \
+                           f"{self.max_columns} columns were loaded."
+
+            if self.optimizer is None:
+                return df, message
+
+            sample = df.head(self.optimizer.sample_rows).copy()
+            self.optimizer.optimize(df)
+            self.memory_report = self.optimizer.report(sample, df)
+
+            return df, f"{message} Memory usage optimized: " \
+                       f"{self.memory_report}."
         except Exception as e:
             return None, f"Failed to load Excel file: {str(e)}"
+
+    def _pick_engine(self, source: str | BinaryIO) -> str | None:
+        """
+        :return: The engine to read the source with, or None to let pandas
+        pick one.
+        """
+
+        if not _is_zip(source):
+            # Legacy .xls workbooks are only read by the pandas default
+            return None
+
+        if self.engine != "auto":
+            return self.engine
+
+        return "calamine" if CALAMINE_AVAILABLE else "openpyxl"
+
+    def _resolve_sheet(self, sheet_names: list[str]) -> str:
+        """
+        :return: The name of the selected sheet.
+        """
+
+        sheet = self.sheet_name
+
+        if isinstance(sheet, str) and sheet not in sheet_names \
+                and sheet.isdigit():
+            sheet = int(sheet)
+
+        if isinstance(sheet, int) and 0 <= sheet < len(sheet_names):
+            return sheet_names[sheet]
+
+        if sheet not in sheet_names:
+            raise ValueError(
+                f"Worksheet {self.sheet_name!r} not found, the workbook "
+                f"has the sheets {sheet_names}"
+            )
+
+        return sheet
+
+    def _read_sheet(
+            self,
+            source: str | BinaryIO
+    ) -> tuple[pd.DataFrame, bool]:
+        """
+        Read the selected sheet through pandas.
+
+        :return: The capped DataFrame and whether it was truncated.
+        """
+
+        with pd.ExcelFile(source, engine=self._pick_engine(source)) \
+                as workbook:
+            df = workbook.parse(
+                self._resolve_sheet(workbook.sheet_names),
+                nrows=self.max_rows + 1
+            )
+
+        truncated = len(df) > self.max_rows \
+            or len(df.columns) > self.max_columns
+
+        if truncated:
+            df = df.iloc[:self.max_rows, :self.max_columns]
+
+        return df, truncated
+
+    def _stream_rows(
+            self,
+            source: str | BinaryIO
+    ) -> tuple[pd.DataFrame, bool]:
+        """
+        Stream the rows of the selected sheet from a read-only openpyxl
+        workbook. The rows are trimmed the way pandas trims openpyxl rows
+        and parsed with the same text parser, so the result matches
+        `pd.read_excel`.
+
+        :return: The capped DataFrame and whether it was truncated.
+        """
+
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(source, read_only=True, data_only=True)
+
+        try:
+            sheet = workbook[self._resolve_sheet(workbook.sheetnames)]
+            sheet.reset_dimensions()
+
+            data = []
+            last_row_with_data = -1
+            truncated = False
+
+            # Limiting the columns in openpyxl pads every row to the limit,
+            # so they are cut here instead
+            for row in sheet.iter_rows(values_only=True):
+                row = list(row[:self.max_columns + 1])
+
+                while row and row[-1] is None:
+                    row.pop()
+
+                if len(row) > self.max_columns:
+                    truncated = True
+                    row.pop()
+
+                if row:
+                    if len(data) > self.max_rows:
+                        truncated = True
+                        break
+
+                    last_row_with_data = len(data)
+
+                data.append(row)
+        finally:
+            workbook.close()
+
+        data = data[:last_row_with_data + 1]
+
+        if not data:
+            return pd.DataFrame(), truncated
+
+        width = max(len(row) for row in data)
+        data = [row + [None] * (width - len(row)) for row in data]
+        data[0] = ["" if name is None else name for name in data[0]]
+
+        df = TextParser(data, header=0).read()
+
+        # pandas reads integral numbers as integers and empty cells as NaN
+        for col in df.columns[df.dtypes == np.float64]:
+            values = df[col].to_numpy()
+
+            if not np.isnan(values).any() \
+                    and np.array_equal(values, np.trunc(values)):
+                df[col] = values.astype(np.int64)
+
+        for col in df.columns[df.dtypes == object]:
+            missing = df[col].isna()
+
+            if missing.any():
+                df[col] = df[col].where(~missing, np.nan)
+
+        return df, truncated
+
+
+def _is_zip(source: str | BinaryIO) -> bool:
+    """
+    :return: Whether the source is a zip container (xlsx, xlsm), as opposed
+    to a legacy binary workbook.
+    """
+
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            return file.read(4) == b"PK\x03\x04"
+
+    position = source.tell()
+    signature = source.read(4)
+    source.seek(position)
+
+    return signature == b"PK\x03\x04"
@@ -1,12 +1,50 @@
 """Upload Handler"""
 
+import os
+from typing import BinaryIO
+
 import pandas as pd
+from src.config.settings import (
+    CATEGORY_MAX_UNIQUE_RATIO,
+    CSV_BATCH_SIZE,
+    CSV_ENGINE,
+    DTYPE_SAMPLE_ROWS,
+    EXCEL_ENGINE,
+    EXCEL_MAX_COLUMNS,
+    EXCEL_MAX_ROWS,
+    OPTIMIZE_DTYPES_ON_LOAD,
+    UPLOAD_CHUNK_SIZE
+)
 from src.services.data_uploader.data_loader import (CSVDataLoader,
                                                     ExcelDataLoader)
+from src.services.dataset_store.dataset_cache import cache_key, dataset_cache
 from src.logging.logger import get_logger
 
 logger = get_logger("upload_handler_logger")
 
+CACHE_HIT_MESSAGE = "File loaded from the dataset cache."
+
+
+def _cache_options(filename: str, loader_options: dict) -> dict:
+    """
+    Returns the options a parsed upload depends on besides its bytes: the
+    file extension, the loader settings of the server and the loader options
+    of the request. Cached uploads parsed with other settings are not
+    reused after the settings change.
+    """
+    return {
+        "extension": os.path.splitext(filename)[1].lower(),
+        "optimize_dtypes": OPTIMIZE_DTYPES_ON_LOAD,
+        "dtype_sample_rows": DTYPE_SAMPLE_ROWS,
+        "category_max_unique_ratio": CATEGORY_MAX_UNIQUE_RATIO,
+        "csv_engine": CSV_ENGINE,
+        "csv_batch_size": CSV_BATCH_SIZE,
+        "excel_engine": EXCEL_ENGINE,
+        "excel_max_rows": EXCEL_MAX_ROWS,
+        "excel_max_columns": EXCEL_MAX_COLUMNS,
+        **loader_options
+    }
+
 
 def get_loader(filepath: str) -> type[CSVDataLoader | ExcelDataLoader]:
     """
@@ -36,9 +74,70 @@ def handle_upload(filepath: str) -> tuple[pd.DataFrame | None, str]:
         # Get appropriate loader based on file extension
         file_loader = get_loader(filepath)()
 
+        if dataset_cache is None:
+            return file_loader.load_data(filepath)
+
+        with open(filepath, "rb") as file:
+            key = cache_key(file, _cache_options(filepath, {}))
+
+        cached = dataset_cache.get(key)
+
+        if cached is not None:
+            return cached, CACHE_HIT_MESSAGE
+
         # Use loader to read the file into a DataFrame
         data, message = file_loader.load_data(filepath)
 
+        if data is not None:
+            dataset_cache.put(key, data)
+
+        return data, message
+    except Exception as e:
+        logger.error(f"Upload failed: {e}")
+        return None, str(e)
+
+
+def handle_upload_stream(
+        filename: str,
+        stream: BinaryIO,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        **loader_options
+) -> tuple[pd.DataFrame | None, str]:
+    """
+    Handles the upload by feeding the raw bytes of the stream to the
+    appropriate file loader in bounded chunks, without writing the file to
+    disk first. Reading stops as soon as the loader rejects the data.
+    The loader options (e.g. the `sheet_name` of an Excel file) are passed
+    to the loader.
+    Seekable streams (such as spooled request bodies) are hashed first, and
+    a file uploaded before is read from the dataset cache without parsing.
+    Returns the DataFrame and a status message.
+    """
+    try:
+        file_loader = get_loader(filename)(**loader_options)
+
+        key = None
+
+        if dataset_cache is not None and stream.seekable():
+            key = cache_key(stream, _cache_options(filename, loader_options))
+            cached = dataset_cache.get(key)
+
+            if cached is not None:
+                logger.info(f"Loaded {filename} from the dataset cache")
+                return cached, CACHE_HIT_MESSAGE
+
+        file_loader.read_stream(stream, chunk_size)
+        data, message = file_loader.finish()
+
+        if file_loader.memory_report is not None:
+            logger.info(
+                f"Optimized the dtypes of {filename}: "
+                f"{file_loader.memory_report}"
+            )
+
+        if data is not None and key is not None:
+            dataset_cache.put(key, data)
+
         return data, message
     except Exception as e:
         logger.error(f"Upload failed: {e}")
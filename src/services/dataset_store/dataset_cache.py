@@ -0,0 +1,267 @@
+"""
+Dataset Cache
+
+Keeps the parsed form of uploaded files on disk, keyed by the SHA-256 of
+the uploaded bytes, so that uploading the same file again costs a hash and
+a memory-mapped read instead of a full parse.
+"""
+
+from abc import ABC, abstractmethod
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import BinaryIO
+
+import pandas as pd
+
+from src.config.settings import (
+    DATASET_CACHE_DIRECTORY,
+    DATASET_CACHE_ENABLED,
+    DATASET_CACHE_MAX_BYTES,
+    DATASET_CACHE_SWEEP_INTERVAL_SECONDS,
+    DATASET_CACHE_TTL_SECONDS
+)
+from src.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bumped whenever the parsing changes in a way that invalidates old entries
+CACHE_FORMAT_VERSION = 1
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def cache_key(stream: BinaryIO, options: dict | None = None) -> str:
+    """
+    Hash the remaining bytes of a seekable stream together with the options
+    they are parsed with, then rewind the stream.
+
+    :param stream: The seekable binary stream of the upload.
+    :param options: The options that influence the parsed result (e.g. the
+    file extension or the selected sheet).
+    :return: The hex digest identifying the parsed result.
+    """
+
+    position = stream.tell()
+    digest = hashlib.sha256()
+
+    for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+
+    stream.seek(position)
+
+    digest.update(json.dumps(
+        {"version": CACHE_FORMAT_VERSION, **(options or {})},
+        sort_keys=True,
+        default=str
+    ).encode())
+
+    return digest.hexdigest()
+
+
+class DatasetCache(ABC):
+    """
+    Abstract base class for dataset caches.
+    This class defines the interface for caching parsed datasets by a
+    content key (see `cache_key`).
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> pd.DataFrame | None:
+        """
+        Retrieve a cached dataset.
+
+        :param key: The content key of the dataset.
+        :return: The cached DataFrame, or None on a miss.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def put(self, key: str, data: pd.DataFrame) -> bool:
+        """
+        Cache a parsed dataset.
+
+        :param key: The content key of the dataset.
+        :param data: The parsed DataFrame.
+        :return: True if the dataset was cached, False if it cannot be.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def sweep(self) -> None:
+        """
+        Remove the expired entries.
+
+        :return: None
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+
+class FeatherDatasetCache(DatasetCache):
+    """
+    Concrete implementation of the DatasetCache that stores every dataset
+    as an uncompressed Feather (Arrow IPC) file, which is memory-mapped when
+    read back and keeps the loaded dtypes (categoricals, Arrow strings,
+    downcast numerics, datetimes).
+
+    The file modification time is the time the entry was stored, used for
+    the `ttl_seconds` expiry, and the access time is updated on every hit,
+    used to evict the least recently used entries once the files take more
+    than `max_bytes`. Expired entries are removed when they are read, when
+    a dataset is cached and by `sweep`.
+    """
+
+    SUFFIX = ".feather"
+
+    def __init__(
+            self,
+            directory: str = DATASET_CACHE_DIRECTORY,
+            max_bytes: int = DATASET_CACHE_MAX_BYTES,
+            ttl_seconds: float = DATASET_CACHE_TTL_SECONDS
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        from pyarrow import feather
+
+        path = self._path(key)
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        if self._is_expired(stat.st_mtime):
+            self._remove(path)
+            return None
+
+        try:
+            table = feather.read_table(path, memory_map=True)
+            data = table.to_pandas(split_blocks=True, self_destruct=True)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+            self._remove(path)
+            return None
+
+        # Mark the entry as recently used, keeping its creation time
+        os.utime(path, (time.time(), stat.st_mtime))
+
+        for col in data.columns[data.dtypes == "string[python]"]:
+            data[col] = data[col].astype("string[pyarrow]")
+
+        return data
+
+    def put(self, key: str, data: pd.DataFrame) -> bool:
+        from pyarrow import feather
+
+        # Arrow files only hold string column names
+        if not all(isinstance(col, str) for col in data.columns):
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.directory,
+            suffix=".tmp"
+        )
+        os.close(file_descriptor)
+
+        try:
+            # Uncompressed so the file can be memory-mapped back
+            feather.write_feather(
+                data,
+                temp_path,
+                compression="uncompressed"
+            )
+            os.replace(temp_path, self._path(key))
+        except Exception as e:
+            logger.warning(f"Failed to cache dataset {key}: {e}")
+            self._remove(temp_path)
+            return False
+
+        self._evict()
+
+        return True
+
+    def sweep(self) -> None:
+        if os.path.isdir(self.directory):
+            self._evict()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return time.time() - created_at > self.ttl_seconds
+
+    def _evict(self) -> None:
+        """
+        Remove the expired entries, then the least recently used ones until
+        the cache fits in `max_bytes`.
+        """
+
+        with self._lock:
+            entries = []
+
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(self.SUFFIX):
+                        continue
+
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+
+                    if self._is_expired(stat.st_mtime):
+                        self._remove(entry.path)
+                    else:
+                        entries.append((stat.st_atime, stat.st_size, entry))
+
+            total = sum(size for _, size, _ in entries)
+
+            for _, size, entry in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+
+                self._remove(entry.path)
+                total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+async def sweep_periodically(
+        cache: DatasetCache,
+        interval_seconds: float = DATASET_CACHE_SWEEP_INTERVAL_SECONDS
+) -> None:
+    """
+    Sweep the cache now and then at every interval, off the event loop,
+    until cancelled.
+
+    :param cache: The cache to sweep.
+    :param interval_seconds: The time between two sweeps.
+    :return: None
+    """
+
+    while True:
+        try:
+            await asyncio.to_thread(cache.sweep)
+        except Exception as e:
+            logger.warning(f"Failed to sweep the dataset cache: {e}")
+
+        await asyncio.sleep(interval_seconds)
+
+
+dataset_cache: DatasetCache | None = \
+    FeatherDatasetCache() if DATASET_CACHE_ENABLED else None
@@ -0,0 +1,164 @@
+"""
+Dataset Store
+
+Keeps parsed datasets on the server so that a file uploaded once can be
+referenced by its dataset ID in later requests (preprocessing, profiling,
+recommendations) instead of being uploaded and parsed again.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import threading
+import time
+import uuid
+
+import pandas as pd
+
+from src.config.settings import (
+    DATASET_STORE_MAX_ENTRIES,
+    DATASET_STORE_TTL_SECONDS
+)
+from src.services.extractor.profiler.data_profile import DataProfile
+
+
+@dataclass
+class StoredDataset:
+    """
+    A parsed dataset held by a DatasetStore.
+    """
+
+    dataset_id: str
+    filename: str
+    data: pd.DataFrame
+    parent_id: str | None = None
+    created_at: float = field(default_factory=time.monotonic)
+    # The DataProfile of the data, computed on first use
+    profile: DataProfile | None = None
+
+
+class DatasetStore(ABC):
+    """
+    Abstract base class for dataset stores.
+    This class defines the interface for storing and retrieving parsed
+    datasets by their ID.
+    """
+
+    @abstractmethod
+    def put(
+            self,
+            data: pd.DataFrame,
+            filename: str,
+            parent_id: str | None = None
+    ) -> StoredDataset:
+        """
+        Store a parsed dataset under a newly generated ID.
+
+        :param data: The parsed DataFrame.
+        :param filename: The name of the file the data originates from.
+        :param parent_id: The ID of the dataset this one was derived from.
+        :return: The stored dataset.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def get(self, dataset_id: str) -> StoredDataset | None:
+        """
+        Retrieve a stored dataset.
+
+        :param dataset_id: The ID returned when the dataset was stored.
+        :return: The stored dataset, or None if it is unknown or expired.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def delete(self, dataset_id: str) -> bool:
+        """
+        Remove a stored dataset.
+
+        :param dataset_id: The ID of the dataset to remove.
+        :return: True if the dataset existed, False otherwise.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+
+class InMemoryDatasetStore(DatasetStore):
+    """
+    Concrete implementation of the DatasetStore that keeps the datasets in
+    process memory.
+
+    Datasets expire `ttl_seconds` after they were stored and, once more
+    than `max_entries` datasets are held, the least recently used ones are
+    evicted.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = DATASET_STORE_MAX_ENTRIES,
+            ttl_seconds: float = DATASET_STORE_TTL_SECONDS
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, StoredDataset] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(
+            self,
+            data: pd.DataFrame,
+            filename: str,
+            parent_id: str | None = None
+    ) -> StoredDataset:
+        entry = StoredDataset(
+            dataset_id=uuid.uuid4().hex,
+            filename=filename,
+            data=data,
+            parent_id=parent_id
+        )
+
+        with self._lock:
+            self._evict_expired()
+            self._entries[entry.dataset_id] = entry
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def get(self, dataset_id: str) -> StoredDataset | None:
+        with self._lock:
+            entry = self._entries.get(dataset_id)
+
+            if entry is None:
+                return None
+
+            if self._is_expired(entry):
+                del self._entries[dataset_id]
+                return None
+
+            self._entries.move_to_end(dataset_id)
+
+            return entry
+
+    def delete(self, dataset_id: str) -> bool:
+        with self._lock:
+            return self._entries.pop(dataset_id, None) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._evict_expired()
+            return len(self._entries)
+
+    def _is_expired(self, entry: StoredDataset) -> bool:
+        return time.monotonic() - entry.created_at > self.ttl_seconds
+
+    def _evict_expired(self) -> None:
+        expired = [
+            dataset_id for dataset_id, entry in self._entries.items()
+            if self._is_expired(entry)
+        ]
+
+        for dataset_id in expired:
+            del self._entries[dataset_id]
+
+
+dataset_store = InMemoryDatasetStore()
@@ -0,0 +1,406 @@
+"""
+Classifies the columns of a dataset into semantic data types (identifiers,
+personal information, categorical, numerical, dates...) with a confidence
+score, to inform the profiling and the visualization recommendations.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import re
+import warnings
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+from src.config.settings import (
+    CATEGORICAL_MAX_CARDINALITY,
+    CATEGORICAL_MAX_UNIQUE_RATIO,
+    CLASSIFIER_MATCH_RATIO,
+    CLASSIFIER_SAMPLE_SIZE,
+    ID_MIN_UNIQUE_RATIO,
+    TEXT_MIN_LENGTH
+)
+
+
+class DataType:
+    """
+    The data types a column can be classified as.
+    """
+
+    ID = "id"
+    PII = "pii"
+    CATEGORICAL = "categorical"
+    NUMERICAL = "numerical"
+    DATETIME = "datetime"
+    TEXT = "text"
+    BOOLEAN = "boolean"
+    GEOSPATIAL = "geospatial"
+    URI = "uri"
+    ARRAY = "array"
+    OTHER = "other"
+
+
+@dataclass
+class TypeClassification:
+    """
+    The data type of a column and how confident the classifier is about
+    it.
+    """
+
+    data_type: str
+    confidence: float
+    # "nominal" or "ordinal" for categorical, "discrete" or "continuous"
+    # for numerical columns
+    subtype: str | None = None
+
+
+# String patterns, checked in order. The first one matched by enough of the
+# sampled values decides the type.
+PATTERNS = [
+    (DataType.ID, re.compile(
+        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+        re.IGNORECASE
+    )),
+    (DataType.PII, re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")),
+    (DataType.URI, re.compile(
+        r"(?:[a-z][a-z0-9+.-]*://|www\.)\S+",
+        re.IGNORECASE
+    )),
+    (DataType.PII, re.compile(
+        r"(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|1?\d?\d)"
+    )),
+    (DataType.GEOSPATIAL, re.compile(
+        r"[(\[]?\s*-?\d{1,2}(?:\.\d+)?\s*,\s*-?\d{1,3}(?:\.\d+)?\s*[)\]]?"
+    )),
+    (DataType.ARRAY, re.compile(r"\[.*\]|\{.*\}", re.DOTALL)),
+    (DataType.PII, re.compile(
+        r"(?:\+\d{1,3}[\s.-]?)?\(?\d{2,5}\)?[\s.-]\d{3,4}[\s.-]?\d{3,4}"
+    )),
+]
+
+# Cheap check that rejects columns which cannot hold dates before trying to
+# parse them
+DATE_PREFILTER = re.compile(
+    r"\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}"
+    r"|\d{1,2}\s+[a-z]{3,9}\.?\s+\d{2,4}"
+    r"|[a-z]{3,9}\.?\s+\d{1,2},?\s+\d{2,4}",
+    re.IGNORECASE
+)
+
+BOOLEAN_TOKENS = {
+    "true", "false", "yes", "no", "y", "n", "t", "f", "0", "1", "on", "off"
+}
+
+# Column names that hint at a type, when the values alone are ambiguous
+ID_NAME = re.compile(r"(?:^|[\s_-])(?:id|uuid|guid|key)$|^id[\s_-]",
+                     re.IGNORECASE)
+PII_NAME = re.compile(
+    r"^(?:(?:first|last|middle|family|full|user)[\s_-]?name|name|surname"
+    r"|forename|address|street|phone|mobile|e?-?mail|ssn|passport)$",
+    re.IGNORECASE
+)
+GEOSPATIAL_NAME = re.compile(
+    r"^(?:country|city|state|region|county|postcode|post[\s_-]?code"
+    r"|postal[\s_-]?code|zip|zip[\s_-]?code|lat|latitude|lon|lng|long"
+    r"|longitude|location|geo)$",
+    re.IGNORECASE
+)
+LATITUDE_NAME = re.compile(r"^lat(?:itude)?$", re.IGNORECASE)
+LONGITUDE_NAME = re.compile(r"^(?:lon|lng|long|longitude)$", re.IGNORECASE)
+
+# Value scales whose order is known, for ordinal categorical columns
+ORDINAL_SCALES = [
+    {"low", "medium", "high"},
+    {"very low", "low", "medium", "high", "very high"},
+    {"small", "medium", "large"},
+    {"xs", "s", "m", "l", "xl", "xxl"},
+    {"never", "rarely", "sometimes", "often", "always"},
+    {"poor", "fair", "good", "very good", "excellent"},
+    {"strongly disagree", "disagree", "neutral", "agree",
+     "strongly agree"},
+    {"beginner", "intermediate", "advanced", "expert"},
+]
+
+
+class DataTypeClassifier(ABC):
+    """
+    Abstract base class for the data type classifiers.
+    """
+
+    @abstractmethod
+    def classify(
+            self,
+            data: pd.DataFrame,
+            cardinality: pd.Series | None = None,
+            num_rows: int | None = None
+    ) -> dict[str, TypeClassification]:
+        """
+        Classify every column of the data.
+
+        :param data: The data, or a sample of its rows.
+        :param cardinality: The distinct counts of the columns over all
+        rows in column order, if known (e.g. from the profile).
+        :param num_rows: The number of rows the cardinality refers to.
+        :return: The TypeClassification of every column.
+        """
+
+
+class TabularDataTypeClassifier(DataTypeClassifier):
+    """
+    Classifies the columns of tabular data from a sample of their values,
+    spread evenly over the rows. Numeric, boolean and datetime dtypes are
+    classified from the dtype and a few vectorized checks. String columns
+    are matched against precompiled patterns with vectorized string
+    methods, and only columns whose values look like dates are parsed.
+
+    The confidence is the share of the sampled values supporting the type,
+    or a fixed lower value for types inferred from the column name or the
+    cardinality alone.
+    """
+
+    def __init__(
+            self,
+            sample_size: int = CLASSIFIER_SAMPLE_SIZE,
+            match_ratio: float = CLASSIFIER_MATCH_RATIO
+    ) -> None:
+        """
+        :param sample_size: The number of values per column inspected.
+        :param match_ratio: The share of the values that must match a
+        pattern.
+        """
+
+        self.sample_size = sample_size
+        self.match_ratio = match_ratio
+
+    def classify(
+            self,
+            data: pd.DataFrame,
+            cardinality: pd.Series | None = None,
+            num_rows: int | None = None
+    ) -> dict[str, TypeClassification]:
+        step = max(len(data) // self.sample_size, 1)
+        sample = data.iloc[::step]
+        num_rows = len(data) if num_rows is None else num_rows
+
+        classifications = {}
+
+        for position, col in enumerate(data.columns):
+            values = sample.iloc[:, position].dropna()
+
+            if cardinality is not None and num_rows:
+                unique_ratio = cardinality.iloc[position] / num_rows
+            else:
+                unique_ratio = _count_distinct(values) / max(len(values), 1)
+
+            classifications[col] = self._classify_column(
+                str(col),
+                data.dtypes.iloc[position],
+                values,
+                unique_ratio
+            )
+
+        return classifications
+
+    def _classify_column(
+            self,
+            name: str,
+            dtype,
+            values: pd.Series,
+            unique_ratio: float
+    ) -> TypeClassification:
+        """
+        :param name: The column name.
+        :param dtype: The dtype of the column.
+        :param values: The sampled non-null values.
+        :param unique_ratio: The share of distinct values in the column.
+        :return: The TypeClassification of the column.
+        """
+
+        if values.empty:
+            return TypeClassification(DataType.OTHER, 0.0)
+
+        if pd.api.types.is_bool_dtype(dtype):
+            return TypeClassification(DataType.BOOLEAN, 1.0)
+
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return TypeClassification(DataType.DATETIME, 1.0)
+
+        if pd.api.types.is_numeric_dtype(dtype):
+            return self._classify_numeric(name, values, unique_ratio)
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            values = values.astype(object)
+
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+
+        if kind == "boolean":
+            return TypeClassification(DataType.BOOLEAN, 1.0)
+
+        if kind in ("datetime", "datetime64", "date"):
+            return TypeClassification(DataType.DATETIME, 1.0)
+
+        if kind in ("integer", "floating", "mixed-integer-float", "decimal"):
+            return self._classify_numeric(
+                name,
+                pd.to_numeric(values),
+                unique_ratio
+            )
+
+        if kind == "mixed":
+            containers = values.map(type).isin([list, tuple, set, dict])
+            if containers.mean() >= self.match_ratio:
+                return TypeClassification(
+                    DataType.ARRAY,
+                    float(containers.mean())
+                )
+
+        classification = self._classify_strings(
+            name,
+            values.astype(str).str.strip(),
+            unique_ratio
+        )
+
+        if classification.data_type == DataType.CATEGORICAL \
+                and getattr(dtype, "ordered", False):
+            classification.subtype = "ordinal"
+
+        return classification
+
+    def _classify_numeric(
+            self,
+            name: str,
+            values: pd.Series,
+            unique_ratio: float
+    ) -> TypeClassification:
+        numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        numbers = numbers[~np.isnan(numbers)]
+
+        if not len(numbers):
+            return TypeClassification(DataType.OTHER, 0.0)
+
+        integral = bool(np.all(np.mod(numbers, 1) == 0))
+        distinct = np.unique(numbers)
+
+        if len(distinct) == 2 and set(distinct) == {0.0, 1.0}:
+            return TypeClassification(DataType.BOOLEAN, 0.9)
+
+        if (LATITUDE_NAME.match(name) and np.all(np.abs(numbers) <= 90)) \
+                or (LONGITUDE_NAME.match(name)
+                    and np.all(np.abs(numbers) <= 180)):
+            return TypeClassification(DataType.GEOSPATIAL, 0.9)
+
+        if integral and unique_ratio >= ID_MIN_UNIQUE_RATIO:
+            if ID_NAME.search(name):
+                return TypeClassification(DataType.ID, 0.95)
+
+            # Sequential keys (the sample keeps the row order)
+            if len(numbers) > 2 and np.all(np.diff(numbers) > 0):
+                return TypeClassification(DataType.ID, 0.8)
+
+        return TypeClassification(
+            DataType.NUMERICAL,
+            1.0,
+            "discrete" if integral else "continuous"
+        )
+
+    def _classify_strings(
+            self,
+            name: str,
+            text: pd.Series,
+            unique_ratio: float
+    ) -> TypeClassification:
+        for data_type, pattern in PATTERNS:
+            matched = text.str.fullmatch(pattern).mean()
+
+            if matched >= self.match_ratio:
+                return TypeClassification(data_type, float(matched))
+
+        lowered = text.str.lower()
+        distinct = lowered.unique()
+
+        if len(distinct) <= 2:
+            matched = lowered.isin(BOOLEAN_TOKENS).mean()
+
+            if matched >= self.match_ratio:
+                return TypeClassification(DataType.BOOLEAN, float(matched))
+
+        parsed = self._parsed_dates(text)
+
+        if parsed >= self.match_ratio:
+            return TypeClassification(DataType.DATETIME, parsed)
+
+        if ID_NAME.search(name) and unique_ratio >= ID_MIN_UNIQUE_RATIO:
+            return TypeClassification(DataType.ID, 0.9)
+
+        if PII_NAME.match(name):
+            return TypeClassification(DataType.PII, 0.8)
+
+        if GEOSPATIAL_NAME.match(name):
+            return TypeClassification(DataType.GEOSPATIAL, 0.8)
+
+        lengths = text.str.len()
+
+        if lengths.median() >= TEXT_MIN_LENGTH:
+            return TypeClassification(
+                DataType.TEXT,
+                float((lengths >= TEXT_MIN_LENGTH).mean())
+            )
+
+        if len(distinct) <= CATEGORICAL_MAX_CARDINALITY \
+                or unique_ratio <= CATEGORICAL_MAX_UNIQUE_RATIO:
+            ordinal = any(set(distinct) <= scale for scale in ORDINAL_SCALES)
+
+            return TypeClassification(
+                DataType.CATEGORICAL,
+                0.9 if len(distinct) <= CATEGORICAL_MAX_CARDINALITY else 0.7,
+                "ordinal" if ordinal else "nominal"
+            )
+
+        if unique_ratio >= ID_MIN_UNIQUE_RATIO \
+                and not text.str.contains(" ", regex=False).any():
+            return TypeClassification(DataType.ID, 0.6)
+
+        if text.str.contains(" ", regex=False).mean() >= self.match_ratio:
+            return TypeClassification(DataType.TEXT, 0.6)
+
+        return TypeClassification(DataType.OTHER, 0.5)
+
+    def _parsed_dates(self, text: pd.Series) -> float:
+        """
+        :param text: The sampled string values of a column.
+        :return: The share of the values that parse as dates.
+        """
+
+        if text.str.match(DATE_PREFILTER).mean() < self.match_ratio:
+            return 0.0
+
+        # Day-first and month-first dates are ambiguous on the first value
+        date_formats = {
+            guess_datetime_format(text.iloc[0], dayfirst=dayfirst) or "mixed"
+            for dayfirst in (False, True)
+        }
+        parsed = 0.0
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            for date_format in date_formats:
+                parsed = max(parsed, float(pd.to_datetime(
+                    text,
+                    format=date_format,
+                    errors="coerce"
+                ).notna().mean()))
+
+        return parsed
+
+
+def _count_distinct(values: pd.Series) -> int:
+    """
+    Count the distinct values, including unhashable ones such as lists.
+    """
+
+    try:
+        return values.nunique()
+    except TypeError:
+        return values.astype(str).nunique()
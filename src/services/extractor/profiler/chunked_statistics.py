@@ -0,0 +1,337 @@
+"""
+Partial column statistics of a dataset that is read in chunks of rows,
+e.g. from `pd.read_csv(chunksize=...)`, so data larger than the memory can
+be profiled in a single pass.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import PROFILER_SAMPLE_SIZE
+from src.services.extractor.profiler.moments import (
+    MOMENTS,
+    central_moments,
+    merge_moments,
+    shape_statistics
+)
+from src.services.extractor.profiler.sketches import (
+    HyperLogLog,
+    ReservoirSample
+)
+
+# The number of leading rows kept as sample records
+HEAD_ROWS = 5
+
+
+class ChunkedStatistics:
+    """
+    Accumulates mergeable statistics over the chunks of a dataset. Every
+    chunk is reduced to partial states that are merged into the running
+    ones, and then dropped:
+
+    - the row and missing value counts, minima, maxima and zero counts,
+    - the central moments of the numeric columns, merged with the pairwise
+      update formulas,
+    - a HyperLogLog sketch (or the set of used categories) per column for
+      the distinct counts,
+    - the co-moment sums of every pair of numeric columns for the Pearson
+      correlations, over the rows where both are present,
+    - a uniform reservoir sample of the rows for the quantiles.
+    """
+
+    def __init__(
+            self,
+            sample_size: int = PROFILER_SAMPLE_SIZE,
+            seed: int | None = None
+    ) -> None:
+        self.num_rows = 0
+        self.columns: pd.Index | None = None
+        self.dtypes: dict = {}
+        self.head: pd.DataFrame | None = None
+        self.missing: pd.Series | None = None
+        self.sampler = ReservoirSample(sample_size, seed=seed)
+
+        self._numeric = pd.Index([])
+        self._moments: dict[str, np.ndarray] = {}
+        self._extremes: dict[str, np.ndarray] = {}
+        self._shift = np.empty(0)
+        self._comoments: dict[str, np.ndarray] = {}
+        self._sketches: dict = {}
+        self._categories: dict = {}
+
+    @classmethod
+    def from_chunks(
+            cls,
+            chunks: Iterable[pd.DataFrame],
+            **options
+    ) -> "ChunkedStatistics":
+        """
+        Accumulate the statistics of all chunks.
+
+        :param chunks: The chunks of rows, all with the same columns.
+        :param options: The options of the ChunkedStatistics.
+        :return: The accumulated statistics.
+        """
+
+        statistics = cls(**options)
+
+        for chunk in chunks:
+            statistics.add(chunk)
+
+        return statistics
+
+    @property
+    def sample(self) -> pd.DataFrame:
+        """
+        :return: The uniform sample of the rows seen so far.
+        """
+
+        if self.sampler.sample is None:
+            return pd.DataFrame(columns=self.columns)
+
+        return self.sampler.sample
+
+    @property
+    def is_complete_sample(self) -> bool:
+        """
+        :return: Whether the sample holds every row seen so far.
+        """
+
+        return len(self.sample) == self.num_rows
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        """
+        Merge the statistics of the next chunk of rows.
+
+        :param chunk: The next rows, with the same columns as the previous
+        chunks.
+        """
+
+        first = self.columns is None
+
+        if first:
+            self.columns = chunk.columns
+            self.dtypes = dict(chunk.dtypes)
+            self.head = chunk.head(HEAD_ROWS)
+            self.missing = pd.Series(0, index=chunk.columns)
+        elif not chunk.columns.equals(self.columns):
+            raise ValueError("All chunks must have the same columns.")
+        else:
+            for col, dtype in chunk.dtypes.items():
+                self.dtypes[col] = _common_dtype(self.dtypes[col], dtype)
+
+            if len(self.head) < HEAD_ROWS:
+                self.head = pd.concat(
+                    [self.head, chunk.head(HEAD_ROWS - len(self.head))]
+                )
+
+        self.num_rows += len(chunk)
+        self.missing += chunk.isna().sum()
+        self.sampler.add(chunk)
+
+        self._add_numeric(chunk, first)
+        self._add_distinct(chunk)
+
+    def moments(self) -> pd.DataFrame:
+        """
+        :return: The exact statistics of the numeric columns: the mean,
+        std, min, max, skewness, kurtosis and zero_count, indexed by
+        column.
+        """
+
+        if not len(self._numeric):
+            return pd.DataFrame(index=self._numeric)
+
+        std, skewness, kurtosis = shape_statistics(self._moments)
+        has_values = self._moments["count"] > 0
+
+        statistics = pd.DataFrame({
+            "mean": self._moments["mean"],
+            "std": std,
+            "min": np.where(has_values, self._extremes["min"], np.nan),
+            "max": np.where(has_values, self._extremes["max"], np.nan),
+            "skewness": skewness,
+            "kurtosis": kurtosis,
+            "zero_count": self._extremes["zero_count"]
+        }, index=self._numeric).astype(object)
+
+        # Keep the integer type of the extremes of integer columns
+        for col in self._numeric:
+            if self.dtypes[col].kind in "biu":
+                for name in ("min", "max"):
+                    value = statistics.loc[col, name]
+                    if not np.isnan(value):
+                        statistics.loc[col, name] = \
+                            self.dtypes[col].type(value)
+
+        return statistics
+
+    def cardinality(self) -> tuple[pd.Series, pd.Series]:
+        """
+        :return: The distinct counts per column and their relative errors.
+        Categorical columns are counted exactly, the others are estimated.
+        """
+
+        cardinality = {}
+        errors = {}
+
+        for col in self.columns:
+            sketch = self._sketches.get(col)
+            categories = self._categories.get(col, set())
+
+            if sketch is None:
+                cardinality[col] = len(categories)
+                errors[col] = 0.0
+                continue
+
+            if categories:
+                sketch.add(pd.Series(list(categories)))
+
+            present = self.num_rows - int(self.missing[col])
+            cardinality[col] = min(sketch.estimate(), present)
+            errors[col] = sketch.relative_error
+
+        return pd.Series(cardinality), pd.Series(errors)
+
+    def correlation(self) -> pd.DataFrame:
+        """
+        :return: The Pearson correlations of the numeric columns over the
+        rows where both columns are present, like `DataFrame.corr`.
+        """
+
+        if not self._comoments:
+            return pd.DataFrame(index=self._numeric, columns=self._numeric)
+
+        n = self._comoments["n"]
+        sx = self._comoments["sx"]
+        sxx = self._comoments["sxx"]
+        sxy = self._comoments["sxy"]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covariance = n * sxy - sx * sx.T
+            variance_x = n * sxx - sx ** 2
+            variance_y = variance_x.T
+            corr = covariance / np.sqrt(variance_x * variance_y)
+
+        corr[(n < 2) | (variance_x <= 0) | (variance_y <= 0)] = np.nan
+        corr = np.clip(corr, -1, 1)
+        np.fill_diagonal(
+            corr,
+            np.where(np.diag(variance_x) > 0, 1.0, np.nan)
+        )
+
+        return pd.DataFrame(corr, index=self._numeric, columns=self._numeric)
+
+    def _add_numeric(self, chunk: pd.DataFrame, first: bool) -> None:
+        numeric = chunk.select_dtypes(include=["number", "bool"]).columns
+
+        if first:
+            self._numeric = numeric
+        elif not self._numeric.isin(numeric).all():
+            # Columns that stop being numeric lose their numeric statistics
+            self._select_numeric(self._numeric.isin(numeric))
+
+        if not len(self._numeric):
+            return
+
+        values = chunk[self._numeric].to_numpy(
+            dtype=np.float64,
+            na_value=np.nan
+        )
+
+        moments = central_moments(values)
+        minimum = np.nanmin(values, axis=0, initial=np.inf)
+        maximum = np.nanmax(values, axis=0, initial=-np.inf)
+        zero_count = (values == 0).sum(axis=0)
+
+        if not self._moments:
+            self._moments = moments
+            self._extremes = {
+                "min": minimum,
+                "max": maximum,
+                "zero_count": zero_count
+            }
+            # The co-moments are accumulated around a fixed shift (the
+            # means of the first chunk) to limit the cancellation errors
+            self._shift = np.nan_to_num(moments["mean"])
+        else:
+            self._moments = merge_moments(self._moments, moments)
+            self._extremes = {
+                "min": np.fmin(self._extremes["min"], minimum),
+                "max": np.fmax(self._extremes["max"], maximum),
+                "zero_count": self._extremes["zero_count"] + zero_count
+            }
+
+        self._add_comoments(values)
+
+    def _add_comoments(self, values: np.ndarray) -> None:
+        if values.shape[1] < 2:
+            return
+
+        shifted = values - self._shift
+        present = (~np.isnan(shifted)).astype(np.float64)
+        shifted = np.nan_to_num(shifted)
+
+        # Entry (i, j) sums over the rows where both i and j are present,
+        # as the missing values are zero in `shifted`
+        comoments = {
+            "n": present.T @ present,
+            "sx": shifted.T @ present,
+            "sxx": (shifted ** 2).T @ present,
+            "sxy": shifted.T @ shifted
+        }
+
+        if not self._comoments:
+            self._comoments = comoments
+        else:
+            for name, value in comoments.items():
+                self._comoments[name] += value
+
+    def _select_numeric(self, keep: np.ndarray) -> None:
+        self._numeric = self._numeric[keep]
+        self._shift = self._shift[keep]
+
+        for name in MOMENTS:
+            self._moments[name] = self._moments[name][keep]
+
+        for name, value in self._extremes.items():
+            self._extremes[name] = value[keep]
+
+        for name, value in self._comoments.items():
+            self._comoments[name] = value[np.ix_(keep, keep)]
+
+    def _add_distinct(self, chunk: pd.DataFrame) -> None:
+        for col in chunk.columns:
+            s = chunk[col]
+
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                codes = s.cat.codes.to_numpy()
+                used = np.unique(codes[codes >= 0])
+                self._categories.setdefault(col, set()).update(
+                    s.cat.categories[used]
+                )
+                continue
+
+            sketch = self._sketches.setdefault(col, HyperLogLog())
+            sketch.add(s, dropna=bool(s.hasnans))
+
+
+def _common_dtype(a, b):
+    """
+    The dtype that holds the values of two chunks of a column.
+    """
+
+    if a == b:
+        return a
+
+    if isinstance(a, np.dtype) and isinstance(b, np.dtype) \
+            and a.kind in "biuf" and b.kind in "biuf":
+        return np.result_type(a, b)
+
+    if isinstance(a, pd.CategoricalDtype) \
+            and isinstance(b, pd.CategoricalDtype):
+        return pd.CategoricalDtype(a.categories.union(b.categories))
+
+    return np.dtype(object)
@@ -0,0 +1,172 @@
+"""
+Correlation discovery between the numeric columns of wide tables.
+
+The correlation matrix is computed in blocks of columns with matrix
+products, and the strongly correlated pairs of each block are extracted
+with vectorized masks, so the full matrix is never held in memory at once
+and no Python-level work is done per pair.
+"""
+
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import (
+    CORRELATION_BLOCK_SIZE,
+    CORRELATION_METHOD,
+    CORRELATION_THRESHOLD,
+    CORRELATION_TOP_K
+)
+
+
+def correlation_blocks(
+        data: pd.DataFrame,
+        method: str = CORRELATION_METHOD,
+        block_size: int = CORRELATION_BLOCK_SIZE,
+        dtype: type = np.float64
+) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Compute the correlation matrix of numeric columns in blocks of rows.
+    Like `DataFrame.corr`, the correlation of two columns only uses the
+    rows where both are present. Without missing values, the columns are
+    standardized once and every block is a single matrix product.
+
+    :param data: The numeric columns.
+    :param method: "pearson" or "spearman". The Spearman correlation ranks
+    each column once, so with missing values it differs slightly from
+    pandas, which ranks the rows of every pair again.
+    :param block_size: The number of matrix rows per block.
+    :param dtype: np.float64, or np.float32 to halve the memory and time at
+    the cost of precision (about 1e-6).
+    :return: An iterator of (first row, block) pairs, where the block holds
+    the correlations of `block_size` columns with all columns.
+    """
+
+    if method not in ("pearson", "spearman"):
+        raise ValueError(f"Unknown correlation method: {method}")
+
+    if method == "spearman":
+        data = data.rank()
+
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Centering keeps the sums small, and constant columns become
+        # exactly zero so their correlations are undefined, like in pandas
+        constant = np.nanmax(values, axis=0, initial=-np.inf) \
+            == np.nanmin(values, axis=0, initial=np.inf)
+        mean = np.nansum(values, axis=0) / present.sum(axis=0)
+        centered = values - mean
+        centered[:, constant] = 0
+
+    num_columns = values.shape[1]
+
+    if present.all():
+        norms = np.sqrt((centered ** 2).sum(axis=0))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            standardized = (centered / norms).astype(dtype)
+
+        for start in range(0, num_columns, block_size):
+            block = standardized[:, start:start + block_size].T \
+                @ standardized
+
+            yield start, np.clip(block, -1, 1, out=block)
+
+        return
+
+    # Entry (i, j) of every product sums over the rows where both i and j
+    # are present, as the missing values are zero in `x` and `x2`
+    x = np.nan_to_num(centered).astype(dtype)
+    x2 = x ** 2
+    mask = present.astype(dtype)
+
+    for start in range(0, num_columns, block_size):
+        stop = start + block_size
+        n = mask[:, start:stop].T @ mask
+        sum_x = x[:, start:stop].T @ mask
+        sum_y = mask[:, start:stop].T @ x
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covariance = n * (x[:, start:stop].T @ x) - sum_x * sum_y
+            variance_x = n * (x2[:, start:stop].T @ mask) - sum_x ** 2
+            variance_y = n * (mask[:, start:stop].T @ x2) - sum_y ** 2
+            block = covariance / np.sqrt(variance_x * variance_y)
+
+        block[(n < 2) | (variance_x <= 0) | (variance_y <= 0)] = np.nan
+
+        yield start, np.clip(block, -1, 1, out=block)
+
+
+def find_correlations(
+        blocks: Iterator[tuple[int, np.ndarray]],
+        columns: pd.Index,
+        threshold: float = CORRELATION_THRESHOLD,
+        top_k: int | None = CORRELATION_TOP_K
+) -> list[dict]:
+    """
+    Extract the strongly correlated column pairs from the blocks of a
+    correlation matrix.
+
+    :param blocks: The (first row, block) pairs, as yielded by
+    `correlation_blocks`.
+    :param columns: The column names of the matrix.
+    :param threshold: The absolute correlation a pair must exceed.
+    :param top_k: If set, only keep the pairs that are among the `top_k`
+    strongest correlations of one of their columns.
+    :return: The pairs in row-major order of the upper triangle, as dicts
+    with the `column_pair` and its rounded `correlation`.
+    """
+
+    rows = []
+    cols = []
+    correlations = []
+
+    for start, block in blocks:
+        strength = np.abs(block)
+        strength[np.isnan(strength)] = -1
+        row_index = np.arange(start, start + len(block))
+
+        # A column does not correlate with itself
+        strength[np.arange(len(block)), row_index] = -1
+
+        keep = strength > threshold
+
+        if top_k is None:
+            keep &= np.arange(strength.shape[1]) > row_index[:, None]
+        elif top_k < strength.shape[1]:
+            partners = np.argpartition(-strength, top_k, axis=1)[:, :top_k]
+            top = np.zeros_like(keep)
+            np.put_along_axis(top, partners, True, axis=1)
+            keep &= top
+
+        i, j = np.nonzero(keep)
+
+        rows.append(row_index[i])
+        cols.append(j)
+        correlations.append(block[i, j])
+
+    if not rows:
+        return []
+
+    i = np.concatenate(rows)
+    j = np.concatenate(cols)
+    correlations = np.concatenate(correlations)
+
+    # In top-k mode a pair is found twice if it is a top pair of both of
+    # its columns
+    pairs, first = np.unique(
+        np.column_stack([np.minimum(i, j), np.maximum(i, j)]),
+        axis=0,
+        return_index=True
+    )
+
+    return [
+        {
+            "column_pair": (columns[a], columns[b]),
+            "correlation": round(float(correlation), 3)
+        }
+        for (a, b), correlation in zip(pairs, correlations[first])
+    ]
@@ -33,6 +33,9 @@ class ColumnProfile(Profile):
         super().__init__()
         self.column_name: str  = ""
         self.column_classification: str = ""
+        self.data_type: str = ""
+        self.data_subtype: Optional[str] = None
+        self.type_confidence: float = 0.0
         self.cardinality: int = 0
         self.uniqueness_ratio: float = 0.0
         self.missing_values: int = 0
@@ -41,11 +44,16 @@ class ColumnProfile(Profile):
         self.is_time_series: bool = False
         self.potential_role: List[str] = []
         self.statistics: Optional[Dict[str, Any]] = None
+        self.is_exact: bool = True
+        self.error_estimates: Dict[str, float] = {}
 
     def to_dict(self):
         return {
             "column_name": self.column_name,
             "column_classification": self.column_classification,
+            "data_type": self.data_type,
+            "data_subtype": self.data_subtype,
+            "type_confidence": self.type_confidence,
             "cardinality": self.cardinality,
             "uniqueness_ratio": self.uniqueness_ratio,
             "missing_values": self.missing_values,
@@ -54,6 +62,8 @@ class ColumnProfile(Profile):
             "is_time_series": self.is_time_series,
             "potential_role": self.potential_role,
             "statistics": self.statistics,
+            "is_exact": self.is_exact,
+            "error_estimates": self.error_estimates,
         }
 
     def to_json(self):
@@ -76,6 +86,8 @@ class DataProfile(Profile):
         self.inter_column_relationships = []
         self.semantic_hints = []
         self.sample_records = []
+        self.is_exact = True
+        self.sample_size = None
 
 
     def __str__(self):
@@ -95,6 +107,8 @@ class DataProfile(Profile):
             "inter_column_relationships": self.inter_column_relationships,
             "semantic_hints": self.semantic_hints,
             "sample_records": self.sample_records,
+            "is_exact": self.is_exact,
+            "sample_size": self.sample_size,
         }
 
     def to_json(self):
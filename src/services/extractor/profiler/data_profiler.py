@@ -4,15 +4,56 @@ by extracting schema, distributional, and statistical insights and storing
 them in a `DataProfile` and `ColumnProfile` data containers.
 """
 
+from collections.abc import Iterable
+import os
+from statistics import NormalDist
+import tempfile
 from typing import List
 
 import numpy as np
 import pandas as pd
 
+from src.config.settings import (
+    CORRELATION_FLOAT32,
+    CORRELATION_SAMPLE_SIZE,
+    PROFILER_APPROXIMATE_MIN_ROWS,
+    PROFILER_BLOCK_BYTES,
+    PROFILER_CONFIDENCE,
+    PROFILER_MODE,
+    PROFILER_PARALLEL,
+    PROFILER_PARALLEL_MIN_COLUMNS,
+    PROFILER_SAMPLE_SIZE,
+    PROFILER_WORKERS
+)
+from src.logging.logger import get_logger
+from src.services.extractor.classifier.data_type_classifier import (
+    DataTypeClassifier,
+    TabularDataTypeClassifier
+)
+from src.services.extractor.profiler.chunked_statistics import (
+    ChunkedStatistics
+)
+from src.services.extractor.profiler.correlation import (
+    correlation_blocks,
+    find_correlations
+)
 from src.services.extractor.profiler.data_profile import (
     DataProfile,
     ColumnProfile
 )
+from src.services.extractor.profiler.moments import (
+    central_moments,
+    shape_statistics
+)
+from src.services.extractor.profiler.sketches import (
+    HyperLogLog,
+    ReservoirSample,
+    dkw_epsilon,
+    dkw_sample_size
+)
+from src.utils.worker_pool import profiler_pool
+
+logger = get_logger("data_profiler_logger")
 
 
 class DataProfiler:
@@ -20,16 +61,70 @@ class DataProfiler:
     Profiles tabular data and extracts features such as column types,
     statistics, cardinality, null distribution, and inferred relationships.
     Stores results into DataProfile and ColumnProfile objects.
+
+    In approximate mode, the distinct counts are estimated with HyperLogLog
+    sketches, and the moments, quantiles and correlations are computed from
+    a uniform sample of the rows. Counts that take a single cheap pass
+    (missing values, minima, maxima, zeros) stay exact. Every ColumnProfile
+    records whether it is exact and the error of its estimates.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    def __init__(
+            self,
+            data: pd.DataFrame | Iterable[pd.DataFrame],
+            mode: str = PROFILER_MODE,
+            sample_size: int = PROFILER_SAMPLE_SIZE,
+            error_bound: float | None = None,
+            seed: int | None = None,
+            workers: int | None = None,
+            classifier: DataTypeClassifier | None = None
+    ):
         """
         Initialize with the DataFrame to be profiled.
 
-        :param data: A pandas DataFrame
+        :param data: A pandas DataFrame, or an iterable of DataFrame chunks
+        with the same columns (e.g. `pd.read_csv(chunksize=...)`). It is
+        only read, never modified. Chunks are profiled in a single pass
+        that keeps at most one chunk and the sample in memory; the profile
+        is exact if all rows fit in the sample and approximate otherwise.
+        :param mode: "exact", "approximate" or "auto", which approximates
+        datasets with more than PROFILER_APPROXIMATE_MIN_ROWS rows.
+        :param sample_size: The number of rows sampled in approximate mode.
+        :param error_bound: The maximum rank error of the approximate
+        quantiles (e.g. 0.01), which sets the sample size instead.
+        :param seed: The seed of the row sampling.
+        :param workers: The number of processes profiling the columns of
+        datasets with at least PROFILER_PARALLEL_MIN_COLUMNS columns. Defaults
+        to PROFILER_WORKERS if PROFILER_PARALLEL is set and 1 otherwise.
+        :param classifier: The classifier of the column data types.
         """
 
-        self.data = data.copy()
+        if mode not in ("exact", "approximate", "auto"):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+
+        if isinstance(data, pd.DataFrame):
+            self.data = data
+            self.chunks = None
+        else:
+            self.data = None
+            self.chunks = data
+
+        if error_bound is not None:
+            sample_size = dkw_sample_size(error_bound, PROFILER_CONFIDENCE)
+
+        self.sample_size = sample_size
+        self.seed = seed
+        self.workers = workers if workers is not None else (
+            PROFILER_WORKERS if PROFILER_PARALLEL else 1
+        )
+        self.classifier = classifier or TabularDataTypeClassifier()
+        self.approximate = self.data is not None \
+            and len(data) > sample_size and (
+                mode == "approximate"
+                or (mode == "auto"
+                    and len(data) > PROFILER_APPROXIMATE_MIN_ROWS)
+            )
+        self._sample: pd.DataFrame | None = None
 
     def generate_profile(self) -> DataProfile:
         """
@@ -42,15 +137,69 @@ class DataProfiler:
         # TODO LOOK INTO THE DATAPREP.EDA LIBRARY AND FIND OUT HOW IT WORKS
 
         profile = DataProfile()
+        correlation = None
+
+        if self.chunks is not None:
+            chunked = ChunkedStatistics.from_chunks(
+                self.chunks,
+                sample_size=self.sample_size,
+                seed=self.seed
+            )
+            self._sample = chunked.sample
+
+            num_rows = chunked.num_rows
+            dtypes = pd.Series(chunked.dtypes, index=chunked.columns)
+            head = chunked.head
+            statistics = chunked_column_statistics(chunked)
+
+            if not chunked.is_complete_sample:
+                correlation = chunked.correlation()
+                profile.is_exact = False
+                profile.sample_size = len(self._sample)
+        else:
+            num_rows = len(self.data)
+            dtypes = self.data.dtypes
+            head = self.data.head(5)
+
+            if self.approximate:
+                sampler = ReservoirSample(self.sample_size, seed=self.seed)
+                sampler.add(self.data)
+                self._sample = sampler.sample
+
+                statistics = self._column_statistics(self.data, self._sample)
+
+                profile.is_exact = False
+                profile.sample_size = len(self._sample)
+            else:
+                statistics = self._column_statistics(self.data)
+
+        profile.num_rows = num_rows
+
+        profile.num_columns = len(dtypes)
+
+        profile.sample_records = head.to_dict(orient="records")
+
+        for col, dtype in dtypes.items():
+            profile.column_profiles.append(
+                self._profile_column(
+                    col,
+                    dtype,
+                    num_rows,
+                    statistics.loc[col]
+                )
+            )
+
+        classifications = self.classifier.classify(
+            self.data if self._sample is None else self._sample,
+            cardinality=statistics["cardinality"],
+            num_rows=num_rows
+        )
 
-        profile.num_rows = self.data.shape[0]
-
-        profile.num_columns = self.data.shape[1]
-
-        profile.sample_records = self.data.head(5).to_dict(orient="records")
-
-        for col in self.data.columns:
-            profile.column_profiles.append(self._profile_column(col))
+        for cp in profile.column_profiles:
+            classification = classifications[cp.column_name]
+            cp.data_type = classification.data_type
+            cp.data_subtype = classification.subtype
+            cp.type_confidence = classification.confidence
 
         profile.column_classifications = (
             self._get_column_classification_summary(profile.column_profiles)
@@ -68,60 +217,107 @@ class DataProfiler:
                 if col.is_time_series
             ]
 
-        profile.inter_column_relationships = self._infer_correlation()
+        profile.inter_column_relationships = self._infer_correlation(
+            correlation
+        )
 
         return profile
 
-    def _profile_column(self, col: str) -> ColumnProfile:
+    def _column_statistics(
+            self,
+            data: pd.DataFrame,
+            sample: pd.DataFrame | None = None
+    ) -> pd.DataFrame:
+        """
+        Compute the statistics of every column, on the process pool if the
+        data is wide enough.
+
+        :param data: The DataFrame to profile.
+        :param sample: A uniform sample of its rows in approximate mode.
+        :return: The statistics, as returned by `compute_column_statistics`
+        or `estimate_column_statistics`.
         """
-        Extract column-level metadata and statistics.
+
+        if self.workers > 1 \
+                and data.shape[1] >= PROFILER_PARALLEL_MIN_COLUMNS:
+            try:
+                return parallel_column_statistics(data, sample, self.workers)
+            except (TypeError, ValueError, NotImplementedError) as e:
+                # Raised by Arrow for columns it cannot represent, e.g.
+                # object columns with mixed types
+                logger.warning(
+                    "Could not share the data with the profiler workers, "
+                    "profiling in a single process: %s",
+                    str(e)
+                )
+
+        if sample is None:
+            return compute_column_statistics(data)
+
+        return estimate_column_statistics(data, sample)
+
+    def _profile_column(
+            self,
+            col: str,
+            dtype,
+            num_rows: int,
+            statistics: pd.Series
+    ) -> ColumnProfile:
+        """
+        Fill the column-level metadata from the precomputed statistics.
 
         :param col: column name
+        :param dtype: The dtype of the column.
+        :param num_rows: The number of rows of the data.
+        :param statistics: The statistics of the column, as computed by
+        `compute_column_statistics`.
         :return: ColumnProfile object
         """
-        s = self.data[col]
         cp = ColumnProfile()
 
         cp.column_name = col
 
-        cp.column_classification = str(s.dtype)
+        cp.column_classification = str(dtype)
 
-        cp.cardinality = s.nunique(dropna=True)
+        cp.cardinality = int(statistics["cardinality"])
 
         cp.uniqueness_ratio = (
-                cp.cardinality / len(s)) if len(s) > 0 else 0.0
+                cp.cardinality / num_rows) if num_rows > 0 else 0.0
 
-        cp.missing_values = s.isna().sum()
+        cp.missing_values = int(statistics["missing_values"])
 
         cp.missing_percentage = (
-                cp.missing_values / len(s) * 100) if len(s) > 0 else 0.0
+                cp.missing_values / num_rows * 100) if num_rows > 0 else 0.0
 
         cp.is_binary = cp.cardinality == 2
 
-        cp.is_time_series = pd.api.types.is_datetime64_any_dtype(s)
+        cp.is_time_series = pd.api.types.is_datetime64_any_dtype(dtype)
 
-        cp.potential_role = self._infer_roles(s, cp)
+        cp.potential_role = self._infer_roles(dtype, cp)
 
-        if pd.api.types.is_numeric_dtype(s):
+        if pd.api.types.is_numeric_dtype(dtype):
             cp.statistics = {
-                "mean": s.mean(),
-                "std": s.std(),
-                "min": s.min(),
-                "max": s.max(),
-                "skewness": s.skew(),
-                "kurtosis": s.kurt(),
-                "zero_count": int((s == 0).sum())
+                name: _to_python(statistics[name])
+                for name in NUMERIC_STATISTICS
             }
         else:
             cp.statistics = {}
 
+        if "is_exact" in statistics:
+            cp.is_exact = bool(statistics["is_exact"])
+            cp.error_estimates = {
+                name: float(statistics[f"{name}_error"])
+                for name in ERROR_ESTIMATES
+                if pd.notna(statistics[f"{name}_error"])
+            }
+
         return cp
 
-    def _infer_roles(self, s: pd.Series, cp: ColumnProfile) -> List[str]:
+    def _infer_roles(self, dtype, cp: ColumnProfile) -> List[str]:
         """
         Heuristics to infer potential roles of a column.
 
-        :param s: Column as pandas Series
+        :param dtype: The dtype of the column
         :param cp: ColumnProfile object
         :return: List of inferred roles
         """
@@ -132,7 +328,7 @@ class DataProfiler:
             roles.append("binary_class")
         elif cp.uniqueness_ratio > 0.9:
             roles.append("identifier")
-        elif pd.api.types.is_numeric_dtype(s):
+        elif pd.api.types.is_numeric_dtype(dtype):
             roles.append("measure")
         else:
             roles.append("dimension")
@@ -160,30 +356,388 @@ class DataProfiler:
             for dtype, count in dtype_counts.items()
         ]
 
-    def _infer_correlation(self) -> List[dict]:
+    def _infer_correlation(
+            self,
+            corr: pd.DataFrame | None = None
+    ) -> List[dict]:
         """
         Infer relationships between numeric columns using correlation.
+        :param corr: The precomputed correlation matrix, if any.
         :return: List of correlation insights
         """
 
-        numeric_df = self.data.select_dtypes(include=np.number)
+        if corr is not None:
+            return find_correlations(
+                [(0, corr.to_numpy(dtype=np.float64))],
+                corr.columns
+            )
+
+        data = self.data if self._sample is None else self._sample
+        numeric_df = data.select_dtypes(include=np.number)
 
         if numeric_df.shape[1] < 2:
             return []
 
-        corr = numeric_df.corr()
-        results = []
-        for i, col1 in enumerate(corr.columns):
-            for j, col2 in enumerate(corr.columns):
-                if j > i:
-                    corr_val = corr.iloc[i, j]
-                    if abs(corr_val) > 0.5:
-                        results.append({
-                            "column_pair": (col1, col2),
-                            "correlation": round(corr_val, 3)
-                        })
-
-        return results
+        if CORRELATION_SAMPLE_SIZE is not None \
+                and len(numeric_df) > CORRELATION_SAMPLE_SIZE:
+            numeric_df = numeric_df.sample(
+                CORRELATION_SAMPLE_SIZE,
+                random_state=self.seed
+            )
+
+        return find_correlations(
+            correlation_blocks(
+                numeric_df,
+                dtype=np.float32 if CORRELATION_FLOAT32 else np.float64
+            ),
+            numeric_df.columns
+        )
+
+
+NUMERIC_STATISTICS = (
+    "mean", "std", "min", "max", "p25", "median", "p75", "skewness",
+    "kurtosis", "zero_count"
+)
+
+QUANTILES = {"p25": 0.25, "median": 0.5, "p75": 0.75}
+
+# The errors reported for approximate statistics: the relative standard
+# error of the distinct count, the rank error of the quantiles and the
+# confidence interval half-width of the mean
+ERROR_ESTIMATES = ("cardinality", "quantile", "mean")
+
+
+def compute_column_statistics(
+        data: pd.DataFrame,
+        block_bytes: int = PROFILER_BLOCK_BYTES
+) -> pd.DataFrame:
+    """
+    Compute the statistics of every column in one sweep. The missing value
+    counts of all columns come from a single reduction and the numeric
+    columns are processed in blocks of the same dtype: each block is sorted
+    once, which gives the distinct counts, minima and maxima, and its
+    moments (mean, variance, skewness, kurtosis) are accumulated together
+    in NumPy. The blocks are limited to about `block_bytes` of values, as
+    their working copies are alive at the same time.
+
+    :param data: The DataFrame to profile.
+    :param block_bytes: The size of the values of a block.
+    :return: A DataFrame indexed by column name with the columns
+    `cardinality`, `missing_values` and the NUMERIC_STATISTICS (NaN for
+    non-numeric columns).
+    """
+
+    numeric = data.select_dtypes(
+        include=["number", "bool"],
+        exclude=["timedelta"]
+    )
+    other = data.columns.difference(numeric.columns, sort=False)
+
+    blocks = [pd.DataFrame(
+        {"cardinality": data[other].nunique(dropna=True)},
+        index=other
+    )]
+
+    width = max(block_bytes // (8 * max(len(data), 1)), 1)
+
+    for _, group in numeric.columns.groupby(numeric.dtypes).items():
+        for start in range(0, len(group), width):
+            columns = group[start:start + width]
+            block = numeric[columns]
+
+            if isinstance(block.dtypes.iloc[0], np.dtype):
+                values = block.to_numpy()
+            else:
+                # Nullable extension dtypes
+                values = block.to_numpy(dtype=np.float64, na_value=np.nan)
+
+            blocks.append(pd.DataFrame(
+                _block_statistics(values),
+                index=columns
+            ).astype(object))
+            del block, values
+
+    statistics = pd.concat(blocks).reindex(
+        index=data.columns,
+        columns=["cardinality", *NUMERIC_STATISTICS]
+    )
+    statistics.insert(1, "missing_values", data.isna().sum())
+
+    return statistics
+
+
+def _block_statistics(values: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Compute the statistics of a 2D block of same-typed numeric columns. The
+    moments use the same bias corrections as pandas.
+
+    :param values: The values, one column per profiled column.
+    :return: The statistics, one array entry per column.
+    """
+
+    num_rows, num_columns = values.shape
+    ordered = np.sort(values, axis=0)
+
+    # Missing values (NaN) are sorted after all present values
+    if values.dtype.kind == "f":
+        present = ~np.isnan(ordered)
+        count = present.sum(axis=0)
+        changes = (ordered[1:] != ordered[:-1]) & present[1:]
+    else:
+        count = np.full(num_columns, num_rows)
+        changes = ordered[1:] != ordered[:-1]
+
+    has_values = count > 0
+    last = np.maximum(count - 1, 0)
+
+    minimum = np.where(has_values, ordered[0], np.nan) \
+        if num_rows else np.full(num_columns, np.nan)
+    maximum = np.where(
+        has_values,
+        ordered[last, np.arange(num_columns)],
+        np.nan
+    ) if num_rows else np.full(num_columns, np.nan)
+
+    if values.dtype.kind != "f" and has_values.all():
+        # Keep the integer (or boolean) type of the extremes
+        minimum = ordered[0]
+        maximum = ordered[-1]
+
+    # Linearly interpolated quantiles of the present values, like pandas
+    quantiles = {}
+
+    for name, q in QUANTILES.items():
+        if not num_rows:
+            quantiles[name] = np.full(num_columns, np.nan)
+            continue
+
+        position = last * q
+        below = np.floor(position).astype(np.intp)
+        above = np.ceil(position).astype(np.intp)
+        columns = np.arange(num_columns)
+        lower = ordered[below, columns].astype(np.float64)
+        upper = ordered[above, columns].astype(np.float64)
+
+        quantiles[name] = np.where(
+            has_values,
+            lower + (upper - lower) * (position - below),
+            np.nan
+        )
+
+    moments = central_moments(values)
+    std, skewness, kurtosis = shape_statistics(moments)
+
+    return {
+        "cardinality": changes.sum(axis=0) + has_values,
+        "mean": moments["mean"],
+        "std": std,
+        "min": minimum,
+        "max": maximum,
+        **quantiles,
+        "skewness": skewness,
+        "kurtosis": kurtosis,
+        "zero_count": (values == 0).sum(axis=0)
+    }
+
+
+def estimate_column_statistics(
+        data: pd.DataFrame,
+        sample: pd.DataFrame,
+        confidence: float = PROFILER_CONFIDENCE
+) -> pd.DataFrame:
+    """
+    Estimate the statistics of every column. The moments and quantiles are
+    computed from a uniform sample of the rows and the distinct counts are
+    estimated with HyperLogLog sketches (categoricals are counted exactly
+    from their codes). The missing value counts, minima, maxima and zero
+    counts are single cheap reductions and computed exactly.
+
+    :param data: The DataFrame to profile.
+    :param sample: A uniform sample of its rows.
+    :param confidence: The confidence of the reported error bounds.
+    :return: The statistics, as returned by `compute_column_statistics`,
+    with the `is_exact` flag and the `<name>_error` estimates of the
+    ERROR_ESTIMATES.
+    """
+
+    statistics = compute_column_statistics(sample)
+    statistics["missing_values"] = data.isna().sum()
+
+    numeric = data.select_dtypes(
+        include=["number", "bool"],
+        exclude=["timedelta"]
+    )
+
+    # Reduced per dtype, so integer extremes are not converted to floats
+    for _, columns in numeric.columns.groupby(numeric.dtypes).items():
+        block = numeric[columns]
+        statistics.loc[columns, "min"] = block.min().astype(object)
+        statistics.loc[columns, "max"] = block.max().astype(object)
+        statistics.loc[columns, "zero_count"] = (block == 0).sum()
+
+    quantile_error = dkw_epsilon(len(sample), confidence)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    population_correction = np.sqrt(1 - len(sample) / max(len(data), 1))
+
+    cardinality = {}
+    cardinality_error = {}
+
+    for col in data.columns:
+        s = data[col]
+
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            codes = s.cat.codes.to_numpy()
+            cardinality[col] = int(np.count_nonzero(
+                np.bincount(codes[codes >= 0], minlength=1)
+            ))
+            cardinality_error[col] = 0.0
+            continue
+
+        missing = int(statistics.loc[col, "missing_values"])
+
+        sketch = HyperLogLog()
+        sketch.add(s, dropna=missing > 0)
+
+        # The estimate cannot exceed the number of present values
+        cardinality[col] = min(sketch.estimate(), len(s) - missing)
+        cardinality_error[col] = sketch.relative_error
+
+    statistics["cardinality"] = pd.Series(cardinality)
+    statistics["is_exact"] = False
+    statistics["cardinality_error"] = pd.Series(cardinality_error)
+    statistics["quantile_error"] = np.nan
+    statistics["mean_error"] = np.nan
+
+    if numeric.shape[1]:
+        std = statistics.loc[numeric.columns, "std"].astype(np.float64)
+        statistics.loc[numeric.columns, "quantile_error"] = quantile_error
+        statistics.loc[numeric.columns, "mean_error"] = \
+            z * std / np.sqrt(len(sample)) * population_correction
+
+    return statistics
+
+
+def chunked_column_statistics(
+        chunked: ChunkedStatistics,
+        confidence: float = PROFILER_CONFIDENCE
+) -> pd.DataFrame:
+    """
+    Combine the statistics accumulated over the chunks of a dataset. If the
+    sample holds every row, the statistics are computed exactly from it.
+    Otherwise the counts, extremes and moments are the exact merged ones,
+    the distinct counts come from the sketches and the quantiles from the
+    sample.
+
+    :param chunked: The statistics accumulated over the chunks.
+    :param confidence: The confidence of the reported error bounds.
+    :return: The statistics, as returned by `estimate_column_statistics`.
+    """
+
+    sample = chunked.sample
+    statistics = compute_column_statistics(sample)
+
+    if chunked.is_complete_sample:
+        return statistics
+
+    moments = chunked.moments()
+    cardinality, cardinality_error = chunked.cardinality()
+
+    statistics[moments.columns] = statistics[moments.columns].astype(object)
+    statistics.loc[moments.index, moments.columns] = moments
+    statistics["missing_values"] = chunked.missing
+    statistics["cardinality"] = cardinality
+    statistics["is_exact"] = False
+    statistics["cardinality_error"] = cardinality_error
+    statistics["quantile_error"] = np.nan
+    statistics["mean_error"] = np.nan
+    statistics.loc[moments.index, "quantile_error"] = \
+        dkw_epsilon(len(sample), confidence)
+
+    return statistics
+
+
+def parallel_column_statistics(
+        data: pd.DataFrame,
+        sample: pd.DataFrame | None = None,
+        workers: int = PROFILER_WORKERS
+) -> pd.DataFrame:
+    """
+    Compute the statistics of batches of columns on the profiler process
+    pool. The data (and the sample) is written once to an uncompressed
+    Arrow IPC file, which every worker memory-maps and reads only its own
+    columns from, so the DataFrame is never pickled.
+
+    :param data: The DataFrame to profile.
+    :param sample: A uniform sample of its rows, to estimate the statistics
+    like `estimate_column_statistics`, or None to compute them exactly.
+    :param workers: The number of column batches.
+    :return: The statistics, in the column order of the data.
+    """
+
+    from pyarrow import feather
+
+    # Arrow requires unique string column names, so the columns are shared
+    # by position
+    names = [str(i) for i in range(data.shape[1])]
+
+    with tempfile.TemporaryDirectory(prefix="profiler-") as directory:
+        paths = []
+
+        for frame in (data, sample):
+            if frame is None:
+                continue
+
+            path = os.path.join(directory, f"{len(paths)}.arrow")
+
+            feather.write_feather(
+                frame.set_axis(names, axis=1, copy=False),
+                path,
+                compression="uncompressed"
+            )
+
+            paths.append(path)
+
+        futures = [
+            profiler_pool.submit(_batch_statistics, paths, batch.tolist())
+            for batch in np.array_split(
+                np.array(names),
+                min(workers, len(names))
+            )
+        ]
+
+        statistics = pd.concat([future.result() for future in futures])
+
+    statistics.index = data.columns
+
+    return statistics
+
+
+def _batch_statistics(paths: list[str], columns: list[str]) -> pd.DataFrame:
+    """
+    Compute the statistics of a batch of columns of the shared data. Runs
+    in a profiler worker process.
+    """
+
+    from pyarrow import feather
+
+    frames = [
+        feather.read_table(path, columns=columns, memory_map=True)
+        .to_pandas()
+        for path in paths
+    ]
+
+    if len(frames) == 1:
+        return compute_column_statistics(frames[0])
+
+    return estimate_column_statistics(*frames)
+
+
+def _to_python(value):
+    """
+    Convert a NumPy scalar to the equivalent Python scalar.
+    """
+
+    return value.item() if isinstance(value, np.generic) else value
 
 
 if __name__ == "__main__":
@@ -0,0 +1,140 @@
+"""
+Vectorized central moments of numeric columns, which can be merged across
+chunks of rows.
+
+The moments of a column are its count, mean and the sums of the 2nd, 3rd
+and 4th powers of the deviations from the mean. Two sets of moments are
+merged with the pairwise update formulas of Chan et al. and Pébay, so the
+moments of a dataset can be accumulated chunk by chunk and give the same
+result as a single pass over all rows.
+"""
+
+import numpy as np
+
+MOMENTS = ("count", "mean", "m2", "m3", "m4")
+
+
+def central_moments(values: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Compute the central moments of a 2D block of numeric columns.
+
+    :param values: The values, one column per profiled column. Missing
+    values must be NaN.
+    :return: The MOMENTS, one array entry per column.
+    """
+
+    # A single work buffer is centered and raised to the powers in place,
+    # so at most two copies of the block are alive at a time
+    x = np.array(values, dtype=np.float64)
+    missing = np.isnan(x)
+    count = (~missing).sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(x, axis=0) / count
+
+        adjusted = np.subtract(x, mean, out=x)
+        adjusted[missing] = 0
+        del missing
+
+        adjusted2 = np.square(adjusted)
+        m2 = adjusted2.sum(axis=0)
+        m3 = np.multiply(adjusted2, adjusted, out=adjusted).sum(axis=0)
+        m4 = np.square(adjusted2, out=adjusted2).sum(axis=0)
+
+    return {
+        "count": count,
+        "mean": mean,
+        "m2": zero_out_fperr(m2),
+        "m3": zero_out_fperr(m3),
+        "m4": m4
+    }
+
+
+def merge_moments(
+        a: dict[str, np.ndarray],
+        b: dict[str, np.ndarray]
+) -> dict[str, np.ndarray]:
+    """
+    Merge the central moments of two disjoint sets of rows.
+
+    :param a: The moments of the first set, as returned by
+    `central_moments`.
+    :param b: The moments of the second set, for the same columns.
+    :return: The moments of the union of both sets.
+    """
+
+    n_a = a["count"].astype(np.float64)
+    n_b = b["count"].astype(np.float64)
+    n = n_a + n_b
+
+    # Columns without values on one side keep the moments of the other
+    mean_a = np.where(n_a > 0, a["mean"], 0.0)
+    mean_b = np.where(n_b > 0, b["mean"], 0.0)
+    m2_a, m3_a, m4_a = (np.nan_to_num(a[k]) for k in ("m2", "m3", "m4"))
+    m2_b, m3_b, m4_b = (np.nan_to_num(b[k]) for k in ("m2", "m3", "m4"))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = mean_b - mean_a
+        delta_n = np.where(n > 0, delta / n, 0.0)
+        delta_n2 = delta_n ** 2
+        product = n_a * n_b
+
+        mean = np.where(n > 0, mean_a + delta_n * n_b, np.nan)
+        m2 = m2_a + m2_b + delta * delta_n * product
+        m3 = m3_a + m3_b \
+            + delta * delta_n2 * product * (n_a - n_b) \
+            + 3 * delta_n * (n_a * m2_b - n_b * m2_a)
+        m4 = m4_a + m4_b \
+            + delta * delta_n2 * delta_n * product \
+            * (n_a ** 2 - product + n_b ** 2) \
+            + 6 * delta_n2 * (n_a ** 2 * m2_b + n_b ** 2 * m2_a) \
+            + 4 * delta_n * (n_a * m3_b - n_b * m3_a)
+
+    return {
+        "count": a["count"] + b["count"],
+        "mean": mean,
+        "m2": zero_out_fperr(m2),
+        "m3": zero_out_fperr(m3),
+        "m4": m4
+    }
+
+
+def shape_statistics(
+        moments: dict[str, np.ndarray]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Derive the standard deviation, skewness and kurtosis from the central
+    moments, with the same bias corrections as pandas.
+
+    :param moments: The moments, as returned by `central_moments`.
+    :return: The standard deviation, skewness and excess kurtosis.
+    """
+
+    count = moments["count"].astype(np.float64)
+    m2, m3, m4 = moments["m2"], moments["m3"], moments["m4"]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(m2 / (count - 1))
+        std[count < 2] = np.nan
+
+        skewness = count * (count - 1) ** 0.5 / (count - 2) \
+            * (m3 / m2 ** 1.5)
+        skewness = np.where(m2 == 0, 0.0, skewness)
+        skewness[count < 3] = np.nan
+
+        numerator = zero_out_fperr(count * (count + 1) * (count - 1) * m4)
+        denominator = zero_out_fperr((count - 2) * (count - 3) * m2 ** 2)
+        kurtosis = numerator / denominator \
+            - 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+        kurtosis = np.where(denominator == 0, 0.0, kurtosis)
+        kurtosis[count < 4] = np.nan
+
+    return std, skewness, kurtosis
+
+
+def zero_out_fperr(values: np.ndarray) -> np.ndarray:
+    """
+    Treat floating point noise around zero as zero, like pandas does.
+    """
+
+    return np.where(np.abs(values) < 1e-14, 0, values)
@@ -0,0 +1,217 @@
+"""
+Sketches
+
+Compact, mergeable summaries of large columns used by the approximate and
+chunked profiling modes.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import HLL_PRECISION
+
+
+class HyperLogLog:
+    """
+    Estimates the number of distinct values of a column in a fixed amount
+    of memory (2 ** precision one-byte registers), with a relative standard
+    error of about 1.04 / sqrt(2 ** precision).
+
+    Values are hashed in bulk with the pandas hashing functions, so adding a
+    column costs one vectorized pass over it. Sketches of different chunks
+    of the same column can be merged.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("The precision must be between 4 and 18")
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """The relative standard error of the estimate."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add(self, values: pd.Series, dropna: bool = True) -> None:
+        """
+        Add the non-null values of a column to the sketch.
+
+        :param values: The values to add.
+        :param dropna: Whether to drop missing values first, which callers
+        that know the column has none can skip.
+        """
+
+        if dropna:
+            values = values.dropna()
+
+        if values.empty:
+            return
+
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        p = np.uint64(self.precision)
+
+        buckets = (hashes >> (np.uint64(64) - p)).astype(np.intp)
+        remaining = hashes << p
+
+        # A register keeps the largest rank (leading zeros + 1) of its
+        # bucket, which belongs to the smallest remaining value, so only
+        # the bucket minima need their leading zeros counted. The remaining
+        # values end in `precision` zero bits, so all ones marks an empty
+        # bucket.
+        empty = np.iinfo(np.uint64).max
+        smallest = np.full(len(self.registers), empty, dtype=np.uint64)
+        np.minimum.at(smallest, buckets, remaining)
+
+        ranks = np.minimum(
+            _leading_zeros(smallest) + 1,
+            64 - self.precision + 1
+        ).astype(np.uint8)
+        ranks[smallest == empty] = 0
+
+        np.maximum(self.registers, ranks, out=self.registers)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """
+        Merge the sketch of another part of the same column into this one.
+
+        :param other: A sketch with the same precision.
+        """
+
+        if other.precision != self.precision:
+            raise ValueError("Only sketches of equal precision can merge")
+
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        """
+        :return: The estimated number of distinct values.
+        """
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(
+            np.int64)))
+
+        empty = int(np.count_nonzero(self.registers == 0))
+
+        # Small cardinalities are estimated more precisely by linear
+        # counting
+        if raw <= 2.5 * m and empty:
+            return round(m * math.log(m / empty))
+
+        return round(raw)
+
+
+class ReservoirSample:
+    """
+    Keeps a uniform random sample of at most `size` rows of a DataFrame
+    that arrives in chunks (Algorithm R, with the replacements of a whole
+    chunk drawn at once).
+    """
+
+    def __init__(self, size: int, seed: int | None = None) -> None:
+        self.size = size
+        self.seen = 0
+        self.sample: pd.DataFrame | None = None
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        """
+        Offer the rows of the next chunk to the sample.
+
+        :param chunk: The next rows.
+        """
+
+        if self.sample is None:
+            if len(chunk) > self.size:
+                # A uniform sample of the first chunk, drawn directly
+                rows = np.sort(self._rng.choice(
+                    len(chunk),
+                    self.size,
+                    replace=False
+                ))
+                self.sample = chunk.take(rows).reset_index(drop=True)
+                self.seen = len(chunk)
+                return
+
+            self.sample = chunk.iloc[:0]
+
+        free = self.size - len(self.sample)
+
+        if free > 0:
+            self.sample = pd.concat(
+                [self.sample, chunk.iloc[:free]],
+                ignore_index=True
+            )
+            self.seen += min(free, len(chunk))
+            chunk = chunk.iloc[free:]
+
+        if chunk.empty:
+            return
+
+        # Row i of the stream replaces a random slot with probability
+        # size / (i + 1)
+        positions = np.arange(self.seen, self.seen + len(chunk))
+        slots = (self._rng.random(len(chunk)) * (positions + 1)).astype(
+            np.int64)
+        replacing = np.flatnonzero(slots < self.size)
+        self.seen += len(chunk)
+
+        if replacing.size == 0:
+            return
+
+        # Later rows overwrite earlier ones drawn for the same slot
+        slots = slots[replacing]
+        _, last = np.unique(slots[::-1], return_index=True)
+        keep = len(slots) - 1 - last
+
+        take = np.arange(len(self.sample))
+        take[slots[keep]] = len(self.sample) + np.arange(len(keep))
+
+        self.sample = pd.concat(
+            [self.sample, chunk.iloc[replacing[keep]]],
+            ignore_index=True
+        ).take(take).reset_index(drop=True)
+
+
+def dkw_epsilon(sample_size: int, confidence: float) -> float:
+    """
+    The Dvoretzky-Kiefer-Wolfowitz bound: with the given confidence, the
+    empirical distribution of a uniform sample is within this distance of
+    the true distribution everywhere, which bounds the rank error of every
+    quantile computed from the sample.
+
+    :param sample_size: The number of sampled values.
+    :param confidence: The probability the bound holds.
+    :return: The maximum rank error, as a fraction of the rows.
+    """
+
+    if sample_size <= 0:
+        return 1.0
+
+    return math.sqrt(math.log(2 / (1 - confidence)) / (2 * sample_size))
+
+
+def dkw_sample_size(epsilon: float, confidence: float) -> int:
+    """
+    The sample size needed for `dkw_epsilon` to be at most `epsilon`.
+    """
+
+    return math.ceil(math.log(2 / (1 - confidence)) / (2 * epsilon ** 2))
+
+
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    """
+    Count the leading zero bits of 64-bit unsigned integers.
+    """
+
+    # frexp gives the exponent e with 2 ** (e - 1) <= value < 2 ** e. The
+    # float conversion keeps the top 53 bits, which only rounds a value up
+    # to the next power of two when all of them are set.
+    _, exponent = np.frexp(values.astype(np.float64))
+
+    return 64 - exponent.astype(np.int64)
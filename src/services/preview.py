@@ -0,0 +1,58 @@
+"""
+Dataset Preview
+
+Builds previews of datasets: a page of rows and a selection of columns,
+encoded to JSON once by pandas. The encoded rows are wrapped as RawJSON, so
+the response embeds them as they are instead of encoding them again.
+"""
+
+import pandas as pd
+
+from src.config.settings import PREVIEW_DEFAULT_ORIENT, PREVIEW_ORIENTS
+from src.utils.custom_responses import RawJSON
+
+
+def build_preview(
+        data: pd.DataFrame,
+        offset: int = 0,
+        limit: int = 10,
+        columns: list[str] | None = None,
+        orient: str = PREVIEW_DEFAULT_ORIENT
+) -> dict:
+    """
+    Build the preview of a page of a dataset.
+
+    :param data: The dataset.
+    :param offset: The position of the first row.
+    :param limit: The number of rows at most.
+    :param columns: The columns to show, all of them if None.
+    :param orient: The layout of the rows (see pandas.DataFrame.to_json).
+    :return: The `rows` as RawJSON, with the `offset`, the `total_rows` and
+    the `columns` shown.
+    :raises ValueError: If the orient is not supported or a column does not
+    exist.
+    """
+
+    if orient not in PREVIEW_ORIENTS:
+        raise ValueError(
+            f"Unsupported orient '{orient}', expected one of: "
+            f"{', '.join(PREVIEW_ORIENTS)}"
+        )
+
+    # Slice the rows first, so only the page is copied by the projection
+    page = data.iloc[offset:offset + limit]
+
+    if columns:
+        missing = [col for col in columns if col not in data.columns]
+
+        if missing:
+            raise ValueError(f"Unknown columns: {', '.join(missing)}")
+
+        page = page[columns]
+
+    return {
+        "offset": offset,
+        "total_rows": len(data),
+        "columns": [str(col) for col in page.columns],
+        "rows": RawJSON(page.to_json(orient=orient, date_format="iso"))
+    }
@@ -1,136 +1,372 @@
-"""from .data_profiler.analyzer import analyze
-
-
-def recommend_graph(df):
-    col_types = analyze(df)
-    recs = []
-
-    numerical = [col for col, t in col_types.items() if t == 'numerical']
-    categorical = [col for col, t in col_types.items() if t == 'categorical']
-    datetime = [col for col, t in col_types.items() if t == 'datetime']
-
-    # Bar Chart
-    if len(categorical) == 1 and len(numerical) == 1:
-        cat_col = categorical[0]
-        num_col = numerical[0]
-        if df[cat_col].nunique() < 30:
-            recs.append({
-                "graph": "Bar Chart",
-                "type": "comparison",
-                "reason": "Bar charts are ideal for showing frequency distribution of categorical values.",
-                "columns": {
-                    "x": cat_col,
-                    "y": num_col
-                }
-            })
-
-    # Pie Chart
-    if len(categorical) == 1 and len(numerical) == 1:
-        cat_col = categorical[0]
-        num_col = numerical[0]
-        if df[cat_col].nunique() < 10:  # Pie charts should have low cardinality
-            recs.append({
-                "graph": "Pie Chart",
-                "type": "composition",
-                "reason": "Pie charts are useful for showing proportions of categories.",
-                "columns": {
-                    "labels": cat_col,
-                    "values": num_col
-                }
-            })
-
-    # Line Graph
-    if len(datetime) == 1 and len(numerical) == 1:
-        recs.append({
-            "graph": "Line Graph",
-            "type": "trend",
-            "reason": "Line graphs are great for showing trends over time.",
-            "columns": {
-                "x": datetime[0],
-                "y": numerical[0]
-            }
-        })
+"""
+Graph Recommender
 
-    # Histogram
-    if len(numerical) == 1 and len(categorical) == 0 and len(datetime) == 0:
-        recs.append({
-            "graph": "Histogram",
-            "type": "distribution",
-            "reason": "Histograms are useful for showing the distribution of numerical data.",
-            "columns": {
-                "x": numerical[0]
-            }
-        })
+Recommends graphs for a dataset from its DataProfile alone, so a
+recommendation never rescans the data and takes microseconds once the
+profile is computed.
 
-    # Scatter Plot
-    if len(numerical) >= 2 and len(categorical) == 0 and len(datetime) == 0:
-        recs.append({
-            "graph": "Scatter Plot",
-            "type": "relationship",
-            "reason": "Scatter plots are ideal for showing relationships between two numerical variables.",
-            "columns": {
-                "x": numerical[0],
-                "y": numerical[1]
-            }
-        })
+The graphs are declared as rules: the data types of the columns they show,
+and constraints on those columns. The rules are indexed by their column
+type signature, so only the rules whose column types are present in the
+dataset are evaluated. Every rule is tried with the combinations of the
+best suited columns of each type and the candidates are ranked by a
+suitability score.
+"""
 
-    # Box Plot
-    if len(numerical) == 1 and len(categorical) == 1:
-        recs.append({
-            "graph": "Box Plot",
-            "type": "distribution",
-            "reason": "Box plots are useful for showing the distribution of numerical data across categories.",
-            "columns": {
-                "x": categorical[0],
-                "y": numerical[0]
-            }
-        })
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+import heapq
+import itertools
 
-    # Heatmap
-    if len(numerical) >= 2 and len(categorical) == 0 and len(datetime) == 0:
-        recs.append({
-            "graph": "Heatmap",
-            "type": "correlation",
-            "reason": "Heatmaps are useful for showing correlations between multiple numerical variables.",
-            "columns": numerical[:],  # full list of numerical cols
-            "correlation": True
-        })
+from src.config.settings import (
+    RECOMMENDER_LIMIT,
+    RECOMMENDER_MAX_COLUMNS_PER_TYPE
+)
+from src.services.extractor.classifier.data_type_classifier import DataType
+from src.services.extractor.profiler.data_profile import (
+    ColumnProfile,
+    DataProfile
+)
 
-    # Area Chart
-    if len(datetime) == 1 and len(numerical) >= 1:
-        recs.append({
-            "graph": "Area Chart",
-            "type": "trend",
-            "reason": "Area charts are useful for showing cumulative totals over time.",
-            "columns": {
-                "x": datetime[0],
-                "y": numerical  # can be a list
-            }
-        })
+# The roles columns of each data type can take in a graph
+GRAPH_TYPES = {
+    DataType.NUMERICAL: "numerical",
+    DataType.CATEGORICAL: "categorical",
+    DataType.BOOLEAN: "categorical",
+    DataType.DATETIME: "datetime",
+    # Regions, cities, countries... (coordinates are filtered out by the
+    # cardinality limits of the categorical roles)
+    DataType.GEOSPATIAL: "categorical",
+}
 
-    # Bubble Chart
-    if len(numerical) >= 3:
-        recs.append({
-            "graph": "Bubble Chart",
-            "type": "relationship",
-            "reason": "Bubble charts are useful for showing relationships between three numerical variables (X, Y, and "
-                      "bubble size).",
-            "columns": {
-                "x": numerical[0],
-                "y": numerical[1],
-                "size": numerical[2]
-            }
-        })
 
-    # Default Fallback
-    if not recs:
-        recs.append({
+@dataclass(frozen=True)
+class GraphRule:
+    """
+    A graph and the columns it can show.
+    """
+
+    graph: str
+    purpose: str
+    reason: str
+    # The (role, graph type) of every column the graph shows
+    roles: tuple[tuple[str, str], ...]
+    # The role that takes all suitable columns of its type as a list
+    many: str | None = None
+    min_many: int = 2
+    # The maximum number of distinct values of the categorical columns
+    max_cardinality: int | None = None
+    # Whether swapping the columns of the same type gives the same graph
+    symmetric: bool = False
+    # Score the columns by their correlation (for relationship graphs)
+    by_correlation: bool = False
+    base_score: float = 1.0
+
+    @property
+    def signature(self) -> tuple[str, ...]:
+        """
+        :return: The sorted graph types of the columns the rule needs.
+        """
+
+        return tuple(sorted(graph_type for _, graph_type in self.roles))
+
+
+RULES = [
+    GraphRule(
+        graph="Bar Chart",
+        purpose="comparison",
+        reason="Bar charts are ideal for comparing a numerical value "
+               "across categories.",
+        roles=(("x", "categorical"), ("y", "numerical")),
+        max_cardinality=30,
+        base_score=0.9
+    ),
+    GraphRule(
+        graph="Pie Chart",
+        purpose="composition",
+        reason="Pie charts are useful for showing proportions of "
+               "categories.",
+        roles=(("labels", "categorical"), ("values", "numerical")),
+        max_cardinality=10,
+        base_score=0.6
+    ),
+    GraphRule(
+        graph="Line Graph",
+        purpose="trend",
+        reason="Line graphs are great for showing trends over time.",
+        roles=(("x", "datetime"), ("y", "numerical")),
+        base_score=1.0
+    ),
+    GraphRule(
+        graph="Area Chart",
+        purpose="trend",
+        reason="Area charts are useful for showing cumulative totals over "
+               "time.",
+        roles=(("x", "datetime"), ("y", "numerical")),
+        many="y",
+        min_many=1,
+        base_score=0.7
+    ),
+    GraphRule(
+        graph="Histogram",
+        purpose="distribution",
+        reason="Histograms are useful for showing the distribution of "
+               "numerical data.",
+        roles=(("x", "numerical"),),
+        base_score=0.8
+    ),
+    GraphRule(
+        graph="Box Plot",
+        purpose="distribution",
+        reason="Box plots are useful for showing the distribution of "
+               "numerical data across categories.",
+        roles=(("x", "categorical"), ("y", "numerical")),
+        max_cardinality=30,
+        base_score=0.8
+    ),
+    GraphRule(
+        graph="Scatter Plot",
+        purpose="relationship",
+        reason="Scatter plots are ideal for showing relationships between "
+               "two numerical variables.",
+        roles=(("x", "numerical"), ("y", "numerical")),
+        symmetric=True,
+        by_correlation=True,
+        base_score=1.0
+    ),
+    GraphRule(
+        graph="Bubble Chart",
+        purpose="relationship",
+        reason="Bubble charts are useful for showing relationships between "
+               "three numerical variables (X, Y, and bubble size).",
+        roles=(("x", "numerical"), ("y", "numerical"),
+               ("size", "numerical")),
+        symmetric=True,
+        by_correlation=True,
+        base_score=0.6
+    ),
+    GraphRule(
+        graph="Heatmap",
+        purpose="correlation",
+        reason="Heatmaps are useful for showing correlations between "
+               "multiple numerical variables.",
+        roles=(("variables", "numerical"),),
+        many="variables",
+        base_score=0.7
+    ),
+]
+
+
+def build_rule_index(rules: list[GraphRule]) -> dict[tuple, list]:
+    """
+    Index the rules by their column type signature.
+
+    :param rules: The graph rules.
+    :return: The rules of every signature.
+    """
+
+    index = defaultdict(list)
+
+    for rule in rules:
+        index[rule.signature].append(rule)
+
+    return dict(index)
+
+
+RULE_INDEX = build_rule_index(RULES)
+
+
+def recommend_graphs(
+        profile: DataProfile,
+        limit: int = RECOMMENDER_LIMIT,
+        rule_index: dict[tuple, list] | None = None
+) -> list[dict]:
+    """
+    Recommend graphs for a profiled dataset.
+
+    :param profile: The DataProfile of the dataset.
+    :param limit: The maximum number of recommendations.
+    :param rule_index: The indexed rules, as built by `build_rule_index`.
+    :return: The recommendations, best first. Each has the `graph`, its
+    `type` (purpose), the `reason`, the `columns` by role and the `score`
+    between 0 and 1. A table is recommended if no graph fits.
+    """
+
+    rule_index = RULE_INDEX if rule_index is None else rule_index
+    candidates = _candidate_columns(profile)
+    available = Counter({
+        graph_type: len(columns) for graph_type, columns in candidates.items()
+    })
+    correlations = {
+        frozenset(r["column_pair"]): abs(r["correlation"])
+        for r in profile.inter_column_relationships
+    }
+
+    scored = []
+    order = itertools.count()
+
+    for signature, rules in rule_index.items():
+        needed = Counter(signature)
+
+        if any(available[t] < n for t, n in needed.items()):
+            continue
+
+        for rule in rules:
+            for columns, score in _evaluate(rule, candidates, correlations):
+                scored.append((score, next(order), rule, columns))
+
+    best = heapq.nlargest(limit, scored, key=lambda item: (
+        item[0], -item[1]))
+
+    recommendations = [
+        {
+            "graph": rule.graph,
+            "type": rule.purpose,
+            "reason": rule.reason,
+            "columns": columns,
+            "score": round(score, 3)
+        }
+        for score, _, rule, columns in best
+    ]
+
+    if not recommendations:
+        recommendations.append({
             "graph": "Table",
             "type": "fallback",
-            "reason": "No suitable graph types could be determined from the dataset. Showing the raw data in tabular "
-                      "form is the safest fallback.",
-            "columns": df.columns.tolist()
+            "reason": "No suitable graph types could be determined from the "
+                      "dataset. Showing the raw data in tabular form is the "
+                      "safest fallback.",
+            "columns": [cp.column_name for cp in profile.column_profiles],
+            "score": 0.0
         })
 
-    return recs
-"""
+    return recommendations
+
+
+def _candidate_columns(profile: DataProfile) -> dict[str, list]:
+    """
+    :return: The best suited columns of every graph type, best first.
+    """
+
+    candidates = defaultdict(list)
+
+    for cp in profile.column_profiles:
+        graph_type = GRAPH_TYPES.get(cp.data_type)
+
+        if graph_type is not None and cp.cardinality > 0:
+            candidates[graph_type].append(cp)
+
+    return {
+        graph_type: sorted(
+            columns,
+            key=_column_quality,
+            reverse=True
+        )[:RECOMMENDER_MAX_COLUMNS_PER_TYPE]
+        for graph_type, columns in candidates.items()
+    }
+
+
+def _column_quality(cp: ColumnProfile) -> float:
+    """
+    :return: How well suited a column is to be shown, between 0 and 1.
+    """
+
+    return cp.type_confidence * (1 - cp.missing_percentage / 100)
+
+
+def _evaluate(
+        rule: GraphRule,
+        candidates: dict[str, list],
+        correlations: dict[frozenset, float]
+):
+    """
+    Try the rule with the combinations of the candidate columns.
+
+    :return: An iterator of the (columns by role, score) that satisfy the
+    rule.
+    """
+
+    fixed_roles = [
+        (role, graph_type) for role, graph_type in rule.roles
+        if role != rule.many
+    ]
+    columns_of = {
+        graph_type: [
+            cp for cp in candidates.get(graph_type, [])
+            if rule.max_cardinality is None or graph_type != "categorical"
+            or cp.cardinality <= rule.max_cardinality
+        ]
+        for _, graph_type in rule.roles
+    }
+
+    # The columns of each graph type, chosen together
+    types = list(dict.fromkeys(graph_type for _, graph_type in fixed_roles))
+    choose = itertools.combinations if rule.symmetric \
+        else itertools.permutations
+    choices = [
+        choose(
+            columns_of[graph_type],
+            sum(t == graph_type for _, t in fixed_roles)
+        )
+        for graph_type in types
+    ]
+
+    for chosen in itertools.product(*choices):
+        remaining = {
+            graph_type: list(columns)
+            for graph_type, columns in zip(types, chosen)
+        }
+        assigned = {
+            role: remaining[graph_type].pop(0)
+            for role, graph_type in fixed_roles
+        }
+        selected = list(assigned.values())
+
+        columns = {role: cp.column_name for role, cp in assigned.items()}
+
+        if rule.many is not None:
+            many_type = dict(rule.roles)[rule.many]
+            # Compared by identity, profiles with equal values are distinct
+            chosen_ids = {id(cp) for cp in selected}
+            many = [
+                cp for cp in columns_of[many_type]
+                if id(cp) not in chosen_ids
+            ]
+
+            if len(many) < rule.min_many:
+                continue
+
+            columns[rule.many] = [cp.column_name for cp in many]
+            selected = selected + many
+
+        yield columns, _score(rule, selected, correlations)
+
+
+def _score(
+        rule: GraphRule,
+        columns: list[ColumnProfile],
+        correlations: dict[frozenset, float]
+) -> float:
+    """
+    :return: The suitability of the graph for the columns, between 0 and 1.
+    """
+
+    score = rule.base_score * sum(
+        _column_quality(cp) for cp in columns
+    ) / len(columns)
+
+    if rule.max_cardinality is not None:
+        # Fewer categories are easier to read
+        for cp in columns:
+            if GRAPH_TYPES.get(cp.data_type) == "categorical":
+                score *= 1 - 0.5 * cp.cardinality / (rule.max_cardinality + 1)
+
+    if rule.by_correlation:
+        strength = max(
+            (correlations.get(frozenset((a.column_name, b.column_name)), 0.0)
+             for a, b in itertools.combinations(columns, 2)),
+            default=0.0
+        )
+        score *= 0.5 + 0.5 * strength
+
+    return score
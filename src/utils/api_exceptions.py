@@ -18,7 +18,8 @@ class ApiException(HTTPException):
         self,
         error_detail: ErrorDetail,
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
-        message: str = "An unexpected error occurred."
+        message: str = "An unexpected error occurred.",
+        headers: Optional[dict[str, str]] = None
     ):
         """
         Initializes the ApiError.
@@ -28,17 +29,23 @@ class ApiException(HTTPException):
             information.
             status_code: The HTTP status code for the response.
             message: A high-level message for the error response.
+            headers: Optional extra headers for the response.
         """
+        self.error_detail = error_detail
+        self.message = message
+
         # Create the full ErrorResponse object
         self.error_response = ErrorResponse(
             message=message,
             status_code=status_code,
-            error=error_detail
+            error=error_detail,
+            headers=headers
         )
 
         super().__init__(
             status_code=status_code,
-            detail=self.error_response
+            detail=self.error_response,
+            headers=headers
         )
 
 
@@ -199,3 +206,74 @@ class ForbiddenException(ApiException):
             message="Permission denied. You do not have access to this "
                     "resource."
         )
+
+
+class ServiceUnavailableException(ApiException):
+    """
+    Custom error class for when the server is too busy to accept more work.
+    Corresponds to HTTP 503 Service Unavailable, telling the client when to
+    retry through the Retry-After header.
+    """
+
+    def __init__(
+        self,
+        details: str = "The server is busy processing other requests.",
+        code: str = "SERVICE_BUSY",
+        retry_after: int = 5,
+        stack_trace: Optional[str] = None
+    ):
+        super().__init__(
+            error_detail=ErrorDetail(
+                code=code,
+                details=details,
+                stack_trace=stack_trace
+            ),
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message="Service temporarily unavailable. Please retry later.",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
+class ProfilingDataException(ApiException):
+    """
+    Custom error class for errors that occur during data profiling.
+    Corresponds to HTTP 422 Unprocessable Entity.
+    """
+    def __init__(
+        self,
+        details: str = "An error occurred while profiling the data.",
+        code: str = "PROFILING_DATA_ERROR",
+        stack_trace: Optional[str] = None
+    ):
+        super().__init__(
+            error_detail=ErrorDetail(
+                code=code,
+                details=details,
+                stack_trace=stack_trace
+            ),
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message="Data profiling failed. Please check your input data."
+        )
+
+
+class RecommendationException(ApiException):
+    """
+    Custom error class for errors that occur while recommending graphs.
+    Corresponds to HTTP 422 Unprocessable Entity.
+    """
+    def __init__(
+        self,
+        details: str = "An error occurred while recommending graphs.",
+        code: str = "RECOMMENDATION_ERROR",
+        stack_trace: Optional[str] = None
+    ):
+        super().__init__(
+            error_detail=ErrorDetail(
+                code=code,
+                details=details,
+                stack_trace=stack_trace
+            ),
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message="Graph recommendation failed. Please check your input "
+                    "data."
+        )
@@ -1,10 +1,13 @@
 """This module defines custom responses for handling API responses."""
 
-import json
+from datetime import date, time
+from typing import Any, Optional
 
-from typing import Any
+import numpy as np
+import orjson
+import pandas as pd
 from pydantic import BaseModel, Field
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from fastapi import status
 
 
@@ -51,7 +54,7 @@ class ErrorDetail(BaseModel):
         description="Detailed error message."
     )
 
-    stack_trace: str = Field(
+    stack_trace: Optional[str] = Field(
         default=None,
         description="Optional stack trace for debugging purposes."
     )
@@ -64,11 +67,119 @@ class ErrorResponseModel(ResponseModel):
         description="An object containing error details."
     )
 
-# ---------------- # Response Classes (extends JSONResponse) ----------------
+# -------------- # Response Classes (extends FastJSONResponse) --------------
 
 
-class SuccessResponse(JSONResponse):
-    """Custom JSON response for successful requests."""
+class RawJSON:
+    """
+    Already encoded JSON, embedded in a response as it is instead of being
+    encoded again.
+    """
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, encoded: str):
+        self.encoded = encoded
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.encoded!r})"
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Convert the objects orjson does not encode natively.
+
+    :param obj: The object to convert.
+    :return: A value orjson can encode.
+    """
+
+    if isinstance(obj, RawJSON):
+        return orjson.Fragment(obj.encoded)
+    if isinstance(obj, (pd.Timestamp, date, time)):
+        return None if pd.isna(obj) else obj.isoformat()
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if isinstance(obj, np.datetime64):
+        return None if np.isnat(obj) else pd.Timestamp(obj).isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return _encode_array(obj)
+    if hasattr(obj, "to_dict"):
+        return _native_keys(obj.to_dict())
+    return str(obj)  # Fallback to string representation
+
+
+def _native_keys(obj: Any) -> Any:
+    """
+    Convert the dict keys orjson does not accept, e.g. NumPy scalars such
+    as the keys of a dict built from an array, in nested dicts and lists.
+    """
+
+    if isinstance(obj, dict):
+        return {
+            encode_default(key)
+            if isinstance(key, (np.generic, pd.Timestamp)) else key:
+            _native_keys(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_native_keys(value) for value in obj]
+    return obj
+
+
+def _encode_array(array: np.ndarray) -> Any:
+    # Booleans and numbers are encoded natively by orjson, NaN as null
+    if array.dtype.kind in "biuf":
+        return orjson.Fragment(orjson.dumps(
+            np.ascontiguousarray(array),
+            option=orjson.OPT_SERIALIZE_NUMPY
+        ))
+
+    # orjson would encode NaT as a date in 1677
+    if array.dtype.kind == "M":
+        dates = pd.DatetimeIndex(array.ravel())
+        array = np.array(
+            [None if pd.isna(value) else value.isoformat()
+             for value in dates],
+            dtype=object
+        ).reshape(array.shape)
+
+    # The items of object arrays are converted one by one by encode_default
+    return array.tolist()
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response encoded once with orjson. NumPy arrays and scalars
+    (also as dict keys), datetimes and RawJSON are encoded natively, and
+    NaN becomes null.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(
+                content,
+                default=encode_default,
+                option=orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # orjson only accepts dict keys of Python types, which are
+            # converted only when needed as it walks the whole content
+            return orjson.dumps(
+                _native_keys(content),
+                default=encode_default,
+                option=orjson.OPT_NON_STR_KEYS
+            )
+
+
+class SuccessResponse(FastJSONResponse):
+    """
+    Custom JSON response for successful requests, shaped as the
+    SuccessResponseModel.
+    """
 
     def __init__(
             self,
@@ -76,63 +187,37 @@ class SuccessResponse(JSONResponse):
             message: str = "Request successful",
             status_code: int = status.HTTP_200_OK
     ):
-        payload = SuccessResponseModel(
-            success=True,
-            message=message,
-            status_code=status_code,
-            data=data
-        )
         super().__init__(
             status_code=status_code,
-            content=payload.model_dump()
+            content={
+                "success": True,
+                "message": message,
+                "status_code": status_code,
+                "data": data
+            }
         )
 
 
-class ErrorResponse(JSONResponse):
-    """Custom JSON response for error handling."""
+class ErrorResponse(FastJSONResponse):
+    """
+    Custom JSON response for error handling, shaped as the
+    ErrorResponseModel.
+    """
 
     def __init__(
             self,
             error: ErrorDetail,
             message: str,
-            status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+            status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers: Optional[dict[str, str]] = None
     ):
-        payload = ErrorResponseModel(
-            success=False,
-            message=message,
-            status_code=status_code,
-            error=error
-        )
         super().__init__(
             status_code=status_code,
-            content=payload.model_dump()
+            content={
+                "success": False,
+                "message": message,
+                "status_code": status_code,
+                "error": error.model_dump()
+            },
+            headers=headers
         )
-
-
-class CustomJSONEncoder(json.JSONEncoder):
-    """
-    Responsible for converting custom JSON response classes into a
-    suitable format.
-    """
-
-    def default(self, obj):
-        """
-        Convert custom objects to a serializable format.
-        """
-
-        if hasattr(obj, "to_dict"):
-            return obj.to_dict()
-        return str(obj)  # Fallback to string representation
-
-
-def ensure_serializable(data):
-    """
-    Checks if the data is serializable, otherwise it will convert it.
-    """
-
-    try:
-        json.dumps(data, cls=CustomJSONEncoder)
-        return data
-    except TypeError:
-        # Convert non-serializable data to string as a fallback
-        return str(data)
@@ -0,0 +1,185 @@
+"""
+Bounded worker pools for running blocking work outside the event loop.
+
+Parsing uploads, preprocessing and profiling are synchronous pandas work.
+Running them directly inside the `async` routes would block the event loop
+and stall every other request, so they are submitted to a worker pool
+instead. Each pool accepts a limited number of jobs at a time and rejects
+further ones with a 503 response, asking the client to retry later.
+"""
+
+import asyncio
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor)
+import threading
+from typing import Any, Callable, TypeVar
+
+from src.config.settings import (
+    PROFILER_WORKERS,
+    WORKER_POOL_KIND,
+    WORKER_POOL_MAX_QUEUE_SIZE,
+    WORKER_POOL_MAX_WORKERS,
+    WORKER_POOL_RETRY_AFTER_SECONDS
+)
+from src.logging.logger import get_logger
+from src.utils import api_exceptions as ae
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerPool:
+    """
+    A thread or process pool that limits the number of running and queued
+    jobs.
+
+    The executor is created on first use, so importing the module does not
+    spawn any workers.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            kind: str = "thread",
+            max_workers: int = WORKER_POOL_MAX_WORKERS,
+            max_queue_size: int = WORKER_POOL_MAX_QUEUE_SIZE,
+            retry_after: int = WORKER_POOL_RETRY_AFTER_SECONDS
+    ) -> None:
+        """
+        :param name: Name of the pool, used for logging.
+        :param kind: Either "thread" or "process".
+        :param max_workers: Number of jobs running at the same time.
+        :param max_queue_size: Number of jobs waiting for a free worker.
+        :param retry_after: Seconds a rejected client should wait.
+        """
+
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unsupported worker pool kind: {kind}")
+
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.retry_after = retry_after
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """The number of jobs currently running or queued."""
+        return self._pending
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run the function in the pool and wait for its result without
+        blocking the event loop.
+
+        Process pools require the function and its arguments to be
+        picklable.
+
+        :param fn: The function to run.
+        :return: The return value of the function.
+        :raises ServiceUnavailableException: If the pool is full.
+        """
+
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue_size:
+                logger.warning(
+                    "Worker pool '%s' is full (%d jobs pending), rejecting "
+                    "request.",
+                    self.name,
+                    self._pending
+                )
+
+                raise ae.ServiceUnavailableException(
+                    retry_after=self.retry_after
+                )
+
+            self._pending += 1
+
+        try:
+            future = self._get_executor().submit(fn, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+
+        # Release the slot once the job is actually done, even if the
+        # awaiting request is cancelled in the meantime
+        future.add_done_callback(self._release)
+
+        return await asyncio.wrap_future(future)
+
+    def submit(
+            self,
+            fn: Callable[..., T],
+            *args: Any,
+            **kwargs: Any
+    ) -> "Future[T]":
+        """
+        Submit a part of a job that was already admitted, e.g. a batch of
+        the work of a running request, bypassing the queue limit.
+
+        :param fn: The function to run.
+        :return: The future of its return value.
+        """
+
+        return self._get_executor().submit(fn, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        """
+        Shut down the executor, waiting for running jobs to complete.
+        """
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=f"{self.name}-worker"
+                    )
+
+            return self._executor
+
+    def _release(self, _future: Future | None = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+# Uploads read from the request stream, which cannot be passed to another
+# process
+upload_pool = WorkerPool("upload", kind="thread")
+
+compute_pool = WorkerPool("compute", kind=WORKER_POOL_KIND)
+
+# Runs the column batches of parallel profiling jobs
+profiler_pool = WorkerPool(
+    "profiler",
+    kind="process",
+    max_workers=PROFILER_WORKERS
+)
+
+
+def shutdown_worker_pools() -> None:
+    """
+    Shut down all worker pools of the application.
+    """
+
+    upload_pool.shutdown()
+    compute_pool.shutdown()
+    profiler_pool.shutdown()
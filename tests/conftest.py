@@ -1,6 +1,20 @@
 import pytest
 
+from src.services.dataset_store.dataset_cache import dataset_cache
+
+
 @pytest.fixture
 def get_sample_data():
     """Returns sample data."""
     return {"a": [1, 2, 3], "b": [4, 5, 6]}
+
+
+@pytest.fixture(autouse=True)
+def isolated_dataset_cache(tmp_path, monkeypatch):
+    """Keeps the dataset cache of every test in a temporary directory."""
+    if dataset_cache is not None:
+        monkeypatch.setattr(
+            dataset_cache,
+            "directory",
+            str(tmp_path / "dataset_cache")
+        )
@@ -13,6 +13,7 @@ from src.services.data_preprocessor.data_normalizer import DataNormalizer
 from src.services.data_preprocessor.data_treatment import DataTreatment
 from src.services.data_preprocessor.preprocessing_handler import (
     PreprocessingHandler)
+from src.services.dataset_store.dataset_store import dataset_store
 from src.utils import api_exceptions as ae
 
 TEST_FILE_PATH = "tests/test_data_files/test-data-0.csv"
@@ -40,19 +41,35 @@ class DummyTreatment(DataTreatment):
 
 class DummyNormalizer(DataNormalizer):
     """Dummy class for testing"""
-    def normalize(self, data):
+    is_fitted = True
+
+    def fit(self, data):
+        return self
+
+    def transform(self, data):
         data = data.copy()
-        data["normalized"] = data.mean(axis=1)
+        data["normalized"] = data.mean(axis=1, numeric_only=True)
         return data
 
+    def to_dict(self):
+        return {}
+
 
 class DummyEncoder(DataEncoder):
     """Dummy class for testing"""
-    def encode(self, data):
+    is_fitted = True
+
+    def fit(self, data):
+        return self
+
+    def transform(self, data):
         data = data.copy()
         data["encoded"] = 42
         return data
 
+    def to_dict(self):
+        return {}
+
 
 class TestPreprocessorService:
     """
@@ -98,6 +115,44 @@ class TestPreprocessorService:
             with pytest.raises(ae.BadRequestException):
                 await preprocess_data_request(dummy_file)
 
+    @pytest.mark.asyncio
+    async def test_preprocess_success_stored_dataset(
+            self,
+            get_sample_data
+    ) -> None:
+        """
+        Should preprocess a previously uploaded dataset referenced by its ID
+        without modifying it, and store the result as a new dataset.
+        :return: None
+        """
+
+        df = pd.DataFrame(get_sample_data)
+        stored_dataset = dataset_store.put(df, "file.csv")
+
+        result = await preprocess_data_request(
+            dataset_id=stored_dataset.dataset_id
+        )
+
+        assert result["source_dataset_id"] == stored_dataset.dataset_id
+        assert result["filename"] == "file.csv"
+        assert dataset_store.get(result["dataset_id"]).parent_id == \
+            stored_dataset.dataset_id
+        pd.testing.assert_frame_equal(df, pd.DataFrame(get_sample_data))
+
+    @pytest.mark.asyncio
+    async def test_preprocess_failure_unknown_dataset(
+            self
+    ) -> None:
+        """
+        Should raise a NotFoundException for an unknown dataset ID.
+        :return: None
+        """
+
+        with pytest.raises(ae.NotFoundException) as exc:
+            await preprocess_data_request(dataset_id="unknown")
+
+        assert exc.value.status_code == 404
+
     def test_preprocess_failure_fails_preprocessor_validation(
             self,
             get_sample_data
@@ -173,17 +228,35 @@ class TestPreprocessorService:
         assert isinstance(result, pd.DataFrame)
 
     def test_data_encoder(
-            self
+            self,
+            get_sample_data
     ) -> None:
         """
         Should return the encoded data.
         :return: None
         """
 
+        handler = PreprocessingHandler(
+            checks=[DummyCheck()],
+            treatments=[],
+            encoder=DummyEncoder()
+        )
+        result = handler.preprocess_data(pd.DataFrame(get_sample_data))
+        assert (result["encoded"] == 42).all()
+
     def test_data_normalizer(
-            self
+            self,
+            get_sample_data
     ) -> None:
         """
         Should return the normalized data.
         :return: None
         """
+
+        handler = PreprocessingHandler(
+            checks=[DummyCheck()],
+            treatments=[],
+            normalizer=DummyNormalizer()
+        )
+        result = handler.preprocess_data(pd.DataFrame(get_sample_data))
+        assert "normalized" in result.columns
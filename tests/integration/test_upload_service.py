@@ -14,7 +14,7 @@ from src.services.data_uploader.upload_handler import get_loader
 class TestUploadService:
     """Unit tests for the test service"""
 
-    @patch("src.controllers.upload_controller.UploadFile")
+    @patch("src.api.v1.controllers.upload_controller.UploadFile")
     async def test_upload_failure_no_file_selected(
             self,
             mock_upload_file
@@ -33,7 +33,7 @@ class TestUploadService:
         assert isinstance(exc_info.value, ae.BadRequestException)
         assert "No file selected" in str(exc_info.value.detail)
 
-    @patch("src.controllers.upload_controller.UploadFile")
+    @patch("src.api.v1.controllers.upload_controller.UploadFile")
     async def test_upload_failure_invalid_file_format(
             self,
             mock_upload_file
@@ -51,8 +51,8 @@ class TestUploadService:
         assert isinstance(exc_info.value, ae.BadRequestException)
         assert "Invalid file format" in str(exc_info.value.detail)
 
-    @patch("src.controllers.upload_controller.handle_upload")
-    @patch("src.controllers.upload_controller.UploadFile")
+    @patch("src.api.v1.controllers.upload_controller.handle_upload_stream")
+    @patch("src.api.v1.controllers.upload_controller.UploadFile")
     async def test_upload_failure_read_data_failure(
             self,
             mock_upload_file,
@@ -75,8 +75,8 @@ class TestUploadService:
 
         assert "Read error" in str(exc_info.value.detail)
 
-    @patch("src.controllers.upload_controller.handle_upload")
-    @patch("src.controllers.upload_controller.UploadFile")
+    @patch("src.api.v1.controllers.upload_controller.handle_upload_stream")
+    @patch("src.api.v1.controllers.upload_controller.UploadFile")
     async def test_upload_failure_handle_upload_failure(
             self,
             mock_upload_file,
@@ -98,8 +98,8 @@ class TestUploadService:
 
         assert "No data found" in str(exc_info.value.detail)
 
-    @patch("src.controllers.upload_controller.handle_upload")
-    @patch("src.controllers.upload_controller.UploadFile")
+    @patch("src.api.v1.controllers.upload_controller.handle_upload_stream")
+    @patch("src.api.v1.controllers.upload_controller.UploadFile")
     async def test_upload_failure_no_data_exists(
             self,
             mock_upload_file,
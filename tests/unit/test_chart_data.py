@@ -0,0 +1,191 @@
+"""Test suite for the chart data preparation."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.chart_data import (
+    OTHER_CATEGORY,
+    lttb,
+    min_max_downsample,
+    prepare_chart_data)
+from src.services.extractor.profiler.data_profiler import DataProfiler
+from src.services.recommender import recommend_graphs
+
+
+@pytest.fixture
+def large_data():
+    """Returns a dataset larger than the point budget."""
+    rng = np.random.default_rng(0)
+    num_rows = 20_000
+    x = rng.normal(0, 1, num_rows)
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=num_rows, freq="min"),
+        "region": rng.choice([f"r{i}" for i in range(30)], num_rows),
+        "x": x,
+        "y": 2 * x + rng.normal(0, 0.5, num_rows),
+        "size": rng.uniform(1, 5, num_rows)
+    })
+
+
+class TestDownsampling:
+    """
+    Test suite for the line downsampling algorithms.
+    """
+
+    def test_lttb_keeps_endpoints_and_peaks(self) -> None:
+        """
+        Should keep the first and last points and a spike within the budget.
+        :return: None
+        """
+
+        x = np.arange(10_000, dtype=float)
+        y = np.sin(x / 500)
+        y[4321] = 50
+
+        kept = lttb(x, y, 100)
+
+        assert len(kept) == 100
+        assert kept[0] == 0 and kept[-1] == 9_999
+        assert 4321 in kept
+        assert np.all(np.diff(kept) > 0)
+
+    def test_min_max_keeps_extremes(self) -> None:
+        """
+        Should keep the minimum and maximum of every bucket.
+        :return: None
+        """
+
+        y = np.random.default_rng(1).normal(0, 1, 10_000)
+
+        kept = min_max_downsample(y, 200)
+
+        assert len(kept) <= 200
+        assert np.argmax(y) in kept and np.argmin(y) in kept
+
+    def test_small_series_unchanged(self) -> None:
+        """
+        Should keep every point of series within the budget.
+        :return: None
+        """
+
+        y = np.arange(10, dtype=float)
+
+        assert len(lttb(y, y, 100)) == 10
+        assert len(min_max_downsample(y, 100)) == 10
+
+
+class TestPrepareChartData:
+    """
+    Test suite for prepare_chart_data.
+    """
+
+    def test_line_within_budget(self, large_data) -> None:
+        """
+        Should downsample a line graph to the point budget with ISO dates.
+        :return: None
+        """
+
+        result = prepare_chart_data(
+            large_data,
+            {"graph": "Line Graph", "columns": {"x": "date", "y": "y"}},
+            max_points=500
+        )
+
+        assert result["kind"] == "series" and result["reduced"]
+        assert len(result["x"]) == len(result["y"]["y"]) == 500
+        assert result["x"][0] == "2024-01-01T00:00:00"
+
+    def test_histogram_counts_all_rows(self, large_data) -> None:
+        """
+        Should bin every value into at most the maximum number of bins.
+        :return: None
+        """
+
+        result = prepare_chart_data(
+            large_data,
+            {"graph": "Histogram", "columns": {"x": "x"}}
+        )
+
+        assert sum(result["counts"]) == len(large_data)
+        assert len(result["edges"]) == len(result["counts"]) + 1
+        assert len(result["counts"]) <= 50
+
+    def test_aggregates_fold_other_categories(self, large_data) -> None:
+        """
+        Should aggregate by category and fold the smallest ones together.
+        :return: None
+        """
+
+        pie = prepare_chart_data(
+            large_data,
+            {"graph": "Pie Chart",
+             "columns": {"labels": "region", "values": "size"}}
+        )
+
+        assert len(pie["categories"]) == 20
+        assert pie["categories"][-1] == OTHER_CATEGORY
+        assert sum(pie["values"]) == pytest.approx(large_data["size"].sum())
+
+    def test_box_plot_summary(self) -> None:
+        """
+        Should summarize each category by its quartiles, whiskers and
+        outliers.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "group": ["a"] * 9 + ["b"] * 3,
+            "value": [1, 2, 3, 4, 5, 6, 7, 8, 100, 1, 2, 3]
+        })
+
+        result = prepare_chart_data(
+            data,
+            {"graph": "Box Plot", "columns": {"x": "group", "y": "value"}}
+        )
+
+        assert result["categories"] == ["a", "b"]
+        assert result["median"] == [5.0, 2.0]
+        assert result["upper_whisker"] == [8.0, 3.0]
+        assert result["outliers"] == [1, 0]
+
+    def test_dense_scatter_becomes_grid(self, large_data) -> None:
+        """
+        Should turn a dense scatter plot into a density grid and keep small
+        ones as points.
+        :return: None
+        """
+
+        columns = {"x": "x", "y": "y", "size": "size"}
+
+        grid = prepare_chart_data(
+            large_data,
+            {"graph": "Bubble Chart", "columns": columns},
+            max_points=400
+        )
+        points = prepare_chart_data(
+            large_data.head(100),
+            {"graph": "Bubble Chart", "columns": columns},
+            max_points=400
+        )
+
+        assert grid["kind"] == "density"
+        assert len(grid["count"]) <= 400
+        assert sum(grid["count"]) == len(large_data)
+        assert points["kind"] == "points" and len(points["x"]) == 100
+
+    def test_every_recommendation_serializable(self, large_data) -> None:
+        """
+        Should prepare JSON serializable data for every recommendation.
+        :return: None
+        """
+
+        profile = DataProfiler(large_data).generate_profile()
+
+        for recommendation in recommend_graphs(profile, limit=50):
+            result = prepare_chart_data(large_data, recommendation)
+
+            assert result["total_rows"] == len(large_data)
+            json.dumps(result)
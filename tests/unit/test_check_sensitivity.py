@@ -0,0 +1,168 @@
+"""Test suite for the PII detection."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.data_sensitivity import check_sensitivity as cs
+from src.services.data_sensitivity.check_sensitivity import (
+    PIIScanner,
+    check_sensitivity)
+
+
+class FakeAnalyzer:
+    """
+    Stands in for the Presidio batch analyzer, finding a person in every
+    value with a capitalized word.
+    """
+
+    def __init__(self) -> None:
+        self.texts = []
+
+    def analyze_iterator(self, texts, language, **kwargs):
+        self.texts.extend(texts)
+        return [
+            [SimpleNamespace(entity_type="PERSON", score=0.85)]
+            if any(word.istitle() for word in text.split()) else []
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """Replaces the Presidio analyzer with a fake one."""
+    fake = FakeAnalyzer()
+    monkeypatch.setattr(cs, "get_analyzer", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def customers():
+    """Returns customer data with personal information in some columns."""
+    num_rows = 10_000
+    return pd.DataFrame({
+        "customer_id": np.arange(num_rows),
+        "Contact Email": [f"user{i}@example.com" for i in range(num_rows)],
+        "contact": [f"+44 20 {7000 + i % 999} {1000 + i % 8999}"
+                    for i in range(num_rows)],
+        "plan": np.random.default_rng(0).choice(["free", "pro"], num_rows),
+        "notes": [f"called Alice Smith about order {i}"
+                  for i in range(num_rows)],
+        "amount": np.random.default_rng(1).uniform(0, 100, num_rows)
+    })
+
+
+class TestPIIScanner:
+    """
+    Test suite for the tiered PII scanner.
+    """
+
+    def test_tiers(self, customers, analyzer) -> None:
+        """
+        Should flag columns by name, by value pattern and by the analyzer,
+        and leave the other columns alone.
+        :return: None
+        """
+
+        findings = PIIScanner(sample_size=200).scan(customers)
+
+        assert set(findings) == {"Contact Email", "contact", "notes"}
+        assert findings["Contact Email"].method == "name"
+        assert findings["contact"].entity == "PHONE_NUMBER"
+        assert findings["contact"].method == "pattern"
+        assert findings["notes"].entity == "PERSON"
+        assert findings["notes"].method == "analyzer"
+
+    def test_only_ambiguous_columns_analyzed(self, customers,
+                                             analyzer) -> None:
+        """
+        Should analyze only a bounded sample of the ambiguous text columns.
+        :return: None
+        """
+
+        PIIScanner(sample_size=200).scan(customers)
+
+        assert 0 < len(analyzer.texts) <= 200
+        assert all(text.startswith("called") for text in analyzer.texts)
+
+    def test_cached_by_column_signature(self, customers, analyzer) -> None:
+        """
+        Should reuse the scan of a column with the same name, dtype and
+        sampled values.
+        :return: None
+        """
+
+        scanner = PIIScanner(sample_size=200)
+        first = scanner.scan(customers)
+        analyzed = len(analyzer.texts)
+
+        assert scanner.scan(customers.copy()) == first
+        assert len(analyzer.texts) == analyzed
+
+        changed = customers.assign(notes="nothing to report")
+
+        assert "notes" not in scanner.scan(changed)
+
+    def test_names_of_things_not_flagged(self) -> None:
+        """
+        Should flag person name columns by their name, but not the names of
+        things, whose values are checked instead.
+        :return: None
+        """
+
+        scanner = PIIScanner(use_analyzer=False)
+        things = [
+            "product_name", "company_name", "file_name", "city_name",
+            "country_name", "dataset_name"
+        ]
+        people = ["name", "First Name", "customer_name", "surname"]
+        data = pd.DataFrame({
+            column: ["alpha", "beta", "gamma"] for column in things + people
+        })
+
+        findings = scanner.scan(data)
+
+        assert list(findings) == people
+        assert all(finding.entity == "PERSON" for finding in findings.values())
+
+    def test_card_numbers_checked(self) -> None:
+        """
+        Should flag card numbers passing the Luhn check and not other long
+        numbers.
+        :return: None
+        """
+
+        scanner = PIIScanner(use_analyzer=False)
+        data = pd.DataFrame({
+            "payment": ["4111 1111 1111 1111", "5500-0000-0000-0004"] * 5,
+            "reference": ["4111 1111 1111 1112", "1234567890123"] * 5
+        })
+
+        findings = scanner.scan(data)
+
+        assert list(findings) == ["payment"]
+        assert findings["payment"].entity == "CREDIT_CARD"
+
+    def test_without_analyzer(self, customers, monkeypatch) -> None:
+        """
+        Should fall back to the name and pattern checks when the analyzer
+        is unavailable.
+        :return: None
+        """
+
+        monkeypatch.setattr(cs, "get_analyzer", lambda: None)
+
+        findings = PIIScanner(sample_size=200).scan(customers)
+
+        assert set(findings) == {"Contact Email", "contact"}
+
+    def test_check_sensitivity(self, customers, analyzer) -> None:
+        """
+        Should tell whether any column holds personal information.
+        :return: None
+        """
+
+        assert check_sensitivity(customers)
+        assert not check_sensitivity(customers[["plan", "amount"]])
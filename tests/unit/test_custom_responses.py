@@ -0,0 +1,142 @@
+"""Test suite for the custom API responses."""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.utils.custom_responses import (
+    ErrorDetail,
+    ErrorResponse,
+    SuccessResponse)
+
+
+class TestFastJSONResponse:
+    """
+    Test suite for the orjson encoded responses.
+    """
+
+    def test_success_envelope(self) -> None:
+        """
+        Should wrap the data in the success envelope.
+        :return: None
+        """
+
+        response = SuccessResponse(data={"a": 1}, message="Done")
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "success": True,
+            "message": "Done",
+            "status_code": 200,
+            "data": {"a": 1}
+        }
+
+    def test_encodes_numpy_and_pandas_values(self) -> None:
+        """
+        Should encode NumPy and pandas values natively, NaN and missing
+        values as null.
+        :return: None
+        """
+
+        response = SuccessResponse(data={
+            "count": np.int64(3),
+            "mean": np.float32(1.5),
+            "flag": np.bool_(True),
+            "values": np.array([1.0, np.nan]),
+            "missing": [float("nan"), pd.NA, pd.NaT],
+            "created": pd.Timestamp("2024-01-01 12:30"),
+            "series": pd.Series([1, 2], index=["x", "y"]),
+            1: "non-string key"
+        })
+
+        assert json.loads(response.body)["data"] == {
+            "count": 3,
+            "mean": 1.5,
+            "flag": True,
+            "values": [1.0, None],
+            "missing": [None, None, None],
+            "created": "2024-01-01T12:30:00",
+            "series": {"x": 1, "y": 2},
+            "1": "non-string key"
+        }
+
+    def test_error_envelope(self) -> None:
+        """
+        Should wrap the error details in the error envelope.
+        :return: None
+        """
+
+        response = ErrorResponse(
+            error=ErrorDetail(code="BAD_REQUEST", details="Invalid"),
+            message="Bad request",
+            status_code=400,
+            headers={"Retry-After": "5"}
+        )
+
+        assert response.status_code == 400
+        assert response.headers["retry-after"] == "5"
+        assert json.loads(response.body)["error"] == {
+            "code": "BAD_REQUEST",
+            "details": "Invalid",
+            "stack_trace": None
+        }
+
+    def test_encodes_not_a_time_as_null(self) -> None:
+        """
+        Should encode NaT scalars and NaT in datetime arrays as null.
+        :return: None
+        """
+
+        response = SuccessResponse(data={
+            "scalar": np.datetime64("NaT"),
+            "date": np.datetime64("2024-01-01T12:30"),
+            "dates": np.array(
+                ["2024-01-01T12:30", "NaT"], dtype="datetime64[ns]"
+            )
+        })
+
+        assert json.loads(response.body)["data"] == {
+            "scalar": None,
+            "date": "2024-01-01T12:30:00",
+            "dates": ["2024-01-01T12:30:00", None]
+        }
+
+    def test_encodes_object_arrays_by_item(self) -> None:
+        """
+        Should encode object arrays as lists of their encoded items.
+        :return: None
+        """
+
+        response = SuccessResponse(data={
+            "mixed": np.array([1, None, "a", pd.NaT], dtype=object),
+            "grid": np.arange(6).reshape(2, 3)[:, ::2]
+        })
+
+        assert json.loads(response.body)["data"] == {
+            "mixed": [1, None, "a", None],
+            "grid": [[0, 2], [3, 5]]
+        }
+
+    def test_encodes_numpy_keys(self) -> None:
+        """
+        Should encode dicts keyed by NumPy scalars, also nested and as
+        returned by `to_dict`.
+        :return: None
+        """
+
+        counts = dict(zip(*np.unique([3, 1, 3], return_counts=True)))
+
+        response = SuccessResponse(data={
+            "counts": counts,
+            "nested": [{np.float64(0.5): "half", np.bool_(True): "yes"}],
+            "dates": {np.datetime64("2024-01-01"): 1},
+            "frame": pd.DataFrame({np.int64(1): [2]}).T
+        })
+
+        assert json.loads(response.body)["data"] == {
+            "counts": {"1": 1, "3": 2},
+            "nested": [{"0.5": "half", "true": "yes"}],
+            "dates": {"2024-01-01T00:00:00": 1},
+            "frame": {"0": {"1": 2}}
+        }
@@ -0,0 +1,270 @@
+"""Test suite for the data encoders."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.data_preprocessor.data_encoder import (
+    ENCODERS,
+    CardinalityEncoder,
+    FrequencyEncoder,
+    HashingEncoder,
+    LabelEncodingEncoder,
+    OneHotEncoder,
+    TargetEncoder)
+from src.services.extractor.profiler.data_profiler import DataProfiler
+
+
+@pytest.fixture
+def categorical_data():
+    """Returns data with object, categorical and numeric columns."""
+    return pd.DataFrame({
+        "color": ["red", "blue", None, "green", "blue"],
+        "size": pd.Categorical(["S", "M", "L", "M", "S"]),
+        "price": [1.0, 2.0, 3.0, 4.0, 5.0]
+    })
+
+
+class TestLabelEncodingEncoder:
+    """
+    Test suite for the LabelEncodingEncoder.
+    """
+
+    def test_encodes_categorical_columns(self, categorical_data) -> None:
+        """
+        Should replace the categorical values by their position in the
+        sorted vocabulary, missing values by -1, without changing the input.
+        :return: None
+        """
+
+        original = categorical_data.copy()
+        encoder = LabelEncodingEncoder()
+
+        result = encoder.encode(categorical_data)
+
+        assert encoder.categories == {
+            "color": ["blue", "green", "red"],
+            "size": ["L", "M", "S"]
+        }
+        assert result["color"].tolist() == [2, 0, -1, 1, 0]
+        assert result["size"].tolist() == [2, 1, 0, 1, 2]
+        assert result["price"].tolist() == original["price"].tolist()
+        pd.testing.assert_frame_equal(categorical_data, original)
+
+    def test_reuses_fitted_state(self, categorical_data) -> None:
+        """
+        Should encode new data with the restored vocabulary instead of
+        fitting again, and encode unknown values as -1.
+        :return: None
+        """
+
+        state = json.loads(json.dumps(
+            LabelEncodingEncoder().fit(categorical_data).to_dict()
+        ))
+        encoder = LabelEncodingEncoder.from_dict(state)
+        batch = pd.DataFrame({
+            "color": ["green", "purple"],
+            "size": ["S", "XL"],
+            "price": [np.nan, 1.0]
+        })
+
+        result = encoder.encode(batch)
+
+        assert result["color"].tolist() == [1, -1]
+        assert result["size"].tolist() == [2, -1]
+
+    def test_state_is_json_safe(self) -> None:
+        """
+        Should restore date categories, number categories and column names
+        that are not strings from the JSON encoded state.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "day": pd.Series([
+                pd.Timestamp("2024-01-02"),
+                pd.Timestamp("2024-01-01"),
+                None
+            ], dtype=object),
+            0: ["b", "a", "b"],
+            "code": pd.Categorical([3, 1, 3])
+        })
+        encoder = LabelEncodingEncoder(columns=["day", 0, "code"]).fit(data)
+
+        state = json.loads(json.dumps(encoder.to_dict(), allow_nan=False))
+        restored_encoder = LabelEncodingEncoder.from_dict(state)
+
+        assert restored_encoder.categories == encoder.categories
+        pd.testing.assert_frame_equal(
+            restored_encoder.transform(data),
+            encoder.transform(data)
+        )
+
+    def test_rejects_other_schema(self, categorical_data) -> None:
+        """
+        Should reject transforming before fitting or data missing a fitted
+        column.
+        :return: None
+        """
+
+        with pytest.raises(ValueError, match="not been fitted"):
+            LabelEncodingEncoder().transform(categorical_data)
+
+        encoder = LabelEncodingEncoder().fit(categorical_data)
+
+        with pytest.raises(ValueError, match="color"):
+            encoder.transform(categorical_data.drop(columns="color"))
+
+
+@pytest.fixture
+def wide_categorical_data():
+    """Returns a low and a high cardinality column with a target."""
+    rng = np.random.default_rng(0)
+    num_rows = 2_000
+    return pd.DataFrame({
+        "plan": rng.choice(["free", "pro", "team"], num_rows),
+        "user": [f"u{i}" for i in rng.integers(0, 500, num_rows)],
+        "spend": rng.normal(100, 10, num_rows)
+    })
+
+
+def restored(encoder):
+    """Returns the encoder restored from its JSON encoded state."""
+    state = json.loads(json.dumps(encoder.to_dict(), allow_nan=False))
+    return ENCODERS[state["encoder"]].from_dict(state)
+
+
+class TestSparseEncoders:
+    """
+    Test suite for the OneHotEncoder and HashingEncoder.
+    """
+
+    def test_one_hot_is_sparse(self, categorical_data) -> None:
+        """
+        Should replace the categorical columns by sparse indicator columns,
+        without indicators for missing values.
+        :return: None
+        """
+
+        result = OneHotEncoder().encode(categorical_data)
+
+        assert list(result.columns) == [
+            "price", "color_blue", "color_green", "color_red",
+            "size_L", "size_M", "size_S"]
+        assert isinstance(result["color_red"].dtype, pd.SparseDtype)
+        assert result["color_red"].tolist() == [1, 0, 0, 0, 0]
+        assert result.iloc[2, 1:4].sum() == 0
+
+    def test_sparse_matrix(self, categorical_data) -> None:
+        """
+        Should build one CSR matrix with a non-zero per encoded value.
+        :return: None
+        """
+
+        matrix, names = OneHotEncoder(columns=["color"]).fit(
+            categorical_data).sparse_matrix(categorical_data)
+
+        assert matrix.shape == (5, 3)
+        assert matrix.nnz == 4
+        assert names == ["color_blue", "color_green", "color_red"]
+
+    def test_hashing_has_fixed_width(self, wide_categorical_data) -> None:
+        """
+        Should spread every column over the configured number of
+        indicators, the same way after restoring the encoder.
+        :return: None
+        """
+
+        encoder = HashingEncoder(columns=["user"], n_features=16)
+
+        matrix, names = encoder.fit(wide_categorical_data).sparse_matrix(
+            wide_categorical_data)
+        again, _ = restored(encoder).sparse_matrix(wide_categorical_data)
+
+        assert matrix.shape == (2_000, 16) and len(names) == 16
+        assert (matrix.sum(axis=1) == 1).all()
+        assert (matrix != again).nnz == 0
+
+
+class TestValueEncoders:
+    """
+    Test suite for the FrequencyEncoder and TargetEncoder.
+    """
+
+    def test_frequency_encoding(self, categorical_data) -> None:
+        """
+        Should replace the values by their share of the rows.
+        :return: None
+        """
+
+        encoder = FrequencyEncoder(columns=["color"]).fit(categorical_data)
+
+        result = restored(encoder).transform(
+            pd.DataFrame({"color": ["blue", "red", "pink", None]}))
+
+        assert result["color"].tolist() == [0.5, 0.25, 0.0, 0.0]
+
+    def test_target_encoding_is_smoothed(self) -> None:
+        """
+        Should encode the smoothed target mean of every category and the
+        overall mean for unseen values.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "city": ["a", "a", "a", "b"],
+            "price": [10.0, 10.0, 10.0, 30.0]
+        })
+        encoder = TargetEncoder("price", smoothing=1.0).fit(data)
+
+        result = restored(encoder).transform(
+            pd.DataFrame({"city": ["a", "b", "c"]}))
+
+        assert result["city"].tolist() == pytest.approx([11.25, 22.5, 15.0])
+
+
+class TestCardinalityEncoder:
+    """
+    Test suite for the CardinalityEncoder.
+    """
+
+    def test_chooses_encoding_by_cardinality(
+            self,
+            wide_categorical_data
+    ) -> None:
+        """
+        Should one-hot encode the low cardinality column and hash, or
+        target encode, the high cardinality one.
+        :return: None
+        """
+
+        hashed = CardinalityEncoder().encode(wide_categorical_data)
+        targeted = CardinalityEncoder(target="spend").encode(
+            wide_categorical_data)
+
+        assert {"plan_free", "plan_pro", "plan_team"} <= set(hashed.columns)
+        assert "user_hash_0" in hashed.columns
+        assert targeted.shape[1] == 5
+        assert targeted["user"].dtype == np.float64
+
+    def test_uses_profile_and_restores(self, wide_categorical_data) -> None:
+        """
+        Should take the cardinalities from the profile and encode the same
+        after restoring its state.
+        :return: None
+        """
+
+        profile = DataProfiler(wide_categorical_data).generate_profile()
+        encoder = CardinalityEncoder(
+            profile=profile,
+            high_cardinality="frequency"
+        ).fit(wide_categorical_data)
+
+        pd.testing.assert_frame_equal(
+            restored(encoder).transform(wide_categorical_data),
+            encoder.transform(wide_categorical_data)
+        )
+        assert [e.to_dict()["encoder"] for e in encoder.encoders] == [
+            "OneHotEncoder", "FrequencyEncoder"]
@@ -0,0 +1,578 @@
+"""Test suite for the data loaders."""
+
+import datetime
+import io
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.data_uploader.csv_engines import (
+    CSV_ENGINES,
+    ArrowStreamingEngine,
+    get_csv_engine)
+from src.services.data_uploader.data_loader import (
+    CSVDataLoader,
+    DtypeOptimizer,
+    ExcelDataLoader)
+from src.services.data_uploader.upload_handler import handle_upload_stream
+
+CSV_CONTENT = (
+    b'id,name,score\n'
+    b'1,"Smith, Anna",3.5\n'
+    b'2,"multi\nline ""quoted""",4.0\n'
+    b'3,plain,\n'
+    b'4,last,1.25'
+)
+
+
+def feed_in_chunks(loader, content: bytes, size: int):
+    """Feeds the content to the loader in chunks of the given size."""
+    for start in range(0, len(content), size):
+        loader.feed(content[start:start + size])
+    return loader.finish()
+
+
+class TestCSVDataLoader:
+    """
+    Test suite for the incremental mode of the CSV data loader.
+    """
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 16, 1024])
+    def test_incremental_load_matches_full_load(self, chunk_size) -> None:
+        """
+        Should parse the same DataFrame regardless of where the chunk
+        boundaries fall, including inside quoted fields.
+        :return: None
+        """
+
+        loader = CSVDataLoader(batch_size=8, optimize_dtypes=False)
+        data, message = feed_in_chunks(loader, CSV_CONTENT, chunk_size)
+
+        expected = pd.read_csv(io.BytesIO(CSV_CONTENT))
+
+        assert message == "CSV file loaded successfully."
+        pd.testing.assert_frame_equal(data, expected)
+
+    @pytest.mark.parametrize("content", [
+        b"a,b\n1,x\n2,y\n3,z\nq,w\n",
+        b"a,b\n1,x\n2,y\n3,z\n4.5,w\n,v\n",
+        b"a,b\nTrue,x\nFalse,y\nTrue,z\n,w\n",
+        b"a,b\nTrue,x\nFalse,y\nTrue,z\nq,w\n"
+    ])
+    @pytest.mark.parametrize("seekable", [True, False])
+    def test_batches_get_whole_file_dtypes(self, content,
+                                           seekable) -> None:
+        """
+        Should give a column the dtype of a whole-file parse when a later
+        batch holds values that do not fit the dtype of the first one,
+        reading the column again from a seekable source.
+        :return: None
+        """
+
+        loader = CSVDataLoader(batch_size=8, optimize_dtypes=False)
+
+        if seekable:
+            loader.read_stream(io.BytesIO(content), 4)
+            data, _ = loader.finish()
+        else:
+            data, _ = feed_in_chunks(loader, content, 4)
+
+        expected = pd.read_csv(io.BytesIO(content))
+
+        pd.testing.assert_frame_equal(data, expected)
+        assert loader._source is None
+
+    def test_conflicts_read_from_source(self) -> None:
+        """
+        Should keep the original text of the earlier batches when a column
+        is read again from the source.
+        :return: None
+        """
+
+        content = b"a,b\n01,x\n2.50,y\n3,z\nq,w\n"
+        loader = CSVDataLoader(batch_size=8, optimize_dtypes=False)
+
+        loader.read_stream(io.BytesIO(content), 4)
+        data, _ = loader.finish()
+
+        assert data["a"].tolist() == ["01", "2.50", "3", "q"]
+
+    def test_incremental_load_header_only(self) -> None:
+        """
+        Should return an empty DataFrame with the header columns.
+        :return: None
+        """
+
+        loader = CSVDataLoader()
+        data, _ = feed_in_chunks(loader, b"a,b\n", 2)
+
+        assert data.empty
+        assert list(data.columns) == ["a", "b"]
+
+    def test_incremental_load_empty_input(self) -> None:
+        """
+        Should fail to load a file without any content.
+        :return: None
+        """
+
+        data, message = CSVDataLoader().finish()
+
+        assert data is None
+        assert message.startswith("Failed to load CSV file")
+
+    def test_incremental_load_stops_on_malformed_batch(self) -> None:
+        """
+        Should record an error for a malformed batch and ignore later
+        chunks.
+        :return: None
+        """
+
+        loader = CSVDataLoader(batch_size=4)
+        loader.feed(b"a,b\n1,2\n1,2,3,4\n")
+
+        assert loader.error is not None
+
+        loader.feed(b"5,6\n")
+        data, message = loader.finish()
+
+        assert data is None
+        assert message == loader.error
+
+    @pytest.mark.parametrize("chunk_size", [3, 1024])
+    def test_deduplicates_while_loading(self, chunk_size) -> None:
+        """
+        Should drop the duplicate rows across batches as they are parsed.
+        :return: None
+        """
+
+        content = b"a,b\n1,x\n2,y\n1,x\n3,z\n2,y\n"
+        loader = CSVDataLoader(
+            batch_size=8,
+            optimize_dtypes=False,
+            deduplicate=True
+        )
+
+        data, _ = feed_in_chunks(loader, content, chunk_size)
+        full, _ = CSVDataLoader(
+            optimize_dtypes=False,
+            deduplicate=True
+        ).load_data(io.BytesIO(content))
+
+        assert data["a"].tolist() == [1, 2, 3]
+        assert loader.duplicate_count == 2
+        pd.testing.assert_frame_equal(data, full)
+
+    def test_deduplicates_batches_with_differing_dtypes(self) -> None:
+        """
+        Should drop duplicates of rows parsed as numbers in an earlier batch
+        and as strings in a later one, as a whole-file load does.
+        :return: None
+        """
+
+        content = b"a,b\n" + b"1,x\n" * 3 + b"1,x\nq,y\n"
+        loader = CSVDataLoader(
+            batch_size=8,
+            optimize_dtypes=False,
+            deduplicate=True
+        )
+
+        data, _ = feed_in_chunks(loader, content, 4)
+        full, _ = CSVDataLoader(
+            optimize_dtypes=False,
+            deduplicate=True
+        ).load_data(io.BytesIO(content))
+
+        assert data["a"].tolist() == ["1", "q"]
+        pd.testing.assert_frame_equal(data, full)
+
+    @pytest.mark.parametrize("content", [
+        b"id,b\n01234,x\n1234,x\n1e3,x\n1000,x\nq,x\n",
+        b"id,b\n9007199254740992,x\n9007199254740993,x\n"
+        b"9007199254740992,x\n",
+        b"id,b\n2024-01-02,x\n2024-01-03,x\n2024-01-04,x\n"
+        b"2024-01-02,x\nsoon,x\n2024-01-03,x\n"
+    ])
+    @pytest.mark.parametrize("optimize_dtypes", [False, True])
+    def test_deduplicates_like_whole_file(self, content,
+                                          optimize_dtypes) -> None:
+        """
+        Should drop exactly the rows a whole-file load drops, keeping
+        distinct values that only look alike as numbers.
+        :return: None
+        """
+
+        loader = CSVDataLoader(
+            batch_size=8,
+            optimize_dtypes=optimize_dtypes,
+            deduplicate=True
+        )
+
+        loader.read_stream(io.BytesIO(content), 4)
+        data, _ = loader.finish()
+        full, _ = CSVDataLoader(
+            optimize_dtypes=optimize_dtypes,
+            deduplicate=True
+        ).load_data(io.BytesIO(content))
+
+        assert loader.duplicate_count == len(pd.read_csv(
+            io.BytesIO(content))) - len(full)
+
+        if optimize_dtypes:
+            # The dtypes are inferred from the first batch only
+            pd.testing.assert_frame_equal(data.astype(str), full.astype(str))
+        else:
+            pd.testing.assert_frame_equal(data, full)
+
+    def test_handle_upload_stream_csv(self) -> None:
+        """
+        Should load a CSV stream through the matching loader.
+        :return: None
+        """
+
+        data, _ = handle_upload_stream(
+            "file.csv",
+            io.BytesIO(CSV_CONTENT),
+            chunk_size=5
+        )
+
+        assert data.shape == (4, 3)
+
+    def test_handle_upload_stream_reads_cache(self) -> None:
+        """
+        Should load a re-uploaded file from the dataset cache without
+        parsing it again.
+        :return: None
+        """
+
+        first, message = handle_upload_stream(
+            "file.csv",
+            io.BytesIO(CSV_CONTENT)
+        )
+
+        with patch.object(CSVDataLoader, "feed") as feed:
+            cached, cached_message = handle_upload_stream(
+                "file.csv",
+                io.BytesIO(CSV_CONTENT)
+            )
+
+        feed.assert_not_called()
+        assert cached_message != message
+        pd.testing.assert_frame_equal(cached, first)
+
+
+@pytest.fixture
+def typed_csv() -> bytes:
+    """Returns a CSV with a low-cardinality, a text and a date column."""
+    rows = [
+        f"{i},{'red' if i % 2 else 'blue'},item {i},2024-01-{i % 28 + 1:02d}"
+        for i in range(200)
+    ]
+    return ("id,color,label,day\n" + "\n".join(rows)).encode()
+
+
+class TestDtypeOptimizer:
+    """
+    Test suite for the load-time dtype optimization.
+    """
+
+    def test_infer_plan(self) -> None:
+        """
+        Should plan categoricals, text and dates for the string columns
+        only.
+        :return: None
+        """
+
+        sample = pd.DataFrame({
+            "color": ["red", "blue", "red", "red"],
+            "label": ["a", "b", "c", "d"],
+            "day": ["2024-01-01", "2024-01-02", None, "2024-02-01"],
+            "mixed": ["a", 1, "b", 2],
+            "num": [1, 2, 3, 4]
+        })
+
+        plan = DtypeOptimizer(max_unique_ratio=0.5).infer(sample)
+
+        assert plan.categorical == ["color"]
+        assert plan.text == ["label"]
+        assert plan.dates == {"day": "%Y-%m-%d"}
+
+    def test_numeric_downcast_is_lossless(self) -> None:
+        """
+        Should downcast integers and only exactly representable floats.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "small": [1, 2, 3],
+            "halves": [0.5, 1.5, np.nan],
+            "precise": [0.1, 0.2, 0.3]
+        })
+
+        DtypeOptimizer().optimize(data)
+
+        assert data["small"].dtype == np.int8
+        assert data["halves"].dtype == np.float32
+        assert data["precise"].dtype == np.float64
+
+    @pytest.mark.parametrize("chunk_size", [None, 512])
+    def test_csv_load_optimizes_dtypes(self, typed_csv, chunk_size) -> None:
+        """
+        Should load the same values with compact dtypes, both in one pass
+        and incrementally, and report the memory saved.
+        :return: None
+        """
+
+        loader = CSVDataLoader(batch_size=256)
+
+        if chunk_size is None:
+            data, message = loader.load_data(io.BytesIO(typed_csv))
+        else:
+            data, message = feed_in_chunks(loader, typed_csv, chunk_size)
+
+        expected = pd.read_csv(io.BytesIO(typed_csv))
+
+        assert isinstance(data["color"].dtype, pd.CategoricalDtype)
+        assert pd.api.types.is_datetime64_dtype(data["day"])
+        assert data["id"].dtype == np.int16
+        assert data["color"].astype(object).tolist() == \
+            expected["color"].tolist()
+        assert loader.memory_report.saved_bytes > 0
+        assert "Memory usage optimized" in message
+
+
+ENGINE_CSV = "\n".join(
+    ["id,text,day,color,empty,ratio"] + [
+        f"{i},{'x' if i % 3 else ''},2024-01-0{i % 9 + 1},"
+        f"{'red' if i % 2 else 'blue'},,{i / 4}"
+        for i in range(50)
+    ]
+).encode()
+
+
+class TestCSVEngines:
+    """
+    Test suite for the CSV parser engines.
+    """
+
+    @pytest.mark.parametrize("name", list(CSV_ENGINES))
+    @pytest.mark.parametrize("options", [{}, {
+        "dtype": {"color": "category"},
+        "parse_dates": ["day"],
+        "date_format": {"day": "%Y-%m-%d"}
+    }])
+    def test_engines_match_c_parser(self, name, options) -> None:
+        """
+        Should parse the same DataFrame as the pandas C parser.
+        :return: None
+        """
+
+        data = get_csv_engine(name).read(io.BytesIO(ENGINE_CSV), **options)
+        expected = pd.read_csv(io.BytesIO(ENGINE_CSV), **options)
+
+        pd.testing.assert_frame_equal(data, expected)
+
+    @pytest.mark.parametrize("name", list(CSV_ENGINES))
+    @pytest.mark.parametrize("content", [
+        b"id,val,val\n1,2,3\n4,5,6\n",
+        b"id,val,val,val.1\n1,2,3,4\n",
+        b"id,t\n1,10:30:00\n2,11:45:10\n3,\n",
+        b"id,ts\n1,2024-01-02 10:30:00\n2,2024-01-03T11:00:00\n3,\n",
+        b"id,ts\n1,2024-01-02T10:30:00Z\n2,2024-01-03 11:00:00.5\n",
+        b"id,day\n1,2024-01-02\n2,\n",
+        b"id,empty\n"
+    ])
+    def test_engines_match_c_parser_types(self, name, content) -> None:
+        """
+        Should name repeated columns and read times, timestamps and files
+        without rows like the pandas C parser.
+        :return: None
+        """
+
+        data = get_csv_engine(name).read(io.BytesIO(content))
+        expected = pd.read_csv(io.BytesIO(content))
+
+        pd.testing.assert_frame_equal(data, expected)
+
+    def test_loader_repeated_header(self) -> None:
+        """
+        Should load a file with repeated column names with the pyarrow
+        engines.
+        :return: None
+        """
+
+        content = b"id,val,val\n" + b"1,2,3\n" * 100
+
+        for name in ("pyarrow", "pyarrow-stream"):
+            loader = CSVDataLoader(engine=name, optimize_dtypes=True)
+            data, message = loader.load_data(io.BytesIO(content))
+
+            assert list(data.columns) == ["id", "val", "val.1"], message
+
+    def test_streaming_engine_converts_blocks(self) -> None:
+        """
+        Should parse a file read in many blocks like the C parser, keeping
+        the categorical columns categorical.
+        :return: None
+        """
+
+        rng = np.random.default_rng(0)
+        content = pd.DataFrame({
+            "id": np.arange(5_000),
+            "color": rng.choice(["red", "green", "blue"], 5_000),
+            "label": [f"item {i}" if i % 7 else None for i in range(5_000)]
+        }).to_csv(index=False).encode()
+        options = {"dtype": {"color": "category"}}
+
+        data = ArrowStreamingEngine(block_size=4096).read(
+            io.BytesIO(content),
+            **options
+        )
+        expected = pd.read_csv(io.BytesIO(content), **options)
+
+        pd.testing.assert_frame_equal(data, expected, check_categorical=False)
+
+    @pytest.mark.parametrize("size, name", [
+        (None, "c"),
+        (1024, "c"),
+        (64 * 1024 * 1024, "pyarrow"),
+        (1024 ** 3, "pyarrow-stream")
+    ])
+    def test_auto_picks_engine_by_size(self, size, name) -> None:
+        """
+        Should pick the engine by the size of the input.
+        :return: None
+        """
+
+        assert get_csv_engine("auto", size).name == name
+
+    def test_unknown_engine(self) -> None:
+        """
+        Should raise a ValueError for an unknown engine.
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            get_csv_engine("unknown")
+
+    @pytest.mark.parametrize("engine", ["pyarrow", "pyarrow-stream"])
+    def test_loader_falls_back_to_c_parser(self, engine) -> None:
+        """
+        Should parse a file the engine rejects with the C parser.
+        :return: None
+        """
+
+        loader = CSVDataLoader(optimize_dtypes=False, engine=engine)
+        data, message = loader.load_data(io.BytesIO(b"a,b,c\n1,2,3\n4,5\n"))
+
+        assert message == "CSV file loaded successfully."
+        assert data.shape == (2, 3)
+        assert np.isnan(data.loc[1, "c"])
+
+
+@pytest.fixture
+def workbook() -> bytes:
+    """Returns an xlsx workbook with two sheets."""
+    from openpyxl import Workbook
+
+    book = Workbook()
+    first = book.active
+    first.title = "first"
+    first.append(["id", "name", "score", "when", None])
+
+    for i in range(20):
+        first.append([
+            i,
+            f"n{i}" if i % 4 else None,
+            i * 1.5,
+            datetime.datetime(2024, 1, i + 1),
+            None
+        ])
+
+    second = book.create_sheet("second")
+    second.append(["a", "b"])
+    second.append([1, 2])
+
+    buffer = io.BytesIO()
+    book.save(buffer)
+
+    return buffer.getvalue()
+
+
+class TestExcelDataLoader:
+    """
+    Test suite for the Excel data loader.
+    """
+
+    @pytest.mark.parametrize("sheet_name, expected_sheet", [
+        (0, 0),
+        ("second", "second"),
+        ("1", 1)
+    ])
+    def test_streamed_sheet_matches_read_excel(
+            self,
+            workbook,
+            sheet_name,
+            expected_sheet
+    ) -> None:
+        """
+        Should stream the selected sheet into the same DataFrame as
+        `pd.read_excel`.
+        :return: None
+        """
+
+        loader = ExcelDataLoader(
+            sheet_name=sheet_name,
+            engine="openpyxl",
+            optimize_dtypes=False
+        )
+        data, message = loader.load_data(io.BytesIO(workbook))
+
+        expected = pd.read_excel(
+            io.BytesIO(workbook),
+            sheet_name=expected_sheet
+        )
+
+        assert message == "Excel file loaded successfully."
+        pd.testing.assert_frame_equal(data, expected)
+
+    def test_caps_rows_and_columns(self, workbook) -> None:
+        """
+        Should only load the first rows and columns and say so.
+        :return: None
+        """
+
+        loader = ExcelDataLoader(
+            max_rows=5,
+            max_columns=2,
+            engine="openpyxl",
+            optimize_dtypes=False
+        )
+        data, message = loader.load_data(io.BytesIO(workbook))
+
+        assert data.shape == (5, 2)
+        assert "Only the first 5 rows and 2 columns" in message
+
+    def test_unknown_sheet(self, workbook) -> None:
+        """
+        Should fail to load a sheet the workbook does not have.
+        :return: None
+        """
+
+        data, message = ExcelDataLoader(sheet_name="missing").load_data(
+            io.BytesIO(workbook)
+        )
+
+        assert data is None
+        assert "'first', 'second'" in message
+
+    def test_list_sheets(self, workbook) -> None:
+        """
+        Should list the sheet names in workbook order.
+        :return: None
+        """
+
+        sheets = ExcelDataLoader.list_sheets(io.BytesIO(workbook))
+
+        assert sheets == ["first", "second"]
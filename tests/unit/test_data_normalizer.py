@@ -0,0 +1,80 @@
+"""Test suite for the data normalizers."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.data_preprocessor.data_normalizer import MinMaxNormalizer
+
+
+class TestMinMaxNormalizer:
+    """
+    Test suite for the MinMaxNormalizer.
+    """
+
+    def test_scales_numeric_columns(self) -> None:
+        """
+        Should scale the numeric columns to [0, 1], constant columns to 0,
+        and leave the other columns unchanged.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "a": [0, 5, 10],
+            "b": [2.0, np.nan, 2.0],
+            "c": ["x", "y", "z"]
+        })
+
+        result = MinMaxNormalizer().normalize(data)
+
+        assert result["a"].tolist() == [0.0, 0.5, 1.0]
+        assert result["b"].fillna(-1).tolist() == [0.0, -1, 0.0]
+        assert result["c"].tolist() == ["x", "y", "z"]
+        assert data["a"].tolist() == [0, 5, 10]
+
+    def test_reuses_fitted_state(self) -> None:
+        """
+        Should scale new data with the restored range instead of fitting
+        again.
+        :return: None
+        """
+
+        state = json.loads(json.dumps(
+            MinMaxNormalizer().fit(pd.DataFrame({"a": [0, 10]})).to_dict()
+        ))
+        normalizer = MinMaxNormalizer.from_dict(state)
+
+        result = normalizer.normalize(pd.DataFrame({"a": [5, 20]}))
+
+        assert result["a"].tolist() == [0.5, 2.0]
+
+    def test_state_is_json_safe(self) -> None:
+        """
+        Should write the range of empty columns as null and restore column
+        names that are not strings.
+        :return: None
+        """
+
+        data = pd.DataFrame({0: [0.0, 10.0], "empty": [np.nan, np.nan]})
+        normalizer = MinMaxNormalizer().fit(data)
+
+        state = json.loads(json.dumps(normalizer.to_dict(), allow_nan=False))
+        restored = MinMaxNormalizer.from_dict(state)
+
+        result = restored.transform(data)
+
+        assert result[0].tolist() == [0.0, 1.0]
+        assert result["empty"].isna().all()
+
+    def test_rejects_other_schema(self) -> None:
+        """
+        Should reject data missing a fitted column.
+        :return: None
+        """
+
+        normalizer = MinMaxNormalizer().fit(pd.DataFrame({"a": [0, 10]}))
+
+        with pytest.raises(ValueError, match="a"):
+            normalizer.transform(pd.DataFrame({"b": [1]}))
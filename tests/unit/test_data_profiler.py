@@ -0,0 +1,537 @@
+"""Test suite for the data profiler."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.extractor.profiler.chunked_statistics import (
+    ChunkedStatistics)
+from src.services.extractor.profiler.correlation import (
+    correlation_blocks,
+    find_correlations)
+from src.services.extractor.profiler.data_profiler import (
+    DataProfiler,
+    compute_column_statistics)
+from src.services.extractor.profiler.sketches import (
+    HyperLogLog,
+    ReservoirSample)
+
+
+@pytest.fixture
+def mixed_data():
+    """Returns data with columns of every kind the profiler handles."""
+    return pd.DataFrame({
+        "int": [1, 2, 3, 0, 5, 5],
+        "float": [1.5, np.nan, 3.0, 0.0, 2.0, 9.5],
+        "flag": [True, False, True, True, False, True],
+        "nullable": pd.array([1, None, 3, 4, 0, 4], dtype="Int64"),
+        "constant": [2.0] * 6,
+        "empty": [np.nan] * 6,
+        "text": ["a", "b", None, "a", "c", "c"],
+        "day": pd.date_range("2024-01-01", periods=6)
+    })
+
+
+class TestColumnStatistics:
+    """
+    Test suite for the single-sweep column statistics.
+    """
+
+    @pytest.mark.parametrize("num_rows", [0, 1, 3, 6])
+    def test_matches_per_column_pandas(self, mixed_data, num_rows) -> None:
+        """
+        Should compute the same statistics as the per-column pandas
+        reductions.
+        :return: None
+        """
+
+        data = mixed_data.head(num_rows)
+        statistics = compute_column_statistics(data)
+
+        for col in data.columns:
+            s = data[col]
+
+            assert statistics.loc[col, "cardinality"] == s.nunique()
+            assert statistics.loc[col, "missing_values"] == s.isna().sum()
+
+            if not pd.api.types.is_numeric_dtype(s):
+                continue
+
+            expected = {
+                "mean": s.mean(),
+                "std": s.std(),
+                "min": s.min(),
+                "max": s.max(),
+                "p25": s.astype(float).quantile(0.25),
+                "median": s.astype(float).median(),
+                "p75": s.astype(float).quantile(0.75),
+                "skewness": s.skew(),
+                "kurtosis": s.kurt(),
+                "zero_count": (s == 0).sum()
+            }
+
+            for name, value in expected.items():
+                # Nullable columns give pd.NA where NumPy gives NaN
+                np.testing.assert_allclose(
+                    float(statistics.loc[col, name]),
+                    np.nan if pd.isna(value) else float(value),
+                    err_msg=f"{col} {name}"
+                )
+
+    def test_column_blocks(self, mixed_data) -> None:
+        """
+        Should compute the same statistics when the numeric columns are
+        processed one block at a time.
+        :return: None
+        """
+
+        data = mixed_data.assign(
+            float2=mixed_data["float"] * 2,
+            float3=mixed_data["float"] - 1
+        )
+
+        pd.testing.assert_frame_equal(
+            compute_column_statistics(data, block_bytes=1),
+            compute_column_statistics(data)
+        )
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    @pytest.mark.parametrize("mode", ["exact", "approximate"])
+    def test_timedelta_columns(self, mixed_data, mode, workers,
+                               monkeypatch) -> None:
+        """
+        Should profile timedelta columns without numeric statistics.
+        :return: None
+        """
+
+        monkeypatch.setattr(
+            "src.services.extractor.profiler.data_profiler."
+            "PROFILER_PARALLEL_MIN_COLUMNS",
+            2
+        )
+        data = mixed_data.assign(
+            duration=pd.to_timedelta([1, 2, None, 4, 5, 6], unit="s")
+        )
+
+        profile = DataProfiler(
+            data,
+            mode=mode,
+            sample_size=4,
+            workers=workers
+        ).generate_profile()
+        duration = profile.column_profiles[-1]
+
+        assert duration.cardinality == 5
+        assert duration.statistics == {}
+        assert profile.column_profiles[0].statistics["max"] == 5
+
+    def test_profile_uses_statistics(self, mixed_data) -> None:
+        """
+        Should fill the column profiles with Python scalars.
+        :return: None
+        """
+
+        profile = DataProfiler(mixed_data).generate_profile()
+        column = profile.column_profiles[0]
+
+        assert column.cardinality == 5
+        assert column.statistics["max"] == 5
+        assert isinstance(column.statistics["max"], int)
+        assert profile.column_profiles[6].statistics == {}
+
+
+class TestSketches:
+    """
+    Test suite for the profiling sketches.
+    """
+
+    @pytest.mark.parametrize("distinct", [1, 2, 1000, 200_000])
+    def test_hyperloglog_estimate(self, distinct) -> None:
+        """
+        Should estimate the distinct count within a few standard errors and
+        ignore missing values.
+        :return: None
+        """
+
+        values = pd.Series(np.arange(distinct * 2) % distinct * 0.5)
+        values[::7] = np.nan
+
+        sketch = HyperLogLog()
+        sketch.add(values)
+
+        expected = values.nunique()
+        tolerance = 4 * sketch.relative_error * expected
+
+        assert abs(sketch.estimate() - expected) <= max(tolerance, 1)
+
+    def test_hyperloglog_merge(self) -> None:
+        """
+        Should give the same estimate for merged sketches of two halves as
+        for a sketch of the whole column.
+        :return: None
+        """
+
+        values = pd.Series(np.arange(50_000))
+
+        whole = HyperLogLog()
+        whole.add(values)
+
+        first, second = HyperLogLog(), HyperLogLog()
+        first.add(values[:20_000])
+        second.add(values[20_000:])
+        first.merge(second)
+
+        assert first.estimate() == whole.estimate()
+
+    def test_reservoir_sample_is_uniform(self) -> None:
+        """
+        Should keep every row of a chunked stream with the same
+        probability.
+        :return: None
+        """
+
+        counts = np.zeros(10)
+
+        for seed in range(400):
+            sampler = ReservoirSample(5, seed=seed)
+
+            for start in range(0, 10, 3):
+                rows = np.arange(start, min(start + 3, 10))
+                sampler.add(pd.DataFrame({"x": rows}))
+
+            assert len(sampler.sample) == 5
+            counts[sampler.sample["x"].to_numpy()] += 1
+
+        # Every row is expected 200 times
+        assert counts.min() > 150 and counts.max() < 250
+
+
+class TestApproximateProfile:
+    """
+    Test suite for the approximate profiling mode.
+    """
+
+    @pytest.fixture
+    def large_data(self):
+        """Returns data with more rows than the sample size."""
+        rng = np.random.default_rng(0)
+        return pd.DataFrame({
+            "value": rng.normal(10, 2, 50_000),
+            "code": rng.integers(0, 500, 50_000),
+            "group": pd.Categorical(rng.choice(["a", "b", "c"], 50_000))
+        })
+
+    def test_estimates_are_marked_with_errors(self, large_data) -> None:
+        """
+        Should mark the profile as approximate and report error estimates
+        that cover the exact values.
+        :return: None
+        """
+
+        original = large_data.copy()
+        profile = DataProfiler(
+            large_data,
+            mode="approximate",
+            sample_size=5_000,
+            seed=0
+        ).generate_profile()
+
+        value, code, group = profile.column_profiles
+
+        assert not profile.is_exact
+        assert profile.sample_size == 5_000
+        assert not value.is_exact
+        assert set(value.error_estimates) == {
+            "cardinality", "quantile", "mean"}
+
+        assert abs(value.statistics["mean"] - large_data["value"].mean()) \
+            <= value.error_estimates["mean"]
+        assert abs(code.cardinality - 500) <= 10
+        assert code.statistics["min"] == large_data["code"].min()
+        assert group.cardinality == 3
+        assert group.error_estimates == {"cardinality": 0.0}
+
+        pd.testing.assert_frame_equal(large_data, original)
+
+    def test_auto_mode_profiles_small_data_exactly(self, large_data) -> None:
+        """
+        Should profile data below the row threshold exactly.
+        :return: None
+        """
+
+        profile = DataProfiler(large_data).generate_profile()
+
+        assert profile.is_exact
+        assert profile.column_profiles[1].cardinality == 500
+
+    def test_error_bound_sets_sample_size(self, large_data) -> None:
+        """
+        Should derive the sample size from the quantile error bound.
+        :return: None
+        """
+
+        profiler = DataProfiler(large_data, error_bound=0.05)
+
+        assert profiler.sample_size == 738
+
+
+class TestChunkedProfile:
+    """
+    Test suite for profiling data that arrives in chunks.
+    """
+
+    @staticmethod
+    def chunks_of(data: pd.DataFrame, size: int):
+        """Returns an iterator over the chunks of the data."""
+        return (data.iloc[i:i + size] for i in range(0, len(data), size))
+
+    def test_merged_statistics_match_exact_profile(self) -> None:
+        """
+        Should compute the same counts, extremes, moments and correlations
+        as the exact profile when the rows do not fit in the sample.
+        :return: None
+        """
+
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame({
+            "value": rng.normal(10, 2, 20_000),
+            "skewed": np.where(
+                rng.random(20_000) < 0.1,
+                np.nan,
+                rng.exponential(size=20_000)
+            ),
+            "code": rng.integers(0, 500, 20_000),
+            "group": pd.Categorical(rng.choice(["a", "b", "c"], 20_000))
+        })
+        data["linked"] = data["value"] * 3 + rng.normal(0, 0.1, 20_000)
+
+        exact = DataProfiler(data, mode="exact").generate_profile()
+        chunked = DataProfiler(
+            self.chunks_of(data, 3_000),
+            sample_size=2_000,
+            seed=0
+        ).generate_profile()
+
+        assert not chunked.is_exact
+        assert chunked.num_rows == 20_000
+        assert chunked.sample_size == 2_000
+        assert chunked.sample_records == exact.sample_records
+
+        for expected, actual in zip(
+                exact.column_profiles, chunked.column_profiles):
+            assert actual.column_classification == \
+                expected.column_classification
+            assert actual.missing_values == expected.missing_values
+
+            if not expected.statistics:
+                continue
+
+            for name in ("mean", "std", "min", "max", "skewness",
+                         "kurtosis", "zero_count"):
+                assert actual.statistics[name] == pytest.approx(
+                    expected.statistics[name], rel=1e-9)
+
+        assert type(chunked.column_profiles[2].statistics["min"]) is int
+        assert chunked.column_profiles[3].cardinality == 3
+        assert abs(chunked.column_profiles[2].cardinality - 500) <= 10
+
+        (relationship,) = chunked.inter_column_relationships
+        assert relationship == exact.inter_column_relationships[0]
+
+    def test_correlation_over_pairwise_complete_rows(self) -> None:
+        """
+        Should correlate every pair of columns over the rows where both are
+        present, like DataFrame.corr.
+        :return: None
+        """
+
+        rng = np.random.default_rng(1)
+        data = pd.DataFrame(rng.normal(size=(1_000, 3)), columns=list("abc"))
+        data.loc[rng.random(1_000) < 0.2, "a"] = np.nan
+        data.loc[rng.random(1_000) < 0.3, "b"] = np.nan
+
+        statistics = ChunkedStatistics.from_chunks(
+            self.chunks_of(data, 128),
+            sample_size=10
+        )
+
+        pd.testing.assert_frame_equal(
+            statistics.correlation(),
+            data.corr()
+        )
+
+    def test_small_data_is_profiled_exactly(self, mixed_data) -> None:
+        """
+        Should give the exact profile when all rows fit in the sample.
+        :return: None
+        """
+
+        exact = DataProfiler(mixed_data).generate_profile()
+        chunked = DataProfiler(self.chunks_of(mixed_data, 4)) \
+            .generate_profile()
+
+        assert chunked.is_exact
+        assert chunked.to_json() == exact.to_json()
+
+    def test_widened_dtypes(self) -> None:
+        """
+        Should widen the dtype of a column that changes between chunks and
+        drop the numeric statistics of a column that stops being numeric.
+        :return: None
+        """
+
+        statistics = ChunkedStatistics.from_chunks([
+            pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]}),
+            pd.DataFrame({"a": [np.nan, 3.0], "b": ["x", "y"]})
+        ], sample_size=1)
+
+        assert statistics.dtypes["a"] == np.float64
+        assert statistics.dtypes["b"] == object
+        assert list(statistics.moments().index) == ["a"]
+        assert statistics.moments().loc["a", "max"] == 3.0
+
+
+class TestParallelProfile:
+    """
+    Test suite for profiling the columns on the process pool.
+    """
+
+    @pytest.fixture
+    def wide_data(self, mixed_data):
+        """Returns data with many columns of every kind."""
+        return pd.concat(
+            [mixed_data.add_suffix(f"_{i}") for i in range(4)],
+            axis=1
+        )
+
+    @pytest.fixture(autouse=True)
+    def low_threshold(self, monkeypatch):
+        """Profiles every dataset with at least two columns in parallel."""
+        monkeypatch.setattr(
+            "src.services.extractor.profiler.data_profiler."
+            "PROFILER_PARALLEL_MIN_COLUMNS",
+            2
+        )
+
+    def test_matches_single_process_profile(self, wide_data) -> None:
+        """
+        Should give the same profile as a single process, in the original
+        column order.
+        :return: None
+        """
+
+        expected = DataProfiler(wide_data, workers=1).generate_profile()
+        actual = DataProfiler(wide_data, workers=3).generate_profile()
+
+        assert actual.to_json() == expected.to_json()
+
+    def test_falls_back_for_unsupported_columns(self) -> None:
+        """
+        Should profile in a single process if Arrow cannot represent a
+        column.
+        :return: None
+        """
+
+        data = pd.DataFrame({"mixed": [1, "a", 2.5], "value": [1, 2, 3]})
+
+        profile = DataProfiler(data, workers=2).generate_profile()
+
+        assert profile.column_profiles[0].cardinality == 3
+        assert profile.column_profiles[1].statistics["max"] == 3
+
+
+class TestCorrelation:
+    """
+    Test suite for the blocked correlation discovery.
+    """
+
+    @pytest.fixture
+    def numeric_data(self):
+        """Returns correlated columns with missing and constant values."""
+        rng = np.random.default_rng(2)
+        base = rng.normal(size=500)
+        data = pd.DataFrame({
+            f"x{i}": base * (i % 3 - 1) + rng.normal(scale=i / 4, size=500)
+            for i in range(7)
+        })
+        data["constant"] = 1.5
+        data.loc[rng.random(500) < 0.2, "x2"] = np.nan
+        data.loc[rng.random(500) < 0.1, "x5"] = np.nan
+        return data
+
+    @pytest.mark.parametrize("block_size", [1, 3, 512])
+    def test_blocks_match_pandas(self, numeric_data, block_size) -> None:
+        """
+        Should compute the same matrix as DataFrame.corr, block by block.
+        :return: None
+        """
+
+        blocks = list(correlation_blocks(numeric_data, block_size=block_size))
+        matrix = np.vstack([block for _, block in blocks])
+
+        assert [start for start, _ in blocks] == list(
+            range(0, numeric_data.shape[1], block_size))
+        np.testing.assert_allclose(matrix, numeric_data.corr(), atol=1e-12)
+
+    def test_spearman_and_float32(self, numeric_data) -> None:
+        """
+        Should match the pandas Spearman correlation of complete data, and
+        the Pearson correlation within single precision.
+        :return: None
+        """
+
+        data = numeric_data.dropna()
+
+        (_, spearman), = correlation_blocks(data, method="spearman")
+        (_, single), = correlation_blocks(data, dtype=np.float32)
+
+        np.testing.assert_allclose(
+            spearman, data.corr(method="spearman"), atol=1e-12)
+        assert single.dtype == np.float32
+        np.testing.assert_allclose(single, data.corr(), atol=1e-5)
+
+    def test_find_correlations_matches_pairwise_scan(
+            self, numeric_data) -> None:
+        """
+        Should find the same pairs, in the same order, as scanning the upper
+        triangle of the matrix.
+        :return: None
+        """
+
+        corr = numeric_data.corr()
+        expected = [
+            {
+                "column_pair": (a, b),
+                "correlation": round(corr.loc[a, b], 3)
+            }
+            for i, a in enumerate(corr.columns)
+            for b in corr.columns[i + 1:]
+            if abs(corr.loc[a, b]) > 0.5
+        ]
+
+        found = find_correlations(
+            correlation_blocks(numeric_data, block_size=2),
+            numeric_data.columns
+        )
+
+        assert expected
+        assert found == expected
+
+    def test_top_k_per_column(self) -> None:
+        """
+        Should only keep the strongest correlations of every column.
+        :return: None
+        """
+
+        corr = np.array([
+            [1.0, 0.9, 0.8, 0.7],
+            [0.9, 1.0, 0.6, 0.2],
+            [0.8, 0.6, 1.0, 0.1],
+            [0.7, 0.2, 0.1, 1.0]
+        ])
+
+        found = find_correlations([(0, corr)], pd.Index(list("abcd")),
+                                  top_k=1)
+
+        assert [r["column_pair"] for r in found] == [
+            ("a", "b"), ("a", "c"), ("a", "d")]
@@ -0,0 +1,400 @@
+"""Test suite for the data treatments."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.data_preprocessor.data_treatment import (
+    DuplicateTreatment,
+    GarbageValueTreatment,
+    HashSet,
+    MissingValueTreatment,
+    OutlierTreatment)
+
+
+@pytest.fixture
+def outlier_data():
+    """Returns data with one outlier per numeric column."""
+    return pd.DataFrame({
+        "a": [1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 3.0, 100.0, 2.0, np.nan],
+        "b": [10, 11, 12, 11, -200, 10, 12, 11, 10, 11],
+        "c": list("abcdefghij")
+    })
+
+
+class TestOutlierTreatment:
+    """
+    Test suite for the OutlierTreatment.
+    """
+
+    @pytest.mark.parametrize("method", ["iqr", "zscore", "mad"])
+    def test_drop_removes_outlier_rows(self, outlier_data, method) -> None:
+        """
+        Should drop the rows holding an outlier in any numeric column and
+        keep rows with missing values.
+        :return: None
+        """
+
+        threshold = 2.0 if method == "zscore" else None
+        result = OutlierTreatment(
+            method=method,
+            threshold=threshold
+        ).treat_data(outlier_data)
+
+        assert list(result.index) == [0, 1, 2, 3, 5, 6, 8, 9]
+
+    def test_bounds_use_the_complete_data(self) -> None:
+        """
+        Should compute the bounds of every column on the unfiltered data.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "a": [0, 0, 0, 0, 100],
+            "b": [1, 2, 3, 4, 5]
+        })
+
+        lower, upper = OutlierTreatment().compute_bounds(data)
+
+        np.testing.assert_allclose(lower, [0, -1])
+        np.testing.assert_allclose(upper, [0, 7])
+
+    def test_clip_replaces_outliers_with_bounds(self, outlier_data) -> None:
+        """
+        Should clip the outliers to the bounds and keep every row.
+        :return: None
+        """
+
+        result = OutlierTreatment(action="clip").treat_data(outlier_data)
+
+        assert len(result) == len(outlier_data)
+        assert result["a"].max() == pytest.approx(4.5)
+        assert result["b"].min() == pytest.approx(8.5)
+        assert outlier_data["a"].max() == 100.0
+
+    def test_no_outliers_returns_data_unchanged(self) -> None:
+        """
+        Should return the same DataFrame if there are no outliers.
+        :return: None
+        """
+
+        data = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+        assert OutlierTreatment().treat_data(data) is data
+
+    def test_invalid_method(self) -> None:
+        """
+        Should raise a ValueError for an unknown method.
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            OutlierTreatment(method="unknown")
+
+
+@pytest.fixture
+def missing_data():
+    """Returns data with missing numeric and categorical values."""
+    return pd.DataFrame({
+        "num": [1.0, np.nan, 3.0, 8.0],
+        "cat": ["x", "y", None, "y"],
+        "empty": [None, None, None, None],
+        "full": [1, 2, 3, 4]
+    })
+
+
+class TestMissingValueTreatment:
+    """
+    Test suite for the MissingValueTreatment.
+    """
+
+    def test_default_fills_mean_and_mode(self, missing_data) -> None:
+        """
+        Should fill numeric columns with the mean and categorical columns
+        with the mode, leaving columns without values untouched.
+        :return: None
+        """
+
+        result = MissingValueTreatment().treat_data(missing_data)
+
+        assert result["num"].tolist() == [1.0, 4.0, 3.0, 8.0]
+        assert result["cat"].tolist() == ["x", "y", "y", "y"]
+        assert result["empty"].isna().all()
+        assert missing_data["num"].isna().sum() == 1
+
+    def test_median_and_constant_strategies(self, missing_data) -> None:
+        """
+        Should fill with the median and the constant fill value.
+        :return: None
+        """
+
+        result = MissingValueTreatment(
+            numeric_strategy="median",
+            categorical_strategy="constant",
+            fill_value="unknown"
+        ).treat_data(missing_data)
+
+        assert result.loc[1, "num"] == 3.0
+        assert result.loc[2, "cat"] == "unknown"
+
+    def test_forward_fill_strategy(self, missing_data) -> None:
+        """
+        Should fill with the preceding value.
+        :return: None
+        """
+
+        result = MissingValueTreatment(
+            numeric_strategy="ffill",
+            categorical_strategy="ffill"
+        ).treat_data(missing_data)
+
+        assert result.loc[1, "num"] == 1.0
+        assert result.loc[2, "cat"] == "y"
+
+    def test_categorical_dtype_mode(self) -> None:
+        """
+        Should fill categorical dtype columns with their mode.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "cat": pd.Categorical(["a", "b", "b", None])
+        })
+
+        result = MissingValueTreatment().treat_data(data)
+
+        assert result["cat"].tolist() == ["a", "b", "b", "b"]
+
+    def test_categorical_dtype_new_constant(self) -> None:
+        """
+        Should fill categorical dtype columns with a constant that is not
+        one of their categories, without modifying the input.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "cat": pd.Categorical(["a", None, "b"])
+        })
+
+        result = MissingValueTreatment(
+            categorical_strategy="constant",
+            fill_value="unknown"
+        ).treat_data(data)
+
+        assert result["cat"].tolist() == ["a", "unknown", "b"]
+        assert "unknown" in result["cat"].cat.categories
+        assert data["cat"].isna().sum() == 1
+        assert "unknown" not in data["cat"].cat.categories
+
+    def test_constant_requires_fill_value(self) -> None:
+        """
+        Should raise a ValueError for the constant strategy without a fill
+        value.
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            MissingValueTreatment(numeric_strategy="constant")
+
+
+@pytest.fixture
+def duplicate_data():
+    """Returns data with duplicate rows, including missing values."""
+    return pd.DataFrame({
+        "id": [1, 1, 2, 2, 3, 3, 3],
+        "value": [1.0, 1.0, 2.0, 5.0, np.nan, np.nan, 7.0],
+        "cat": ["a", "a", "b", "b", "c", "c", "c"]
+    })
+
+
+class TestDuplicateTreatment:
+    """
+    Test suite for the DuplicateTreatment.
+    """
+
+    def test_matches_drop_duplicates(self, duplicate_data) -> None:
+        """
+        Should drop the same rows as pandas for every subset and keep
+        option, and count them.
+        :return: None
+        """
+
+        for subset in (None, ["id"], ["id", "cat"]):
+            for keep in ("first", "last", False):
+                treatment = DuplicateTreatment(subset=subset, keep=keep)
+                expected = duplicate_data.drop_duplicates(
+                    subset=subset,
+                    keep=keep
+                )
+
+                result = treatment.treat_data(duplicate_data)
+
+                pd.testing.assert_frame_equal(result, expected)
+                assert treatment.duplicate_count == \
+                    len(duplicate_data) - len(expected)
+
+    def test_no_duplicates_returns_data_unchanged(self) -> None:
+        """
+        Should return the data itself when it has no duplicates.
+        :return: None
+        """
+
+        data = pd.DataFrame({"a": [1, 2, 3]})
+        treatment = DuplicateTreatment()
+
+        assert treatment.treat_data(data) is data
+        assert treatment.duplicate_count == 0
+
+    def test_chunks_use_seen_rows(self, duplicate_data) -> None:
+        """
+        Should drop the rows of a chunk that appeared in an earlier chunk,
+        even when the dtypes of the chunks differ.
+        :return: None
+        """
+
+        treatment = DuplicateTreatment()
+        first = duplicate_data.iloc[:4]
+        second = duplicate_data.iloc[1:].astype({"id": np.float64})
+
+        results = [treatment.treat_chunk(first)]
+        results.append(treatment.treat_chunk(second))
+
+        assert results[0].index.tolist() == [0, 2, 3]
+        assert results[1].index.tolist() == [4, 6]
+        assert treatment.duplicate_count == 4
+
+        with pytest.raises(ValueError):
+            DuplicateTreatment(keep="last").treat_chunk(first)
+
+    def test_chunks_with_differing_dtypes(self) -> None:
+        """
+        Should find duplicates across chunks whose numeric columns were
+        parsed into different dtypes, but not equate strings with numbers.
+        :return: None
+        """
+
+        treatment = DuplicateTreatment()
+        first = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        second = pd.DataFrame({
+            "a": [1.0, 2.5, 2.0, None],
+            "b": ["x", "x", "y", None]
+        })
+        third = pd.DataFrame({"a": ["1", "2.0"], "b": ["x", "y"]})
+
+        treatment.treat_chunk(first)
+        result = treatment.treat_chunk(second)
+
+        assert result.index.tolist() == [1, 3]
+        assert treatment.duplicate_count == 2
+        assert len(treatment.treat_chunk(third)) == 2
+
+    @pytest.mark.parametrize("values", [
+        ["01234", "1234"],
+        ["1e3", "1000"],
+        [2**53, 2**53 + 1],
+        [2**63 - 1, 2**63 - 2]
+    ])
+    def test_chunks_keep_distinct_values(self, values) -> None:
+        """
+        Should not take distinct values for duplicates, e.g. strings
+        differing only in how they format a number, or integers a float
+        cannot tell apart.
+        :return: None
+        """
+
+        treatment = DuplicateTreatment()
+        data = pd.DataFrame({"a": values})
+
+        assert len(treatment.treat_chunk(data.iloc[:1])) == 1
+        assert len(treatment.treat_chunk(data.iloc[1:])) == 1
+        assert treatment.duplicate_count == 0
+
+    def test_hash_set(self) -> None:
+        """
+        Should find every hash added over many runs.
+        :return: None
+        """
+
+        hashes = np.random.default_rng(0).integers(
+            0, 2**63, 1_000, dtype=np.uint64)
+        seen = HashSet()
+
+        for start in range(0, 1_000, 70):
+            seen.add(hashes[start:start + 70])
+
+        assert seen.contains(hashes).all()
+        assert not seen.contains(hashes + np.uint64(1)).any()
+        assert len(seen) == 1_000
+
+
+class TestGarbageValueTreatment:
+    """
+    Test suite for the GarbageValueTreatment.
+    """
+
+    def test_replaces_garbage_in_text_columns(self) -> None:
+        """
+        Should replace the garbage tokens, ignoring whitespace and case, in
+        object, string and categorical columns only.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "text": ["x", " n/a ", "NULL", "y"],
+            "string": pd.array(["k", "", "l", "k"], dtype="string"),
+            "category": pd.Categorical(["p", "--", "q", "p"]),
+            "number": [1, 2, 3, 4]
+        })
+
+        result = GarbageValueTreatment().treat_data(data)
+
+        assert result["text"].isna().tolist() == [False, True, True, False]
+        assert result["string"].isna().tolist() == [
+            False, True, False, False]
+        assert list(result["category"].cat.categories) == ["p", "q"]
+        assert result["category"].isna().sum() == 1
+        assert data["text"].tolist() == ["x", " n/a ", "NULL", "y"]
+
+    def test_drops_constant_and_empty_columns(self) -> None:
+        """
+        Should drop columns that are empty or constant, including those
+        only holding a constant and garbage.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "constant": [5] * 6000 + [np.nan],
+            "empty": [np.nan] * 6001,
+            "garbage": ["a", "N/A"] * 3000 + ["a"],
+            "late_change": [1] * 6000 + [2],
+            "text": ["a", "b"] * 3000 + ["a"]
+        })
+
+        result = GarbageValueTreatment().treat_data(data)
+
+        assert list(result.columns) == ["late_change", "text"]
+
+    def test_configurable_tokens(self) -> None:
+        """
+        Should only match the configured tokens, exactly if requested.
+        :return: None
+        """
+
+        data = pd.DataFrame({"a": ["?", "N/A", "x", " ? "]})
+
+        result = GarbageValueTreatment(
+            garbage_tokens=("?",),
+            strip=False
+        ).treat_data(data)
+
+        assert result["a"].isna().tolist() == [True, False, False, False]
+
+    def test_clean_data_returned_unchanged(self) -> None:
+        """
+        Should return the data itself when there is nothing to treat.
+        :return: None
+        """
+
+        data = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+        assert GarbageValueTreatment().treat_data(data) is data
@@ -0,0 +1,147 @@
+"""Test suite for the data type classifier."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.extractor.classifier import data_type_classifier
+from src.services.extractor.classifier.data_type_classifier import (
+    DataType,
+    TabularDataTypeClassifier)
+from src.services.extractor.profiler.data_profiler import DataProfiler
+
+
+@pytest.fixture
+def typed_data():
+    """Returns one column of every data type."""
+    rng = np.random.default_rng(0)
+    num_rows = 200
+    return pd.DataFrame({
+        "customer_id": rng.permutation(num_rows),
+        "uuid": [
+            f"123e4567-e89b-12d3-a456-{i:012d}" for i in range(num_rows)],
+        "email": [f"user{i}@example.com" for i in range(num_rows)],
+        "first_name": rng.choice(["Ann", "Bob", "Cy"], num_rows),
+        "price": rng.normal(10, 2, num_rows),
+        "quantity": rng.integers(0, 10, num_rows),
+        "is_active": rng.choice([True, False], num_rows),
+        "answer": rng.choice(["Yes", "No"], num_rows),
+        "signup": pd.date_range("2024-01-01", periods=num_rows)
+        .strftime("%d/%m/%Y"),
+        "created": pd.date_range("2024-01-01", periods=num_rows),
+        "homepage": [f"https://example.com/{i}" for i in range(num_rows)],
+        "location": [f"{i % 80}.5, -{i % 170}.25" for i in range(num_rows)],
+        "tags": [[i, i + 1] for i in range(num_rows)],
+        "size": rng.choice(["small", "medium", "large"], num_rows),
+        "colour": rng.choice(["red", "green", "blue"], num_rows),
+        "review": [
+            f"The product number {i} arrived on time and works well"
+            for i in range(num_rows)
+        ],
+        "empty": [None] * num_rows
+    })
+
+
+class TestTabularDataTypeClassifier:
+    """
+    Test suite for the TabularDataTypeClassifier.
+    """
+
+    def test_classifies_every_type(self, typed_data) -> None:
+        """
+        Should classify each column into its data type and subtype.
+        :return: None
+        """
+
+        result = TabularDataTypeClassifier().classify(typed_data)
+
+        assert {col: c.data_type for col, c in result.items()} == {
+            "customer_id": DataType.ID,
+            "uuid": DataType.ID,
+            "email": DataType.PII,
+            "first_name": DataType.PII,
+            "price": DataType.NUMERICAL,
+            "quantity": DataType.NUMERICAL,
+            "is_active": DataType.BOOLEAN,
+            "answer": DataType.BOOLEAN,
+            "signup": DataType.DATETIME,
+            "created": DataType.DATETIME,
+            "homepage": DataType.URI,
+            "location": DataType.GEOSPATIAL,
+            "tags": DataType.ARRAY,
+            "size": DataType.CATEGORICAL,
+            "colour": DataType.CATEGORICAL,
+            "review": DataType.TEXT,
+            "empty": DataType.OTHER
+        }
+        assert result["price"].subtype == "continuous"
+        assert result["quantity"].subtype == "discrete"
+        assert result["size"].subtype == "ordinal"
+        assert result["colour"].subtype == "nominal"
+        assert result["empty"].confidence == 0.0
+
+    def test_confidence_is_share_of_matches(self) -> None:
+        """
+        Should report the share of values matching the pattern as the
+        confidence.
+        :return: None
+        """
+
+        emails = [f"user{i}@example.com" for i in range(95)]
+        data = pd.DataFrame({"contact": emails + ["unknown"] * 5})
+
+        (result,) = TabularDataTypeClassifier().classify(data).values()
+
+        assert result.data_type == DataType.PII
+        assert result.confidence == pytest.approx(0.95)
+
+    def test_uses_known_cardinality(self) -> None:
+        """
+        Should use the distinct counts over all rows instead of the sample.
+        :return: None
+        """
+
+        data = pd.DataFrame({"code": [f"C{i}" for i in range(100)]})
+
+        unique = TabularDataTypeClassifier().classify(data)["code"]
+        repeated = TabularDataTypeClassifier().classify(
+            data,
+            cardinality=pd.Series([100]),
+            num_rows=10_000
+        )["code"]
+
+        assert unique.data_type == DataType.ID
+        assert repeated.data_type == DataType.CATEGORICAL
+
+    def test_rejects_non_dates_without_parsing(self, monkeypatch) -> None:
+        """
+        Should not try to parse columns whose values do not look like dates.
+        :return: None
+        """
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Unexpected date parsing")
+
+        monkeypatch.setattr(data_type_classifier.pd, "to_datetime", fail)
+
+        data = pd.DataFrame({"word": ["alpha", "beta", "gamma"] * 100})
+
+        result = TabularDataTypeClassifier().classify(data)
+
+        assert result["word"].data_type == DataType.CATEGORICAL
+
+    def test_profile_contains_data_types(self, typed_data) -> None:
+        """
+        Should store the data type of every column in its profile.
+        :return: None
+        """
+
+        profile = DataProfiler(typed_data.drop(columns="tags")) \
+            .generate_profile()
+
+        email = next(
+            cp for cp in profile.column_profiles if cp.column_name == "email")
+
+        assert email.data_type == DataType.PII
+        assert email.type_confidence == 1.0
+        assert email.to_dict()["data_type"] == DataType.PII
@@ -0,0 +1,193 @@
+"""Test suite for the dataset store."""
+
+import io
+import os
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from src.services.data_uploader import upload_handler
+from src.services.data_uploader.upload_handler import _cache_options
+from src.services.dataset_store.dataset_cache import (
+    FeatherDatasetCache,
+    cache_key)
+from src.services.dataset_store.dataset_store import InMemoryDatasetStore
+
+
+class TestInMemoryDatasetStore:
+    """
+    Test suite for the in-memory dataset store.
+    """
+
+    def test_put_and_get(self, get_sample_data) -> None:
+        """
+        Should return the stored dataset for the generated ID.
+        :return: None
+        """
+
+        store = InMemoryDatasetStore()
+        df = pd.DataFrame(get_sample_data)
+
+        entry = store.put(df, "file.csv")
+
+        assert store.get(entry.dataset_id).data is df
+        assert store.get(entry.dataset_id).filename == "file.csv"
+        assert store.get("unknown") is None
+
+    def test_evicts_least_recently_used(self, get_sample_data) -> None:
+        """
+        Should evict the least recently used dataset once full.
+        :return: None
+        """
+
+        store = InMemoryDatasetStore(max_entries=2)
+        df = pd.DataFrame(get_sample_data)
+
+        first = store.put(df, "first.csv")
+        second = store.put(df, "second.csv")
+        store.get(first.dataset_id)
+        third = store.put(df, "third.csv")
+
+        assert store.get(second.dataset_id) is None
+        assert store.get(first.dataset_id) is not None
+        assert store.get(third.dataset_id) is not None
+
+    def test_expires_datasets(self, get_sample_data) -> None:
+        """
+        Should no longer return a dataset once its TTL has passed.
+        :return: None
+        """
+
+        store = InMemoryDatasetStore(ttl_seconds=10)
+        entry = store.put(pd.DataFrame(get_sample_data), "file.csv")
+
+        with patch(
+                "src.services.dataset_store.dataset_store.time.monotonic",
+                return_value=entry.created_at + 11
+        ):
+            assert store.get(entry.dataset_id) is None
+
+        assert len(store) == 0
+
+
+class TestFeatherDatasetCache:
+    """
+    Test suite for the on-disk dataset cache.
+    """
+
+    def test_round_trip_keeps_dtypes(self, tmp_path) -> None:
+        """
+        Should read back the cached DataFrame with the same dtypes.
+        :return: None
+        """
+
+        data = pd.DataFrame({
+            "small": np.array([1, 2, 3], dtype=np.int8),
+            "color": pd.Categorical(["red", "blue", "red"]),
+            "text": pd.array(["a", None, "c"], dtype="string[pyarrow]"),
+            "day": pd.date_range("2024-01-01", periods=3)
+        })
+
+        cache = FeatherDatasetCache(directory=str(tmp_path))
+
+        assert cache.get("key") is None
+        assert cache.put("key", data)
+
+        pd.testing.assert_frame_equal(cache.get("key"), data)
+
+    def test_expired_entries_are_dropped(self, tmp_path) -> None:
+        """
+        Should treat entries older than the TTL as misses and remove them.
+        :return: None
+        """
+
+        cache = FeatherDatasetCache(directory=str(tmp_path), ttl_seconds=60)
+        cache.put("key", pd.DataFrame({"a": [1]}))
+
+        path = tmp_path / "key.feather"
+        old = time.time() - 120
+        os.utime(path, (old, old))
+
+        assert cache.get("key") is None
+        assert not path.exists()
+
+    def test_sweep_removes_expired_entries(self, tmp_path) -> None:
+        """
+        Should remove the expired entries without them being read, and keep
+        the others.
+        :return: None
+        """
+
+        cache = FeatherDatasetCache(directory=str(tmp_path), ttl_seconds=60)
+        cache.put("old", pd.DataFrame({"a": [1]}))
+        cache.put("new", pd.DataFrame({"a": [2]}))
+
+        old = time.time() - 120
+        os.utime(tmp_path / "old.feather", (old, old))
+
+        cache.sweep()
+
+        assert not (tmp_path / "old.feather").exists()
+        assert (tmp_path / "new.feather").exists()
+
+        FeatherDatasetCache(directory=str(tmp_path / "missing")).sweep()
+
+    def test_evicts_least_recently_used(self, tmp_path) -> None:
+        """
+        Should evict the least recently used entries once the cache grows
+        past its size limit.
+        :return: None
+        """
+
+        data = pd.DataFrame({"a": np.arange(1000)})
+        cache = FeatherDatasetCache(directory=str(tmp_path))
+        cache.put("first", data)
+        cache.put("second", data)
+
+        # Make "second" the least recently used entry
+        for key, accessed in (("first", 200), ("second", 100)):
+            path = tmp_path / f"{key}.feather"
+            os.utime(path, (time.time() - accessed, path.stat().st_mtime))
+
+        cache.get("first")
+
+        cache.max_bytes = 2 * (tmp_path / "first.feather").stat().st_size
+        cache.put("third", data)
+
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+
+    def test_key_depends_on_content_and_options(self) -> None:
+        """
+        Should derive different keys for different bytes or options and
+        rewind the stream.
+        :return: None
+        """
+
+        stream = io.BytesIO(b"a,b\n1,2\n")
+        key = cache_key(stream, {"extension": ".csv"})
+
+        assert stream.tell() == 0
+        assert key == cache_key(stream, {"extension": ".csv"})
+        assert key != cache_key(stream, {"extension": ".xlsx"})
+        assert key != cache_key(io.BytesIO(b"a,b\n1,3\n"),
+                                {"extension": ".csv"})
+
+    def test_key_depends_on_loader_settings(self) -> None:
+        """
+        Should not reuse an upload cached with other loader settings of the
+        server.
+        :return: None
+        """
+
+        options = _cache_options("file.csv", {})
+
+        with patch.object(upload_handler, "OPTIMIZE_DTYPES_ON_LOAD", False):
+            changed = _cache_options("file.csv", {})
+
+        assert options["extension"] == ".csv"
+        assert cache_key(io.BytesIO(b"a\n1\n"), options) != \
+            cache_key(io.BytesIO(b"a\n1\n"), changed)
@@ -0,0 +1,92 @@
+"""Test suite for the dataset previews."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from src.services.preview import build_preview
+from src.utils.custom_responses import RawJSON, SuccessResponse
+
+
+@pytest.fixture
+def preview_data():
+    """Returns a dataset with a date column."""
+    return pd.DataFrame({
+        "id": range(50),
+        "name": [f"item {i}" for i in range(50)],
+        "created": pd.date_range("2024-01-01", periods=50)
+    })
+
+
+class TestBuildPreview:
+    """
+    Test suite for build_preview.
+    """
+
+    def test_pages_and_projects(self, preview_data) -> None:
+        """
+        Should return only the requested page of the requested columns.
+        :return: None
+        """
+
+        preview = build_preview(
+            preview_data,
+            offset=20,
+            limit=5,
+            columns=["name", "id"],
+            orient="records"
+        )
+
+        assert preview["total_rows"] == 50
+        assert preview["columns"] == ["name", "id"]
+        assert json.loads(preview["rows"].encoded) == [
+            {"name": f"item {i}", "id": i} for i in range(20, 25)
+        ]
+
+    def test_orients(self, preview_data) -> None:
+        """
+        Should lay out the rows in the requested orient with ISO dates.
+        :return: None
+        """
+
+        preview = build_preview(preview_data, limit=2, orient="split")
+        split = json.loads(preview["rows"].encoded)
+
+        assert split["columns"] == ["id", "name", "created"]
+        assert split["data"][0][2].startswith("2024-01-01T00:00:00")
+
+    def test_rejects_invalid_requests(self, preview_data) -> None:
+        """
+        Should reject unknown columns and unsupported orients.
+        :return: None
+        """
+
+        with pytest.raises(ValueError, match="Unknown columns: price"):
+            build_preview(preview_data, columns=["price"])
+
+        with pytest.raises(ValueError, match="Unsupported orient"):
+            build_preview(preview_data, orient="table")
+
+
+class TestRawJSONResponse:
+    """
+    Test suite for embedding RawJSON in responses.
+    """
+
+    def test_embeds_raw_json_once(self, preview_data) -> None:
+        """
+        Should embed the encoded rows as JSON objects, not as strings.
+        :return: None
+        """
+
+        rows = build_preview(preview_data, limit=3)["rows"]
+
+        response = SuccessResponse(data={
+            "preview": rows,
+            "pages": [RawJSON("[1,2]"), "text"]
+        })
+        body = json.loads(response.body)
+
+        assert body["data"]["preview"] == json.loads(rows.encoded)
+        assert body["data"]["pages"] == [[1, 2], "text"]
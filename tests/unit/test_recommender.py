@@ -0,0 +1,124 @@
+"""Test suite for the graph recommender."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.extractor.profiler.data_profiler import DataProfiler
+from src.services.recommender import (
+    RULES,
+    GraphRule,
+    build_rule_index,
+    recommend_graphs)
+
+
+@pytest.fixture
+def sales_profile():
+    """Returns the profile of a dataset with every graph type."""
+    rng = np.random.default_rng(0)
+    num_rows = 300
+    units = rng.integers(1, 100, num_rows)
+    return DataProfiler(pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=num_rows),
+        "region": rng.choice(["north", "south", "east"], num_rows),
+        "units": units,
+        "revenue": units * 9.5 + rng.normal(0, 5, num_rows),
+        "rating": rng.normal(3, 1, num_rows)
+    })).generate_profile()
+
+
+class TestRecommendGraphs:
+    """
+    Test suite for recommend_graphs.
+    """
+
+    def test_ranks_recommendations(self, sales_profile) -> None:
+        """
+        Should return scored recommendations, best first, with the most
+        correlated pair as the first scatter plot.
+        :return: None
+        """
+
+        recommendations = recommend_graphs(sales_profile, limit=50)
+        scores = [r["score"] for r in recommendations]
+        graphs = {r["graph"] for r in recommendations}
+
+        assert scores == sorted(scores, reverse=True)
+        assert {"Bar Chart", "Pie Chart", "Line Graph", "Area Chart",
+                "Histogram", "Box Plot", "Scatter Plot", "Bubble Chart",
+                "Heatmap"} <= graphs
+
+        scatter = next(
+            r for r in recommendations if r["graph"] == "Scatter Plot")
+        assert set(scatter["columns"].values()) == {"units", "revenue"}
+
+    def test_covers_all_column_combinations(self, sales_profile) -> None:
+        """
+        Should recommend the graph for every suitable combination of
+        columns.
+        :return: None
+        """
+
+        recommendations = recommend_graphs(sales_profile, limit=100)
+
+        line_graphs = [
+            r["columns"] for r in recommendations
+            if r["graph"] == "Line Graph"
+        ]
+        scatter_plots = [
+            r for r in recommendations if r["graph"] == "Scatter Plot"]
+
+        assert sorted(c["y"] for c in line_graphs) == [
+            "rating", "revenue", "units"]
+        assert len(scatter_plots) == 3
+
+    def test_limit_and_cardinality(self, sales_profile) -> None:
+        """
+        Should return at most `limit` recommendations and skip categorical
+        columns with too many categories.
+        :return: None
+        """
+
+        pie = GraphRule(
+            graph="Pie Chart",
+            purpose="composition",
+            reason="",
+            roles=(("labels", "categorical"), ("values", "numerical")),
+            max_cardinality=2
+        )
+
+        assert len(recommend_graphs(sales_profile, limit=2)) == 2
+        assert recommend_graphs(
+            sales_profile,
+            rule_index=build_rule_index([pie])
+        )[0]["graph"] == "Table"
+
+    def test_only_evaluates_matching_signatures(self) -> None:
+        """
+        Should only evaluate the rules whose column types are present, and
+        fall back to a table if no graph fits.
+        :return: None
+        """
+
+        numeric = DataProfiler(pd.DataFrame({
+            "a": [1.5, 2.5, 3.5, 4.0]
+        })).generate_profile()
+        text = DataProfiler(pd.DataFrame({
+            "id": ["a1", "b2", "c3", "d4"]
+        })).generate_profile()
+
+        assert [r["graph"] for r in recommend_graphs(numeric)] == [
+            "Histogram"]
+        assert recommend_graphs(text)[0]["graph"] == "Table"
+
+    def test_rule_index_groups_by_signature(self) -> None:
+        """
+        Should index every rule by the sorted types of its columns.
+        :return: None
+        """
+
+        index = build_rule_index(RULES)
+
+        assert sum(len(rules) for rules in index.values()) == len(RULES)
+        assert {r.graph for r in index[("categorical", "numerical")]} == {
+            "Bar Chart", "Pie Chart", "Box Plot"}
@@ -0,0 +1,142 @@
+"""Test suite for the treatment pipeline."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.data_preprocessor.column_statistics import (
+    ColumnStatistics)
+from src.services.data_preprocessor.data_treatment import (
+    DuplicateTreatment,
+    GarbageValueTreatment,
+    MissingValueTreatment,
+    OutlierTreatment)
+from src.services.data_preprocessor.treatment_pipeline import (
+    TreatmentPipeline)
+
+
+@pytest.fixture
+def raw_data():
+    """Returns data that every default treatment changes."""
+    return pd.DataFrame({
+        "num": [1.0, 2.0, np.nan, 2.0, 3.0, 2.0, 500.0, 1.0],
+        "cat": ["a", "b", "b", "b", None, "b", "a", "a"],
+        "const": [7] * 8,
+        "text": ["x", "y", "N/A", "y", "z", "y", "x", "x"]
+    })
+
+
+def default_treatments():
+    """Returns the treatments used by the preprocess endpoint."""
+    return [
+        MissingValueTreatment(),
+        OutlierTreatment(),
+        DuplicateTreatment(),
+        GarbageValueTreatment()
+    ]
+
+
+class TestTreatmentPipeline:
+    """
+    Test suite for the TreatmentPipeline.
+    """
+
+    def test_plan_fuses_consecutive_filters(self) -> None:
+        """
+        Should combine the outlier and duplicate filters into one stage.
+        :return: None
+        """
+
+        stages = TreatmentPipeline.plan(default_treatments())
+
+        assert [len(stage) for stage in stages] == [1, 2, 1]
+        assert isinstance(stages[1][1], DuplicateTreatment)
+
+    def test_plan_keeps_row_dependent_filters_apart(self) -> None:
+        """
+        Should start a new stage for a filter that depends on the remaining
+        rows.
+        :return: None
+        """
+
+        stages = TreatmentPipeline.plan(
+            [DuplicateTreatment(), OutlierTreatment()]
+        )
+
+        assert [len(stage) for stage in stages] == [1, 1]
+
+    def test_run_matches_sequential_treatments(self, raw_data) -> None:
+        """
+        Should produce the same result as applying the treatments one after
+        another, without modifying the input.
+        :return: None
+        """
+
+        original = raw_data.copy()
+
+        expected = raw_data.copy()
+        for treatment in default_treatments():
+            expected = treatment.treat_data(expected)
+
+        result = TreatmentPipeline(default_treatments()).run(raw_data)
+
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(raw_data, original)
+
+    @pytest.mark.parametrize("treatments", [
+        [MissingValueTreatment("median", "ffill")],
+        [MissingValueTreatment("constant", "constant", fill_value="z")],
+        [OutlierTreatment(action="clip"), GarbageValueTreatment()]
+    ])
+    def test_input_untouched_without_copy_on_write(self, raw_data,
+                                                   treatments) -> None:
+        """
+        Should leave the input and the pandas options unchanged when
+        copy-on-write is disabled.
+        :return: None
+        """
+
+        raw_data["cat"] = raw_data["cat"].astype("category")
+        original = raw_data.copy()
+
+        with pd.option_context("mode.copy_on_write", False):
+            TreatmentPipeline(treatments).run(raw_data)
+
+            assert not pd.get_option("mode.copy_on_write")
+
+        pd.testing.assert_frame_equal(raw_data, original)
+
+
+class TestColumnStatistics:
+    """
+    Test suite for the shared ColumnStatistics.
+    """
+
+    def test_update_recomputes_changed_columns(self) -> None:
+        """
+        Should only recompute the statistics of the changed columns.
+        :return: None
+        """
+
+        data = pd.DataFrame({"a": [1, None, 3], "b": [None, None, 1]})
+        stats = ColumnStatistics(data)
+
+        assert stats.null_counts().tolist() == [1, 2]
+
+        filled = data.fillna({"b": 0})
+        stats.update(filled, changed_columns=["b"])
+
+        assert stats.null_counts().tolist() == [1, 0]
+
+    def test_quantiles_of_numeric_columns(self) -> None:
+        """
+        Should compute the quantiles of the numeric columns only.
+        :return: None
+        """
+
+        data = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+        quantiles = ColumnStatistics(data).quantiles((0.5,))
+
+        assert list(quantiles.columns) == ["a"]
+        assert quantiles.iloc[0, 0] == 2
@@ -0,0 +1,85 @@
+"""Test suite for the bounded worker pools."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.utils import api_exceptions as ae
+from src.utils.worker_pool import WorkerPool
+
+
+class TestWorkerPool:
+    """
+    Test suite for the WorkerPool.
+    """
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_off_the_event_loop(self) -> None:
+        """
+        Should run the function in a worker thread and return its result.
+        :return: None
+        """
+
+        pool = WorkerPool("test", max_workers=1, max_queue_size=0)
+
+        result = await pool.run(threading.current_thread)
+
+        assert result is not threading.current_thread()
+        assert pool.pending == 0
+
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_rejects_when_full(self) -> None:
+        """
+        Should raise a ServiceUnavailableException with a Retry-After header
+        once all workers and queue slots are taken.
+        :return: None
+        """
+
+        pool = WorkerPool(
+            "test",
+            max_workers=1,
+            max_queue_size=1,
+            retry_after=7
+        )
+        release = threading.Event()
+
+        running = [
+            asyncio.ensure_future(pool.run(release.wait))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ae.ServiceUnavailableException) as exc:
+            await pool.run(release.wait)
+
+        assert exc.value.status_code == 503
+        assert exc.value.headers == {"Retry-After": "7"}
+
+        release.set()
+        await asyncio.gather(*running)
+
+        assert pool.pending == 0
+
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_exceptions(self) -> None:
+        """
+        Should raise the exception of the function and free its slot.
+        :return: None
+        """
+
+        def fail():
+            raise ValueError("Failed")
+
+        pool = WorkerPool("test", max_workers=1, max_queue_size=0)
+
+        with pytest.raises(ValueError):
+            await pool.run(fail)
+
+        assert pool.pending == 0
+
+        pool.shutdown()